@@ -1,5 +1,6 @@
 import pygame
 import math
+import random
 from pantallas.pantalla_registro import PantallaRegistro
 from pantallas.pantalla_reglas import PantallaReglas
 from pantallas.pantalla_juego_cesar import PantallaJuegoCesar
@@ -8,10 +9,21 @@ from pantallas.pantalla_juego_2 import PantallaJuego2
 from pantallas.pantalla_juego_parejas import PantallaJuegoParejas
 from pantallas.pantalla_juego_simon import PantallaJuegoSimon
 from pantallas.pantalla_records import PantallaRecords
-from core.gestor_registros import guardar_registro
-from core.ui_helpers import draw_persistent_hud, draw_game_over_modal
+from core.gestor_registros import guardar_registro, get_records
+from core.ui_helpers import draw_persistent_hud, draw_game_over_modal, draw_resume_modal
 from core.pointer import load_pointer, draw_pointer
-from core.constants import DEFAULT_LIVES, POINTER_PATH
+from core.constants import DEBUG_STATS, DEFAULT_LIVES, POINTER_PATH, RUN_SNAPSHOT_REFRESH_MS
+from core.assets import get_assets
+from core.avatars import avatar_id, get_avatars
+from core.fonts import get_fonts
+from core.text_cache import get_text_cache
+from core.dirty import get_dirty
+from core.pacing import FramePacer
+from core.scheduler import get_scheduler
+from core.scenes import ScenePreloader
+from core.events import EventRouter
+from core.postprocess import get_postprocess
+from core.snapshot import SnapshotStore
 
 
 RULES_TEXTS = [
@@ -21,6 +33,14 @@ RULES_TEXTS = [
     "Juego 4 - Patrón (Simon-lite):\nMemoriza la secuencia mostrada. Cada ronda la secuencia crecerá. Hay una espera aproximada de 3 segundos entre rondas al mostrar el siguiente patrón.\nSe requieren 8 rondas correctas para habilitar el botón continuar."
 ]
 
+# minigame index -> (screen class, title)
+GAME_SCREENS = {
+    1: (PantallaJuegoCesar, 'Juego César'),
+    2: (PantallaJuego2, 'Juego 2'),
+    3: (PantallaJuegoParejas, 'Juego Parejas'),
+    4: (PantallaJuegoSimon, 'Juego Patrón'),
+}
+
 
 class AppController:
     def __init__(self, pantalla, estado, fps=60):
@@ -28,9 +48,34 @@ class AppController:
         self.estado = estado
         self.reloj = pygame.time.Clock()
         self.fps = fps
+        # screen timers (alerts, countdowns, Simon playback) fire from here once per frame
+        self.scheduler = get_scheduler()
+        # full rate while something animates, event-driven idle otherwise (woken for due timers)
+        self.pacer = FramePacer(self.reloj, fps, scheduler=self.scheduler)
+        # the next step of the sequence is built in the background while the current one plays
+        self.scenes = ScenePreloader()
+        # (kind, idx) -> screen instance, reused across runs
+        self._pool = {}
+        # per-frame event preparation: one MOUSEMOTION per frame, window events to handlers
+        self.router = EventRouter()
+        self.router.on(pygame.VIDEORESIZE, self._on_resize)
+        self.router.on((pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, getattr(pygame, 'WINDOWEXPOSED', -1),
+                        getattr(pygame, 'WINDOWRESTORED', -1), getattr(pygame, 'WINDOWSHOWN', -1)),
+                       lambda evento: get_dirty().mark_full())
+        # registro screen (built in run()) and the event handler of each mode
+        self.inicio = None
+        self._mode_handlers = {
+            'inicio': self._on_inicio_event,
+            'flow': self._on_flow_event,
+            'records': self._on_records_event,
+        }
 
         # load pointer if available (use constants)
-        self.puntero_img = load_pointer(POINTER_PATH)
+        self.puntero = load_pointer(POINTER_PATH)
+        # resolve every font the screens use once, before the first frame
+        get_fonts().warm()
+        # avatar thumbnails at the usual sizes (from the on-disk cache after the first run)
+        get_avatars().warm()
 
         # sequence setup
         self.seq = []
@@ -45,27 +90,116 @@ class AppController:
         self.modo = 'inicio'
         self.game_over_active = False
         self.game_over_until = None
+        # dirty-rect bookkeeping: a new screen or brightness/contrast forces a full flip
+        self._last_drawn_screen = None
+        self._last_adjust = None
+        self._hover_active = False
+        # screen whose auto-advance deadline is already scheduled
+        self._advance_armed = None
 
         # ensure guard flag
         try:
             self.estado.record_saved = False
         except Exception:
             setattr(self.estado, 'record_saved', False)
+        # (rank, total) of the last saved run, shown on the records screen
+        self.estado.ultimo_puesto = None
+
+        # crash recovery: the run in progress is snapshotted on every step/lives change;
+        # a snapshot left by a previous process is offered for resume at startup
+        self.snapshots = SnapshotStore()
+        self.resume_offer = self.snapshots.load()
+        self._resume_buttons = None
+        self._snap_key = None
+        self.puzzle_seed = 0
+
+    def _screen_class(self, kind, idx):
+        if kind == 'rules':
+            return PantallaReglas
+        return GAME_SCREENS.get(idx, (PantallaJuegoPlaceholder, None))[0]
+
+    def _build_screen(self, kind, idx, seed=None):
+        """Pantalla lista para jugar; devuelve (pantalla, (seed, estado de random)) o (pantalla, None).
 
-    def _instantiate_screen_for(self, kind, idx):
+        Cada (kind, idx) se construye una vez y se reutiliza en las partidas
+        siguientes con `reset(seed)`: fuentes, imágenes y capa estática no se
+        vuelven a cargar.
+        """
+        pooled = self._pool.get((kind, idx))
         if kind == 'rules':
-            return PantallaReglas(self.pantalla, idx, f'Reglas Juego {idx}', RULES_TEXTS[idx-1])
+            if pooled is not None:
+                self._recycle(pooled, None)
+                return pooled, None
+            pantalla = PantallaReglas(self.pantalla, idx, f'Reglas Juego {idx}', RULES_TEXTS[idx-1])
+            self._pool[(kind, idx)] = pantalla
+            return pantalla, None
+        # puzzles draw from `random`: a known seed lets a resumed run rebuild the same one
+        seed = random.getrandbits(63) if seed is None else int(seed)
+        if pooled is not None and hasattr(pooled, 'reset'):
+            pantalla = pooled
+            self._recycle(pantalla, seed)
         else:
-            if idx == 1:
-                return PantallaJuegoCesar(self.pantalla, idx, 'Juego César')
-            elif idx == 2:
-                return PantallaJuego2(self.pantalla, idx, 'Juego 2')
-            elif idx == 3:
-                return PantallaJuegoParejas(self.pantalla, idx, 'Juego Parejas')
-            elif idx == 4:
-                return PantallaJuegoSimon(self.pantalla, idx, 'Juego Patrón')
-            else:
-                return PantallaJuegoPlaceholder(self.pantalla, idx, f'Juego {idx}')
+            cls, titulo = GAME_SCREENS.get(idx, (PantallaJuegoPlaceholder, f'Juego {idx}'))
+            random.seed(seed)
+            pantalla = cls(self.pantalla, idx, titulo)
+            self._pool[(kind, idx)] = pantalla
+        return pantalla, (seed, random.getstate())
+
+    def _recycle(self, pantalla, seed):
+        # timers of the previous run would fire into the new one
+        self.scheduler.cancel_owner(pantalla)
+        # end-of-game bookkeeping lives on the screen: back to "never finished"
+        for attr in ('auto_advance_until', 'saved_final'):
+            vars(pantalla).pop(attr, None)
+        pantalla.reset(seed)
+
+    def _prebuild(self, kind, idx):
+        # runs while another screen is playing: leave its random stream as it was
+        state = random.getstate()
+        try:
+            return self._build_screen(kind, idx)
+        finally:
+            random.setstate(state)
+
+    def _preload(self, seq_idx):
+        """Empieza a preparar `seq[seq_idx]` en segundo plano (ver core/scenes.py)."""
+        if not 0 <= seq_idx < len(self.seq):
+            self.scenes.cancel()
+            return
+        kind, idx = self.seq[seq_idx]
+        assets = getattr(self._screen_class(kind, idx), 'preload_assets', None)
+        try:
+            assets = assets(idx) if assets is not None else ()
+        except Exception:
+            assets = ()
+        self.scenes.request((kind, idx), assets, lambda: self._prebuild(kind, idx))
+
+    def _instantiate_screen_for(self, kind, idx, seed=None):
+        # preloaded screen if ready; a resumed puzzle is always rebuilt from its seed
+        built = self.scenes.take((kind, idx) if seed is None else None)
+        if built is None:
+            built = self._build_screen(kind, idx, seed)
+        pantalla, puzzle = built
+        # a pooled screen may be the one armed in a previous run
+        self._advance_armed = None
+        if puzzle is not None:
+            # continue from the stream the puzzle was built with, as a resumed run does
+            self.puzzle_seed, state = puzzle
+            random.setstate(state)
+            # split times: the cronómetro now counts towards this minigame
+            try:
+                self.estado.marcar_paso(idx)
+            except Exception:
+                pass
+        # timers/animations start when the screen is shown, not when it was built
+        try:
+            on_show = getattr(pantalla, 'on_show', None)
+            if on_show is not None:
+                on_show()
+        except Exception:
+            pass
+        self._preload(self.seq_idx + 1)
+        return pantalla
 
     def _draw_persistent_hud_fallback(self):
         try:
@@ -77,134 +211,337 @@ class AppController:
                 time_s = f"{mins:02d}:{secs:02d}"
                 titulo_act = getattr(self.pantalla_actual, 'titulo', '')
                 overlay_text = f"{nombre} — {titulo_act} — {time_s}"
-                font = pygame.font.SysFont('Verdana', 18, bold=True)
-                surf = font.render(overlay_text, True, (240,240,240))
+                font = get_fonts().get(18, bold=True)
+                surf = get_text_cache().render(font, overlay_text, (240,240,240))
                 w_s, h_s = surf.get_size()
                 w_win, h_win = self.pantalla.get_size()
                 x = w_win - w_s - 20
                 y = 18
                 self.pantalla.blit(surf, (x, y))
+                get_dirty().add((x, y, w_s, h_s))
         except Exception:
             pass
 
+    def _snapshot_run(self, force=False):
+        """Guarda el snapshot al cambiar de paso o de vidas (o con `force`); lo borra cuando la partida termina."""
+        try:
+            if self.modo == 'flow' and self.pantalla_actual is not None and not self.game_over_active:
+                key = (self.seq_idx, getattr(self.estado, 'vidas', 0), self.puzzle_seed)
+                if key == self._snap_key and not force:
+                    return
+                if self._snap_key is None:
+                    # resuming must not rewind the cronómetro to the start of the step
+                    self.scheduler.every(RUN_SNAPSHOT_REFRESH_MS, self._refresh_snapshot)
+                self._snap_key = key
+                e = self.estado
+                self.snapshots.save({
+                    'seq_idx': self.seq_idx,
+                    'vidas': getattr(e, 'vidas', 0),
+                    'seed': self.puzzle_seed,
+                    'elapsed': e.tiempo_transcurrido(),
+                    'running': e.timer.running,
+                    'splits': e.tiempos_parciales(),
+                    'nombre': e.nombre or '',
+                    'avatar': avatar_id(getattr(e, 'avatar', None)),
+                    'brightness': getattr(e, 'brightness', 0.0),
+                    'contrast': getattr(e, 'contrast', 1.0),
+                    'volume': getattr(e, 'volume', 0.6),
+                })
+            elif self._snap_key is not None:
+                # finished, lost or abandoned: nothing to resume
+                self._snap_key = None
+                self.scheduler.cancel(self._refresh_snapshot)
+                self.snapshots.clear()
+        except Exception:
+            pass
+
+    def _refresh_snapshot(self):
+        """Reescribe el snapshot con el cronómetro actual (cada `RUN_SNAPSHOT_REFRESH_MS` en flow)."""
+        self._snapshot_run(force=True)
+
+    def _resume_run(self, snap):
+        """Retoma la partida del snapshot: mismo paso, vidas, cronómetro y puzzle."""
+        e = self.estado
+        e.nombre = snap.get('nombre') or ''
+        e.avatar = snap.get('avatar')
+        try:
+            e.set_vidas(snap.get('vidas', DEFAULT_LIVES))
+        except Exception:
+            e.vidas = snap.get('vidas', DEFAULT_LIVES)
+        try:
+            e.set_brightness(snap.get('brightness', 0.0))
+            e.set_contrast(snap.get('contrast', 1.0))
+            e.set_volume(snap.get('volume', 0.6))
+        except Exception:
+            pass
+        e.timer.restore(snap.get('elapsed', 0.0), snap.get('running'), snap.get('splits'))
+        e.record_saved = False
+        e.ultimo_puesto = None
+        self._cancel_game_over()
+        self.seq_idx = max(0, min(int(snap.get('seq_idx', 0)), len(self.seq) - 1))
+        kind, idx = self.seq[self.seq_idx]
+        self.pantalla_actual = self._instantiate_screen_for(kind, idx, seed=snap.get('seed') if kind != 'rules' else None)
+        try:
+            self.pantalla_actual.estado = e
+            e.hud_persistent = (kind != 'rules')
+        except Exception:
+            pass
+        self.modo = 'flow'
+        self.resume_offer = None
+
+    def _handle_resume_event(self, evento):
+        choice = None
+        if evento.type == pygame.KEYDOWN:
+            if evento.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                choice = 'continue'
+            elif evento.key == pygame.K_ESCAPE:
+                choice = 'new'
+        elif evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1 and self._resume_buttons:
+            if self._resume_buttons[0].collidepoint(evento.pos):
+                choice = 'continue'
+            elif self._resume_buttons[1].collidepoint(evento.pos):
+                choice = 'new'
+        if choice == 'continue':
+            try:
+                self._resume_run(self.resume_offer)
+            except Exception:
+                self.resume_offer = None
+        elif choice == 'new':
+            self.resume_offer = None
+            self.snapshots.clear()
+
+    def _auto_advance(self):
+        """Countdown of a finished minigame ran out: go to the next step."""
+        if self.modo != 'flow' or self.pantalla_actual is None or self.pantalla_actual is not self._advance_armed:
+            return
+        self.seq_idx += 1
+        if self.seq_idx >= len(self.seq):
+            self.estado.detener_cronometro()
+            try:
+                if getattr(self.estado, 'vidas', 0) > 0 and not getattr(self.estado, 'record_saved', False):
+                    self.estado.ultimo_puesto = guardar_registro(self.estado.nombre or '---', self.estado.tiempo_transcurrido(), getattr(self.estado, 'avatar', None), self.estado.tiempos_parciales())
+                    self.estado.record_saved = True
+            except Exception:
+                pass
+            self.pantalla_records = PantallaRecords(self.pantalla, self.estado)
+            self.modo = 'records'
+            self.pantalla_actual = None
+        else:
+            kind, idx = self.seq[self.seq_idx]
+            self.pantalla_actual = self._instantiate_screen_for(kind, idx)
+            # ensure cronómetro paused/resumed appropriately
+            try:
+                if kind == 'rules':
+                    self.estado.detener_cronometro()
+                else:
+                    self.estado.iniciar_cronometro()
+            except Exception:
+                pass
+
+    def _end_game_over(self):
+        """Fin de la cuenta atrás del game over: vuelta al registro para una partida nueva."""
+        if not self.game_over_active:
+            return
+        self._cancel_game_over()
+        self.pantalla_records = None
+        self.pantalla_actual = None
+        self.modo = 'inicio'
+        self.inicio.input_text = ''
+        self.estado.nombre = ''
+        self.estado.avatar = None
+        self.estado.record_saved = False
+        self.estado.ultimo_puesto = None
+        self._preload(0)
+        try:
+            self.estado.set_vidas(DEFAULT_LIVES)
+        except Exception:
+            self.estado.vidas = DEFAULT_LIVES
+        try:
+            self.estado.reiniciar_cronometro()
+        except Exception:
+            pass
+
+    def _cancel_game_over(self):
+        self.scheduler.cancel(self._end_game_over)
+        self.game_over_active = False
+        self.game_over_until = None
+
+    def _is_animating(self, activa):
+        """True while something on screen moves on its own (full frame rate needed).
+
+        Screens opt into idle pacing with `is_animating()`; without it they are
+        assumed to animate.
+        """
+        if self.game_over_active or self._hover_active:
+            return True
+        if activa is None:
+            return False
+        fn = getattr(activa, 'is_animating', None)
+        if fn is None:
+            return True
+        try:
+            return bool(fn())
+        except Exception:
+            return True
+
+    def _on_inicio_event(self, evento):
+        """Registro: nombre/avatar aceptados empiezan la partida."""
+        resultado = self.inicio.handle_events(evento)
+        if resultado == 'siguiente':
+            nombre = self.inicio.input_text.strip()
+            self.estado.nombre = nombre
+            try:
+                self.estado.set_vidas(DEFAULT_LIVES)
+            except Exception:
+                self.estado.vidas = DEFAULT_LIVES
+            # start the cronómetro; it will be paused when entering rules
+            try:
+                self.estado.iniciar_cronometro()
+            except Exception:
+                pass
+            self.modo = 'flow'
+            self.seq_idx = 0
+            kind, idx = self.seq[self.seq_idx]
+            self.pantalla_actual = self._instantiate_screen_for(kind, idx)
+            if kind == 'rules':
+                try:
+                    self.estado.hud_persistent = False
+                except Exception:
+                    pass
+            else:
+                try:
+                    self.pantalla_actual.estado = self.estado
+                    self.estado.hud_persistent = True
+                except Exception:
+                    pass
+        elif resultado == 'records':
+            self.estado.detener_cronometro()
+            self.pantalla_records = PantallaRecords(self.pantalla, self.estado)
+            self.modo = 'records'
+
+    def _on_flow_event(self, evento):
+        """Secuencia reglas/juegos: 'next' pasa al paso siguiente (o a records al final)."""
+        if self.pantalla_actual is None:
+            return
+        if self.game_over_active:
+            resultado = None
+        else:
+            resultado = self.pantalla_actual.handle_events(evento)
+
+        if resultado == 'next':
+            self.seq_idx += 1
+            if self.seq_idx >= len(self.seq):
+                self.estado.detener_cronometro()
+                try:
+                    if getattr(self.estado, 'vidas', 0) > 0 and not getattr(self.estado, 'record_saved', False):
+                        self.estado.ultimo_puesto = guardar_registro(self.estado.nombre or '---', self.estado.tiempo_transcurrido(), getattr(self.estado, 'avatar', None), self.estado.tiempos_parciales())
+                        self.estado.record_saved = True
+                except Exception:
+                    pass
+                self.pantalla_records = PantallaRecords(self.pantalla, self.estado)
+                self.modo = 'records'
+                self.pantalla_actual = None
+            else:
+                kind, idx = self.seq[self.seq_idx]
+                self.pantalla_actual = self._instantiate_screen_for(kind, idx)
+                try:
+                    self.pantalla_actual.estado = self.estado
+                    self.estado.hud_persistent = (kind != 'rules')
+                except Exception:
+                    pass
+                # pause timer for rules, resume for actual game play
+                try:
+                    if kind == 'rules':
+                        self.estado.detener_cronometro()
+                    else:
+                        self.estado.iniciar_cronometro()
+                except Exception:
+                    pass
+
+    def _on_records_event(self, evento):
+        """Records: 'replay' vuelve al registro para una partida nueva."""
+        if self.pantalla_records is None:
+            return
+        resultado = self.pantalla_records.handle_events(evento)
+        if resultado == 'replay':
+            self._cancel_game_over()
+            self.pantalla_records = None
+            self.modo = 'inicio'
+            self.inicio.input_text = ''
+            self.estado.nombre = ''
+            self.estado.avatar = None
+            try:
+                self.estado.set_vidas(DEFAULT_LIVES)
+            except Exception:
+                self.estado.vidas = DEFAULT_LIVES
+            self.estado.record_saved = False
+            self.estado.ultimo_puesto = None
+            self._preload(0)
+            # reset cronómetro so it does not show stopped time on registro
+            try:
+                self.estado.reiniciar_cronometro()
+            except Exception:
+                pass
+            try:
+                self.estado.hud_persistent = False
+            except Exception:
+                pass
+
+    def _on_resize(self, evento):
+        # scaled surfaces depend on the window size
+        get_assets().on_resize()
+
     def run(self):
-        inicio = PantallaRegistro(self.pantalla, self.estado)
+        self.inicio = PantallaRegistro(self.pantalla, self.estado)
+        # the first rules screen loads while the player types a name
+        self._preload(0)
         corriendo = True
 
         while corriendo:
             ahora = pygame.time.get_ticks()
-            for evento in pygame.event.get():
+            get_dirty().begin_frame(self.pantalla.get_size())
+            for evento in self.router.route(self.pacer.events()):
                 if evento.type == pygame.QUIT:
+                    # a run closed mid-step resumes with the cronómetro as it is now
+                    self._snapshot_run(force=True)
                     corriendo = False
                     break
+                # interrupted run found at startup: the resume modal takes the input
+                if self.resume_offer is not None and self.modo == 'inicio':
+                    self._handle_resume_event(evento)
+                    continue
+                handler = self._mode_handlers.get(self.modo)
+                if handler is not None:
+                    handler(evento)
 
-                # route events based on mode; if game-over active, ignore per-screen events
-                if self.modo == 'inicio':
-                    resultado = inicio.handle_events(evento)
-                    if resultado == 'siguiente':
-                        nombre = inicio.input_text.strip()
-                        self.estado.nombre = nombre
-                        try:
-                            self.estado.set_vidas(DEFAULT_LIVES)
-                        except Exception:
-                            self.estado.vidas = DEFAULT_LIVES
-                        # start the cronómetro; it will be paused when entering rules
-                        try:
-                            self.estado.iniciar_cronometro()
-                        except Exception:
-                            pass
-                        self.modo = 'flow'
-                        self.seq_idx = 0
-                        kind, idx = self.seq[self.seq_idx]
-                        self.pantalla_actual = self._instantiate_screen_for(kind, idx)
-                        if kind == 'rules':
-                            try:
-                                self.estado.hud_persistent = False
-                            except Exception:
-                                pass
-                        else:
-                            try:
-                                self.pantalla_actual.estado = self.estado
-                                self.estado.hud_persistent = True
-                            except Exception:
-                                pass
-                    elif resultado == 'records':
-                        self.estado.detener_cronometro()
-                        self.pantalla_records = PantallaRecords(self.pantalla, self.estado)
-                        self.modo = 'records'
+            self._snapshot_run()
+            self.scheduler.run_due()
 
-                elif self.modo == 'flow' and self.pantalla_actual is not None:
-                    if self.game_over_active:
-                        resultado = None
-                    else:
-                        resultado = self.pantalla_actual.handle_events(evento)
-
-                    if resultado == 'next':
-                        self.seq_idx += 1
-                        if self.seq_idx >= len(self.seq):
-                            self.estado.detener_cronometro()
-                            try:
-                                if getattr(self.estado, 'vidas', 0) > 0 and not getattr(self.estado, 'record_saved', False):
-                                    guardar_registro(self.estado.nombre or '---', self.estado.tiempo_transcurrido(), getattr(self.estado, 'avatar', None))
-                                    self.estado.record_saved = True
-                            except Exception:
-                                pass
-                            self.pantalla_records = PantallaRecords(self.pantalla, self.estado)
-                            self.modo = 'records'
-                            self.pantalla_actual = None
-                        else:
-                            kind, idx = self.seq[self.seq_idx]
-                            self.pantalla_actual = self._instantiate_screen_for(kind, idx)
-                            try:
-                                self.pantalla_actual.estado = self.estado
-                                self.estado.hud_persistent = (kind != 'rules')
-                            except Exception:
-                                pass
-                            # pause timer for rules, resume for actual game play
-                            try:
-                                if kind == 'rules':
-                                    self.estado.detener_cronometro()
-                                else:
-                                    self.estado.iniciar_cronometro()
-                            except Exception:
-                                pass
-
-                elif self.modo == 'records' and self.pantalla_records is not None:
-                    resultado = self.pantalla_records.handle_events(evento)
-                    if resultado == 'replay':
-                        self.pantalla_records = None
-                        self.modo = 'inicio'
-                        inicio.input_text = ''
-                        self.estado.nombre = ''
-                        self.estado.avatar = None
-                        try:
-                            self.estado.set_vidas(DEFAULT_LIVES)
-                        except Exception:
-                            self.estado.vidas = DEFAULT_LIVES
-                        self.estado.record_saved = False
-                        # reset cronómetro so it does not show stopped time on registro
-                        try:
-                            self.estado.cronometro_inicio = None
-                            self.estado.cronometro_fin = None
-                        except Exception:
-                            pass
-                        try:
-                            self.estado.hud_persistent = False
-                        except Exception:
-                            pass
+            # minimized/hidden window: nothing is rendered until it is shown again
+            if not self.pacer.should_render():
+                self.pacer.wait(False)
+                continue
 
-            # update/draw
+            # update/draw (text cache stats are grouped per screen class)
+            activa = None
             if self.modo == 'inicio':
-                inicio.update()
-                inicio.draw()
+                activa = self.inicio
             elif self.modo == 'flow' and self.pantalla_actual is not None:
-                self.pantalla_actual.update()
-                self.pantalla_actual.draw()
+                activa = self.pantalla_actual
             elif self.modo == 'records' and self.pantalla_records is not None:
-                self.pantalla_records.update()
-                self.pantalla_records.draw()
+                activa = self.pantalla_records
+            if activa is not None:
+                get_text_cache().set_scope(type(activa).__name__)
+                activa.update()
+                activa.draw()
             else:
                 self.pantalla.fill((18, 20, 24))
+            get_text_cache().set_scope('overlays')
+            # screens that report their own dirty rects opt in with `dirty_tracking = True`;
+            # any other screen (or a screen change) is presented with a full flip
+            if activa is None or activa is not self._last_drawn_screen or not getattr(activa, 'dirty_tracking', False):
+                get_dirty().mark_full()
+            self._last_drawn_screen = activa
 
             # HUD persistente
             try:
@@ -213,27 +550,9 @@ class AppController:
             except Exception:
                 pass
 
-            # brightness overlay only (contrast and volume disabled)
-            try:
-                b = getattr(self.estado, 'brightness', 0.0)
-                w, h = self.pantalla.get_size()
-                if abs(b) > 0.001:
-                    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-                    max_alpha = 110
-                    if b > 0:
-                        scaled = (abs(b) ** 0.85)
-                        alpha = int(min(1.0, b) * max_alpha * scaled)
-                        overlay.fill((255, 255, 255, max(0, min(255, alpha))))
-                    else:
-                        scaled = (abs(b) ** 0.85)
-                        alpha = int(min(1.0, -b) * max_alpha * scaled)
-                        overlay.fill((0, 0, 0, max(0, min(255, alpha))))
-                    self.pantalla.blit(overlay, (0, 0))
-            except Exception:
-                pass
-
             # hover/pointer visuals
             try:
+                self._hover_active = False
                 mx, my = pygame.mouse.get_pos()
                 hovered_rect = None
                 interactive_rects = []
@@ -263,6 +582,7 @@ class AppController:
                         continue
 
                 if hovered_rect is not None:
+                    self._hover_active = True
                     pulse = (math.sin(pygame.time.get_ticks() / 220.0) + 1.0) / 2.0
                     alpha = int(80 + pulse * 80)
                     pad = 8
@@ -275,9 +595,10 @@ class AppController:
                     except Exception:
                         overlay.fill((255, 255, 255, alpha))
                     self.pantalla.blit(overlay, (hovered_rect.x - pad, hovered_rect.y - pad))
+                    get_dirty().add((hovered_rect.x - pad, hovered_rect.y - pad, ov_w, ov_h))
 
                 # draw custom pointer via helper
-                draw_pointer(self.pantalla, self.puntero_img)
+                draw_pointer(self.pantalla, self.puntero)
             except Exception:
                 pass
 
@@ -285,7 +606,9 @@ class AppController:
             try:
                 if self.modo == 'flow' and not self.game_over_active and getattr(self.estado, 'vidas', 0) <= 0:
                     self.game_over_active = True
+                    # the modal counts down to game_over_until; the redirect fires from the scheduler
                     self.game_over_until = pygame.time.get_ticks() + 5000
+                    self.scheduler.at(self.game_over_until, self._end_game_over)
                     try:
                         self.estado.detener_cronometro()
                     except Exception:
@@ -295,6 +618,7 @@ class AppController:
 
             # draw game-over modal
             if self.game_over_active:
+                get_dirty().mark_full()
                 try:
                     w, h = self.pantalla.get_size()
                     overlay = pygame.Surface((w, h), pygame.SRCALPHA)
@@ -307,18 +631,40 @@ class AppController:
                     box = pygame.Rect(box_x, box_y, box_w, box_h)
                     pygame.draw.rect(self.pantalla, (28, 30, 34), box, border_radius=18)
                     pygame.draw.rect(self.pantalla, (200, 80, 80), box, 4, border_radius=18)
-                    title_f = pygame.font.SysFont('Verdana', 36, bold=True)
-                    title_s = title_f.render('Has perdido todas las vidas', True, (240, 240, 240))
+                    title_f = get_fonts().get(36, bold=True)
+                    title_s = get_text_cache().render(title_f, 'Has perdido todas las vidas', (240, 240, 240))
                     self.pantalla.blit(title_s, (box_x + (box_w - title_s.get_width())//2, box_y + 28))
-                    sub_f = pygame.font.SysFont('Verdana', 20)
+                    sub_f = get_fonts().get(20)
                     remaining = max(0, int((self.game_over_until - pygame.time.get_ticks() + 999)//1000)) if self.game_over_until else 0
-                    sub_s = sub_f.render(f'Redirigiendo al inicio en {remaining} s...', True, (220, 220, 220))
+                    sub_s = get_text_cache().render(sub_f, f'Redirigiendo al inicio en {remaining} s...', (220, 220, 220))
                     self.pantalla.blit(sub_s, (box_x + (box_w - sub_s.get_width())//2, box_y + 28 + title_s.get_height() + 18))
                 except Exception:
                     pass
 
-            pygame.display.flip()
-            self.reloj.tick(self.fps)
+            # resume offer for a run interrupted by a previous crash
+            if self.resume_offer is not None and self.modo == 'inicio':
+                get_dirty().mark_full()
+                try:
+                    self._resume_buttons = draw_resume_modal(self.pantalla, self.resume_offer, len(self.seq))
+                except Exception:
+                    self._resume_buttons = None
+
+            # post-processing: brightness/contrast over exactly what is about to be presented
+            try:
+                ajuste = (getattr(self.estado, 'brightness', 0.0), getattr(self.estado, 'contrast', 1.0))
+                if ajuste != self._last_adjust:
+                    get_dirty().mark_full()
+                    self._last_adjust = ajuste
+                get_postprocess().apply(self.pantalla, ajuste[0], ajuste[1], rects=get_dirty().collect())
+            except Exception:
+                pass
+
+            get_dirty().present()
+            # transition stall ends with the first presented frame of the new screen
+            self.scenes.end_swap()
+            # one preload step per frame (convert, build, compose), then the usual wait
+            self.scenes.pump()
+            self.pacer.wait(self._is_animating(activa))
 
             # auto-advance finalization
             try:
@@ -326,7 +672,7 @@ class AppController:
                     try:
                         self.estado.detener_cronometro()
                         if getattr(self.estado, 'vidas', 0) > 0 and not getattr(self.estado, 'record_saved', False):
-                            guardar_registro(self.estado.nombre or '---', self.estado.tiempo_transcurrido(), getattr(self.estado, 'avatar', None))
+                            self.estado.ultimo_puesto = guardar_registro(self.estado.nombre or '---', self.estado.tiempo_transcurrido(), getattr(self.estado, 'avatar', None), self.estado.tiempos_parciales())
                             self.estado.record_saved = True
                     except Exception:
                         pass
@@ -336,55 +682,17 @@ class AppController:
                     except Exception:
                         self.pantalla_actual.auto_advance_until = None
 
-                if self.modo == 'flow' and self.pantalla_actual is not None and hasattr(self.pantalla_actual, 'auto_advance_until'):
-                    if self.pantalla_actual.auto_advance_until and pygame.time.get_ticks() >= self.pantalla_actual.auto_advance_until:
-                        self.seq_idx += 1
-                        if self.seq_idx >= len(self.seq):
-                            self.estado.detener_cronometro()
-                            try:
-                                if getattr(self.estado, 'vidas', 0) > 0 and not getattr(self.estado, 'record_saved', False):
-                                    guardar_registro(self.estado.nombre or '---', self.estado.tiempo_transcurrido(), getattr(self.estado, 'avatar', None))
-                                    self.estado.record_saved = True
-                            except Exception:
-                                pass
-                            self.pantalla_records = PantallaRecords(self.pantalla, self.estado)
-                            self.modo = 'records'
-                            self.pantalla_actual = None
-                        else:
-                            kind, idx = self.seq[self.seq_idx]
-                            self.pantalla_actual = self._instantiate_screen_for(kind, idx)
-                            # ensure cronómetro paused/resumed appropriately
-                            try:
-                                if kind == 'rules':
-                                    self.estado.detener_cronometro()
-                                else:
-                                    self.estado.iniciar_cronometro()
-                            except Exception:
-                                pass
-            except Exception:
-                pass
-
-            # finalize game-over redirect
-            try:
-                if self.game_over_active and self.game_over_until and pygame.time.get_ticks() >= self.game_over_until:
-                    self.game_over_active = False
-                    self.game_over_until = None
-                    self.pantalla_records = None
-                    self.pantalla_actual = None
-                    self.modo = 'inicio'
-                    inicio.input_text = ''
-                    self.estado.nombre = ''
-                    self.estado.avatar = None
-                    self.estado.record_saved = False
-                    try:
-                        self.estado.set_vidas(DEFAULT_LIVES)
-                    except Exception:
-                        self.estado.vidas = DEFAULT_LIVES
-                    try:
-                        self.estado.cronometro_inicio = None
-                        self.estado.cronometro_fin = None
-                    except Exception:
-                        pass
+                # screens announce their countdown in `auto_advance_until`; it fires from the scheduler
+                if self.modo == 'flow' and self.pantalla_actual is not None and self._advance_armed is not self.pantalla_actual:
+                    deadline = getattr(self.pantalla_actual, 'auto_advance_until', None)
+                    if deadline:
+                        self._advance_armed = self.pantalla_actual
+                        self.scheduler.at(deadline, self._auto_advance)
             except Exception:
                 pass
 
+        if DEBUG_STATS:
+            print(self.pacer.report())
+            print(self.scenes.report())
+        # final checkpoint: leave the records journal folded into the database
+        get_records().close()
@@ -0,0 +1,178 @@
+"""Caché compartida de superficies (fondos, imágenes de juego, avatares).
+
+Evita decodificar y escalar imágenes en cada frame: cada superficie se guarda
+una sola vez por clave (ruta, tamaño destino, modo) y se reutiliza. Las
+entradas menos usadas se descartan (LRU) cuando se supera el presupuesto de
+memoria configurado.
+"""
+import os
+from collections import OrderedDict
+
+import pygame
+
+from core.constants import ASSET_CACHE_BUDGET_MB
+
+
+class AssetCache:
+    """LRU de superficies con presupuesto de memoria y contadores hit/miss.
+
+    `mode` puede ser 'convert' (opaco, para fondos), 'alpha' (convert_alpha)
+    o None (superficie tal cual la devuelve `pygame.image.load`).
+    """
+
+    def __init__(self, budget_bytes=ASSET_CACHE_BUDGET_MB * 1024 * 1024):
+        self.budget_bytes = int(budget_bytes)
+        self._entries = OrderedDict()  # key -> (surface, nbytes)
+        # rutas que no se pudieron cargar: evita reintentar en cada frame
+        self._missing = set()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path, size=None, mode='convert', smooth=False):
+        """Devuelve la superficie de `path` (escalada a `size` si se indica).
+
+        Lanza la misma excepción que `pygame.image.load` si el archivo no
+        existe o no se puede decodificar, para que las pantallas mantengan su
+        fallback habitual.
+        """
+        path = os.path.normpath(str(path))
+        size = (int(size[0]), int(size[1])) if size is not None else None
+        key = (path, size, mode, bool(smooth) if size is not None else False)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        if path in self._missing:
+            raise FileNotFoundError(path)
+
+        # para versiones escaladas reutilizamos la original si ya está en caché
+        base_key = (path, None, mode, False)
+        base_entry = self._entries.get(base_key)
+        if base_entry is not None:
+            surf = base_entry[0]
+        else:
+            try:
+                surf = self._load(path, mode)
+            except Exception:
+                self._missing.add(path)
+                raise
+        if size is not None and surf.get_size() != size:
+            if smooth:
+                try:
+                    surf = pygame.transform.smoothscale(surf, size)
+                except Exception:
+                    surf = pygame.transform.scale(surf, size)
+            else:
+                surf = pygame.transform.scale(surf, size)
+        self._store(key, surf)
+        return surf
+
+    def background(self, paths, size):
+        """Primer fondo cargable de `paths` escalado a `size`, o None si ninguno existe."""
+        if isinstance(paths, (str, os.PathLike)):
+            paths = (paths,)
+        for p in paths:
+            try:
+                return self.get(p, size, mode='convert')
+            except Exception:
+                continue
+        return None
+
+    def has(self, path, mode='convert'):
+        """True si el original de `path` ya está en caché (sin contar como hit)."""
+        return (os.path.normpath(str(path)), None, mode, False) in self._entries
+
+    def adopt(self, path, img, mode='convert'):
+        """Guarda como original de `path` una superficie decodificada en otro hilo.
+
+        La conversión al formato del display se hace aquí, en el hilo principal.
+        """
+        surf = self._convert(img, mode)
+        self._store((os.path.normpath(str(path)), None, mode, False), surf)
+        return surf
+
+    def _load(self, path, mode):
+        return self._convert(pygame.image.load(path), mode)
+
+    @staticmethod
+    def _convert(img, mode):
+        # convert() requiere un display activo; sin él devolvemos la superficie cruda
+        if pygame.display.get_surface() is None:
+            return img
+        try:
+            if mode == 'alpha':
+                return img.convert_alpha()
+            if mode == 'convert':
+                return img.convert()
+        except Exception:
+            pass
+        return img
+
+    def _store(self, key, surf):
+        try:
+            nbytes = surf.get_pitch() * surf.get_height()
+        except Exception:
+            nbytes = 0
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.used_bytes -= old[1]
+        self._entries[key] = (surf, nbytes)
+        self.used_bytes += nbytes
+        self._evict()
+
+    def _evict(self):
+        # evict least recently used entries, always keeping the newest one
+        while self.used_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (_, freed) = self._entries.popitem(last=False)
+            self.used_bytes -= freed
+            self.evictions += 1
+
+    def set_budget(self, budget_bytes):
+        self.budget_bytes = int(budget_bytes)
+        self._evict()
+
+    def invalidate(self, path=None):
+        """Descarta todo (o solo las entradas de `path`)."""
+        if path is None:
+            self._entries.clear()
+            self._missing.clear()
+            self.used_bytes = 0
+            return
+        path = os.path.normpath(str(path))
+        for key in [k for k in self._entries if k[0] == path]:
+            self.used_bytes -= self._entries.pop(key)[1]
+        self._missing.discard(path)
+
+    def on_resize(self):
+        """Tras un cambio de tamaño de ventana descarta las versiones escaladas.
+
+        Las originales (size=None) se conservan porque no dependen de la ventana.
+        """
+        for key in [k for k in self._entries if k[1] is not None]:
+            self.used_bytes -= self._entries.pop(key)[1]
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total) if total else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'used_bytes': self.used_bytes,
+            'budget_bytes': self.budget_bytes,
+        }
+
+
+_assets = None
+
+
+def get_assets():
+    global _assets
+    if _assets is None:
+        _assets = AssetCache()
+    return _assets
@@ -0,0 +1,190 @@
+"""Avatares: identificadores reubicables y miniaturas cacheadas.
+
+Los records guardan el avatar como identificador (`avatar1.png`), no como
+ruta absoluta: una ruta de Windows grabada en otra máquina no existe en los
+kioscos Linux. `resolve_avatar()` busca el identificador en
+`AVATAR_DIR` (y acepta también rutas absolutas antiguas, de las que solo
+usa el nombre de archivo si la ruta ya no existe).
+
+`AvatarThumbs` entrega el avatar escalado a los tamaños que usan el HUD, las
+filas de records y la grilla de registro. Cada miniatura se guarda en
+memoria y en disco (`AVATAR_THUMB_DIR`, nombre = hash del contenido + tamaño),
+así que en los arranques siguientes el PNG original ni siquiera se decodifica;
+cuando hace falta, se decodifica como mucho una vez por proceso.
+"""
+import hashlib
+import os
+from pathlib import Path
+
+import pygame
+
+from core.constants import AVATAR_DIR, AVATAR_THUMB_DIR, AVATAR_THUMB_SIZES
+
+
+def avatar_id(value):
+    """Identificador reubicable de un avatar (nombre de archivo), o None."""
+    if not value:
+        return None
+    # records from Windows machines use backslashes
+    name = str(value).replace('\\', '/').rstrip('/').rsplit('/', 1)[-1]
+    return name or None
+
+
+def resolve_avatar(value):
+    """Ruta local del avatar `value` (identificador o ruta), o None si no existe."""
+    if not value:
+        return None
+    value = str(value)
+    if os.path.isabs(value) and os.path.isfile(value):
+        return os.path.normpath(value)
+    name = avatar_id(value)
+    candidate = os.path.join(AVATAR_DIR, name) if name else None
+    if candidate and os.path.isfile(candidate):
+        return os.path.normpath(candidate)
+    return None
+
+
+class AvatarThumbs:
+    """Miniaturas de avatares en memoria y en disco, indexadas por hash de contenido."""
+
+    def __init__(self, cache_dir=AVATAR_THUMB_DIR, sizes=AVATAR_THUMB_SIZES):
+        self.cache_dir = Path(cache_dir)
+        self.sizes = tuple(int(s) for s in sizes)
+        self._thumbs = {}   # (path, size) -> surface
+        self._sources = {}  # path -> decoded original (at most one decode per process)
+        self._digests = {}  # (path, mtime_ns, bytes) -> content hash
+        self._missing = set()
+        self.hits = 0
+        self.disk_hits = 0
+        self.disk_writes = 0
+        self.decodes = 0
+
+    def _digest(self, path):
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        digest = self._digests.get(key)
+        if digest is None:
+            with open(path, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()[:16]
+            self._digests[key] = digest
+        return digest
+
+    @staticmethod
+    def _prepare(img):
+        # convert_alpha needs an active display; without one keep the raw surface
+        if pygame.display.get_surface() is None:
+            return img
+        try:
+            return img.convert_alpha()
+        except Exception:
+            return img
+
+    def _source(self, path):
+        src = self._sources.get(path)
+        if src is None:
+            src = self._prepare(pygame.image.load(path))
+            self.decodes += 1
+            self._sources[path] = src
+        return src
+
+    def _thumb_path(self, digest, size):
+        return self.cache_dir / f'{digest}_{size[0]}x{size[1]}.png'
+
+    def get(self, avatar, size):
+        """Avatar `avatar` (identificador o ruta) escalado a `size`.
+
+        Lanza FileNotFoundError si el avatar no existe, para que quien dibuja
+        mantenga su fallback habitual.
+        """
+        size = (int(size[0]), int(size[1]))
+        path = resolve_avatar(avatar)
+        if path is None:
+            raise FileNotFoundError(str(avatar))
+        key = (path, size)
+        surf = self._thumbs.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+        if path in self._missing:
+            raise FileNotFoundError(path)
+        try:
+            surf = self._from_disk(path, size)
+            if surf is None:
+                surf = self._scale(path, size)
+        except Exception:
+            self._missing.add(path)
+            raise
+        self._thumbs[key] = surf
+        return surf
+
+    def _from_disk(self, path, size):
+        try:
+            thumb = self._thumb_path(self._digest(path), size)
+            if not thumb.exists():
+                return None
+            surf = self._prepare(pygame.image.load(str(thumb)))
+        except Exception:
+            return None
+        if surf.get_size() != size:
+            return None
+        self.disk_hits += 1
+        return surf
+
+    def _scale(self, path, size):
+        src = self._source(path)
+        if src.get_size() == size:
+            surf = src
+        else:
+            try:
+                surf = pygame.transform.smoothscale(src, size)
+            except Exception:
+                surf = pygame.transform.scale(src, size)
+        # only the usual sizes go to disk (not every size seen while resizing)
+        if size[0] == size[1] and size[0] in self.sizes:
+            self._save(path, size, surf)
+        return surf
+
+    def _save(self, path, size, surf):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            thumb = self._thumb_path(self._digest(path), size)
+            # write then rename: a crash never leaves a truncated thumbnail behind
+            tmp = thumb.with_name(thumb.stem + '.tmp.png')
+            pygame.image.save(surf, str(tmp))
+            os.replace(tmp, thumb)
+            self.disk_writes += 1
+        except Exception:
+            pass
+
+    def warm(self, avatars=None, sizes=None):
+        """Genera (o carga del disco) las miniaturas de los tamaños habituales."""
+        if avatars is None:
+            try:
+                avatars = sorted(n for n in os.listdir(AVATAR_DIR) if n.lower().endswith('.png'))
+            except OSError:
+                avatars = []
+        for avatar in avatars:
+            for s in (sizes or self.sizes):
+                try:
+                    self.get(avatar, (s, s))
+                except Exception:
+                    break
+
+    def stats(self):
+        return {
+            'thumbs': len(self._thumbs),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'disk_writes': self.disk_writes,
+            'decodes': self.decodes,
+        }
+
+
+_avatars = None
+
+
+def get_avatars():
+    global _avatars
+    if _avatars is None:
+        _avatars = AvatarThumbs()
+    return _avatars
@@ -0,0 +1,138 @@
+"""Compositor de capas: fondo + panel estático renderizados una sola vez.
+
+Las pantallas redibujaban en cada frame el mismo fondo y el mismo panel
+translúcido redondeado (una `Surface` SRCALPHA nueva, un rect redondeado y un
+blit con alpha a pantalla completa). Con `StaticLayer` la pantalla declara qué
+parte es estática (fondo, panel, título, instrucciones fijas); esa parte se
+compone en una superficie opaca del tamaño de la ventana y se reutiliza hasta
+que cambie el tamaño, la clave indicada o se invalide. Cada frame solo cuesta
+un blit opaco más los widgets dinámicos dibujados encima.
+"""
+import weakref
+
+import pygame
+
+from core.assets import get_assets
+
+PANEL_BORDER_COLOR = (200, 200, 200)
+FALLBACK_BG_COLOR = (18, 20, 24)
+
+
+def paint_background(surface, paths, fallback=FALLBACK_BG_COLOR):
+    """Fondo escalado al tamaño de `surface` (primer archivo cargable de `paths`) o color liso."""
+    bg = get_assets().background(paths, surface.get_size())
+    if bg is not None:
+        surface.blit(bg, (0, 0))
+    else:
+        surface.fill(fallback)
+
+
+def paint_panel(surface, rect, fill, border=PANEL_BORDER_COLOR, width=3, radius=18, rounded_fill=True):
+    """Panel translúcido con borde, igual al que cada pantalla dibujaba a mano.
+
+    `rounded_fill=False` reproduce las pantallas que rellenaban un rectángulo
+    recto y solo redondeaban el borde (memoria, parejas).
+    """
+    rect = pygame.Rect(rect)
+    panel_surf = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
+    if not rounded_fill:
+        panel_surf.fill(fill)
+        surface.blit(panel_surf, rect.topleft)
+        if border is not None and width:
+            pygame.draw.rect(surface, border, rect, width, border_radius=radius)
+        return
+    try:
+        pygame.draw.rect(panel_surf, fill, panel_surf.get_rect(), border_radius=radius)
+        if border is not None and width:
+            pygame.draw.rect(panel_surf, border, panel_surf.get_rect(), width, border_radius=radius)
+        surface.blit(panel_surf, rect.topleft)
+    except Exception:
+        # fallback rectangular
+        panel_surf.fill(fill)
+        surface.blit(panel_surf, rect.topleft)
+        if border is not None and width:
+            pygame.draw.rect(surface, border, rect, width)
+
+
+class StaticLayer:
+    """Capa opaca del tamaño de la ventana construida por `build(surface)`.
+
+    Se reconstruye cuando cambia el tamaño de la pantalla destino o la `key`
+    pasada a `blit` (p. ej. un título que cambia), o tras `invalidate()`.
+    """
+
+    def __init__(self, build, compositor=None):
+        self._build = build
+        self._compositor = compositor
+        self._surface = None
+        self._key = None
+
+    def prepare(self, size, key=None):
+        """Compone la capa para `size` sin dibujarla (p. ej. al precargar la pantalla siguiente).
+
+        Devuelve True si tuvo que construirla.
+        """
+        full_key = (tuple(size), key)
+        if self._surface is not None and self._key == full_key:
+            return False
+        surf = pygame.Surface(full_key[0])
+        if pygame.display.get_surface() is not None:
+            try:
+                surf = surf.convert()
+            except Exception:
+                pass
+        self._build(surf)
+        self._surface = surf
+        self._key = full_key
+        if self._compositor is not None:
+            self._compositor.builds += 1
+        return True
+
+    def blit(self, screen, key=None):
+        """Compone la capa (si hace falta) y la copia a `screen` en (0, 0)."""
+        if not self.prepare(screen.get_size(), key) and self._compositor is not None:
+            self._compositor.reuses += 1
+        screen.blit(self._surface, (0, 0))
+        return self._surface
+
+    def invalidate(self):
+        self._surface = None
+        self._key = None
+
+
+class Compositor:
+    """Registro de capas estáticas vivas y contadores de reconstrucción/reuso."""
+
+    def __init__(self):
+        self._layers = weakref.WeakSet()
+        self.builds = 0
+        self.reuses = 0
+
+    def layer(self, build):
+        """Crea una `StaticLayer` registrada (la pantalla la guarda como atributo)."""
+        layer = StaticLayer(build, compositor=self)
+        self._layers.add(layer)
+        return layer
+
+    def invalidate_all(self):
+        for layer in list(self._layers):
+            layer.invalidate()
+
+    def stats(self):
+        total = self.builds + self.reuses
+        return {
+            'layers': len(self._layers),
+            'builds': self.builds,
+            'reuses': self.reuses,
+            'reuse_rate': (self.reuses / total) if total else 0.0,
+        }
+
+
+_compositor = None
+
+
+def get_compositor():
+    global _compositor
+    if _compositor is None:
+        _compositor = Compositor()
+    return _compositor
@@ -1,11 +1,62 @@
 import os
 
+# ESCAPE_DEBUG_STATS=1: the game loop prints its pacing / preload reports on exit
+DEBUG_STATS = os.environ.get('ESCAPE_DEBUG_STATS', '') not in ('', '0')
+
 # Asset paths
 ASSETS_DIR = os.path.join(os.getcwd(), 'assets')
 AVATAR_DIR = os.path.join(ASSETS_DIR, 'avatares')
+# avatar thumbnails (core/avatars.py): on-disk cache and the sizes pre-generated at startup
+# (48 = records row, 56 = HUD, 106 = registro grid cell at the default window width)
+AVATAR_THUMB_DIR = os.path.join(os.getcwd(), 'data', 'thumbs')
+AVATAR_THUMB_SIZES = (48, 56, 106)
 POINTER_PATH = os.path.join(ASSETS_DIR, 'puntero.png')
 LIFE_ICON = os.path.join(ASSETS_DIR, 'vida.png')
+# install the pointer as a hardware color cursor when the platform supports it
+# (falls back to drawing it in software every frame)
+POINTER_HARDWARE = True
 BG_START = os.path.join(ASSETS_DIR, 'bg_start.jpg')
+BG_AREA = os.path.join(ASSETS_DIR, 'area.jpg')
+BG_RECORDS = os.path.join(ASSETS_DIR, 'bg_records.jpg')
+
+# Asset cache (core/assets.py): memory budget for decoded/scaled surfaces
+ASSET_CACHE_BUDGET_MB = 48
+# Text cache (core/text_cache.py): max rendered labels kept in memory
+TEXT_CACHE_MAX_ENTRIES = 512
+# Dirty rects (core/dirty.py): full flip when the changed area exceeds this
+# fraction of the window; above DIRTY_MAX_RECTS regions they are unioned
+DIRTY_FULL_FLIP_RATIO = 0.5
+DIRTY_MAX_RECTS = 16
+# regions closer than this (px) are merged into a single update rect
+DIRTY_MERGE_MARGIN = 8
+# Frame pacing (core/pacing.py): rate while nothing animates, quiet time after
+# the last input before dropping to it, and wait slice while minimized
+IDLE_FPS = 10
+IDLE_AFTER_MS = 1500
+HIDDEN_WAIT_MS = 250
+# Hit-test index (core/events.py): side of a grid cell, in px
+HIT_CELL_PX = 64
+
+# Records repository (core/gestor_registros.py): min interval between file stat checks
+RECORDS_POLL_MS = 500
+# core/records_db.py: fold the WAL journal into the database (background thread) past this size
+RECORDS_WAL_COMPACT_BYTES = 1024 * 1024
+# same, during bulk imports (python -m core.gestor_registros import): checkpoint between batches
+RECORDS_BULK_WAL_BYTES = 64 * 1024 * 1024
+# PantallaRecords: rows fetched from the records store per page (virtualized list)
+RECORDS_PAGE_SIZE = 50
+
+# settings.json writer thread (core/settings_writer.py): bursts within this window become one write
+SETTINGS_COALESCE_MS = 200
+# snapshot of the run in progress (core/snapshot.py), offered for resume at startup
+RUN_SNAPSHOT_PATH = os.path.join(os.getcwd(), 'data', 'run.snap')
+# while a run is in flow its snapshot is rewritten this often, so the stored cronómetro stays current
+RUN_SNAPSHOT_REFRESH_MS = 1000
+# headless simulation (core/headless.py): simulated ms per frame (timers stay exact, animations
+# are just sampled more coarsely), frames between scripted inputs, and a hard stop
+HEADLESS_FRAME_MS = 250
+HEADLESS_ACT_EVERY = 2
+HEADLESS_MAX_FRAMES = 20000
 
 # Gameplay defaults
 DEFAULT_LIVES = 10
@@ -0,0 +1,146 @@
+"""Seguimiento de regiones modificadas (dirty rects) para `display.update`.
+
+Las pantallas, el HUD, el puntero y los overlays registran aquí los
+rectángulos que pueden haber cambiado en el frame. Al presentar, el
+controlador llama a `pygame.display.update(rects)` con las regiones
+fusionadas, o hace un `flip()` completo si el área cambiada supera el umbral
+(o si alguien pidió un frame completo: cambio de pantalla, resize, modal...).
+
+Cada región registrada se vuelve a actualizar en el frame siguiente: así lo
+que se movió o desapareció (puntero, hover, texto que se acorta) también se
+borra en la ventana sin que quien dibuja tenga que recordar su posición previa.
+"""
+import pygame
+
+from core.constants import DIRTY_FULL_FLIP_RATIO, DIRTY_MAX_RECTS, DIRTY_MERGE_MARGIN
+
+
+def merge_rects(rects, margin=DIRTY_MERGE_MARGIN, max_rects=DIRTY_MAX_RECTS):
+    """Fusiona rectángulos que se solapan (o quedan a menos de `margin` px).
+
+    Si tras fusionar quedan más de `max_rects`, devuelve su unión como un único rect.
+    """
+    merged = []
+    for r in rects:
+        r = pygame.Rect(r)
+        changed = True
+        while changed:
+            changed = False
+            grown = r.inflate(margin * 2, margin * 2)
+            for i, other in enumerate(merged):
+                if grown.colliderect(other):
+                    r = r.union(merged.pop(i))
+                    changed = True
+                    break
+        merged.append(r)
+    if len(merged) > max_rects:
+        return [merged[0].unionall(merged[1:])]
+    return merged
+
+
+class DirtyTracker:
+    """Acumula las regiones de un frame y decide entre `update(rects)` y `flip()`."""
+
+    def __init__(self, full_ratio=DIRTY_FULL_FLIP_RATIO, max_rects=DIRTY_MAX_RECTS):
+        self.full_ratio = float(full_ratio)
+        self.max_rects = int(max_rects)
+        self._rects = []
+        self._carry = []
+        self._full = True
+        self._size = None
+        # collect() result for the current frame (False = not computed yet)
+        self._collected = False
+        # counters for stats()
+        self.frames = 0
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.idle_frames = 0
+        self.pixels = 0
+
+    def begin_frame(self, size):
+        """Empieza un frame nuevo; un cambio de tamaño fuerza un frame completo."""
+        size = tuple(size)
+        if size != self._size:
+            self._size = size
+            self._full = True
+        self._rects = list(self._carry)
+        self._carry = []
+        self._collected = False
+
+    def add(self, rect):
+        """Registra una región modificada (también se actualizará el frame siguiente)."""
+        if rect is None:
+            return
+        r = pygame.Rect(rect)
+        if r.w <= 0 or r.h <= 0:
+            return
+        self._rects.append(r)
+        self._carry.append(r)
+        self._collected = False
+
+    def mark_full(self):
+        """El frame actual se presentará con `flip()` completo."""
+        self._full = True
+        self._collected = False
+
+    @property
+    def full(self):
+        return self._full
+
+    def collect(self):
+        """Rects a presentar, o None si corresponde un `flip()` completo.
+
+        El resultado se reutiliza hasta el próximo `add`/`mark_full`, así el
+        post-proceso y `present()` trabajan sobre las mismas regiones.
+        """
+        if self._collected is not False:
+            return self._collected
+        rects = None
+        if not self._full and self._size is not None:
+            screen_rect = pygame.Rect((0, 0), self._size)
+            clipped = [r.clip(screen_rect) for r in self._rects]
+            rects = merge_rects([r for r in clipped if r.w > 0 and r.h > 0], max_rects=self.max_rects)
+            area = sum(r.w * r.h for r in rects)
+            if area > self.full_ratio * screen_rect.w * screen_rect.h:
+                rects = None
+        self._collected = rects
+        return rects
+
+    def present(self):
+        """Lleva el frame a la ventana y devuelve los rects usados (None = flip completo)."""
+        rects = self.collect()
+        self.frames += 1
+        if rects is None:
+            pygame.display.flip()
+            self.full_frames += 1
+            if self._size is not None:
+                self.pixels += self._size[0] * self._size[1]
+        elif rects:
+            pygame.display.update(rects)
+            self.partial_frames += 1
+            self.pixels += sum(r.w * r.h for r in rects)
+        else:
+            self.idle_frames += 1
+        self._full = False
+        self._rects = []
+        self._collected = False
+        return rects
+
+    def stats(self):
+        return {
+            'frames': self.frames,
+            'full': self.full_frames,
+            'partial': self.partial_frames,
+            'idle': self.idle_frames,
+            'pixels': self.pixels,
+        }
+
+
+_dirty = None
+
+
+def get_dirty():
+    global _dirty
+    if _dirty is None:
+        _dirty = DirtyTracker()
+    return _dirty
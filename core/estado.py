@@ -1,15 +1,16 @@
-import time
 import json
 import os
 from core.constants import DEFAULT_LIVES
+from core.splits import SplitTimer
+from core.settings_writer import get_settings_writer
 
 
 class EstadoGlobal:
     """Estado global mínimo: nombre y cronómetro."""
     def __init__(self):
         self.nombre = None
-        self.cronometro_inicio = None
-        self.cronometro_fin = None
+        # cronómetro: monotonic, with split times per minigame
+        self.timer = SplitTimer()
         # selected avatar path
         self.avatar = None
         # vidas del jugador (usar DEFAULT_LIVES desde constants)
@@ -27,50 +28,31 @@ class EstadoGlobal:
         except Exception:
             # ignore persistence errors
             self._settings_path = None
-        # last write timestamp for throttling saves
-        try:
-            self._last_settings_write = 0.0
-        except Exception:
-            self._last_settings_write = 0.0
 
     def iniciar_cronometro(self):
-        """Start or resume the stopwatch.
+        """Start or resume the stopwatch (no-op if already running).
 
-        Behavior:
-        - If never started, set start=time.time().
-        - If stopped (cronometro_fin set), resume by shifting start so elapsed time is preserved.
-        - If already running, do nothing.
+        Paused time (rules, Simon playback) is not counted; see core/splits.py.
         """
-        now = time.time()
-        # never started
-        if self.cronometro_inicio is None:
-            self.cronometro_inicio = now
-            self.cronometro_fin = None
-            return
-        # was running and not stopped -> keep running
-        if self.cronometro_fin is None:
-            return
-        # was stopped, resume preserving elapsed
-        try:
-            elapsed = float(self.cronometro_fin - self.cronometro_inicio)
-            # set start so that (now - start) == elapsed
-            self.cronometro_inicio = now - elapsed
-            self.cronometro_fin = None
-        except Exception:
-            # fallback: restart from now
-            self.cronometro_inicio = now
-            self.cronometro_fin = None
+        self.timer.resume()
 
     def detener_cronometro(self):
-        # stop only if it was running; keep last end time
-        if self.cronometro_inicio is not None and self.cronometro_fin is None:
-            self.cronometro_fin = time.time()
+        # stop only if it was running; elapsed time is kept
+        self.timer.pause()
+
+    def reiniciar_cronometro(self):
+        self.timer.reset()
+
+    def marcar_paso(self, paso):
+        """From now on the stopwatch counts towards minigame `paso` (split times)."""
+        self.timer.set_step(paso)
 
     def tiempo_transcurrido(self):
-        if self.cronometro_inicio is None:
-            return 0.0
-        end = self.cronometro_fin if self.cronometro_fin is not None else time.time()
-        return end - self.cronometro_inicio
+        return self.timer.elapsed()
+
+    def tiempos_parciales(self):
+        """{minijuego: segundos} of the current run."""
+        return self.timer.splits()
 
     # helpers para settings
     def set_brightness(self, value: float):
@@ -138,14 +120,6 @@ class EstadoGlobal:
     def _save_settings(self):
         if not hasattr(self, '_settings_path') or not self._settings_path:
             return
-        # throttle frequent saves (e.g., while dragging sliders)
-        try:
-            now = time.time()
-            if now - getattr(self, '_last_settings_write', 0.0) < 0.25:
-                return
-            self._last_settings_write = now
-        except Exception:
-            pass
         # Persist minimal settings only (do NOT persist brightness/contrast/volume)
         data = {}
         # include avatar if available
@@ -159,8 +133,8 @@ class EstadoGlobal:
                 data['vidas'] = int(self.vidas)
             except Exception:
                 data['vidas'] = None
-            with open(self._settings_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f)
+            # written by the background writer: bursts coalesce, the last state always lands
+            get_settings_writer().submit(self._settings_path, data)
         except Exception:
             # don't raise on save failure
             pass
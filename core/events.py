@@ -0,0 +1,122 @@
+"""Enrutado de eventos y búsqueda de zonas clicables.
+
+`EventRouter.route(events)` prepara los eventos de un frame antes de que
+`AppController` los reparta a la pantalla activa:
+
+- los MOUSEMOTION del frame se colapsan en uno solo (el último, con `rel`
+  acumulado): un arrastre rápido genera decenas por frame y cada pantalla
+  recalculaba su hover con cada uno;
+- los eventos de ventana (resize, expose...) van a los manejadores
+  registrados con `on(tipos, fn)` en vez de a una cadena de if/elif.
+
+`HitIndex` es un índice espacial de grilla uniforme: cada zona (`add(rect,
+target)`) se anota en las celdas de `HIT_CELL_PX` que cubre y `hit(pos)`
+solo revisa las zonas de la celda del punto, así que un clic o un hover
+cuesta lo mismo con 4 zonas que con 400. Las pantallas lo rellenan al
+maquetar (solo cuando cambia el tamaño de la ventana) con los mismos
+rectángulos que dibujan.
+"""
+import pygame
+
+from core.constants import HIT_CELL_PX
+
+
+def coalesce_motion(events):
+    """`events` con un único MOUSEMOTION (el último, en su posición y con `rel` sumado)."""
+    last = None
+    dx = dy = 0
+    motions = 0
+    for ev in events:
+        if ev.type == pygame.MOUSEMOTION:
+            motions += 1
+            last = ev
+            rel = getattr(ev, 'rel', (0, 0))
+            dx += rel[0]
+            dy += rel[1]
+    if motions < 2:
+        return list(events)
+    merged = pygame.event.Event(pygame.MOUSEMOTION, pos=last.pos, rel=(dx, dy),
+                                buttons=getattr(last, 'buttons', (0, 0, 0)))
+    return [merged if ev is last else ev for ev in events if ev.type != pygame.MOUSEMOTION or ev is last]
+
+
+class EventRouter:
+    """Prepara los eventos del frame y despacha los de sistema a sus manejadores."""
+
+    def __init__(self):
+        self._handlers = {}     # event type -> [fn]
+        self.received = 0
+        self.coalesced = 0
+
+    def on(self, types, handler):
+        """Llama a `handler(evento)` para cada evento de `types`; si devuelve True, el evento se consume."""
+        if isinstance(types, int):
+            types = (types,)
+        for t in types:
+            if t is not None and t >= 0:
+                self._handlers.setdefault(t, []).append(handler)
+
+    def route(self, events):
+        """Eventos del frame ya colapsados, sin los que consumió algún manejador."""
+        events = list(events)
+        self.received += len(events)
+        merged = coalesce_motion(events)
+        self.coalesced += len(events) - len(merged)
+        out = []
+        for ev in merged:
+            consumed = False
+            for handler in self._handlers.get(ev.type, ()):
+                try:
+                    consumed = bool(handler(ev)) or consumed
+                except Exception:
+                    pass
+            if not consumed:
+                out.append(ev)
+        return out
+
+    def stats(self):
+        return {'received': self.received, 'coalesced': self.coalesced}
+
+
+class HitIndex:
+    """Zonas clicables en una grilla uniforme; `hit(pos)` devuelve la de más arriba."""
+
+    def __init__(self, cell=HIT_CELL_PX):
+        self.cell = int(cell)
+        self._cells = {}        # (cx, cy) -> [(rect, target)] in registration order
+        self._count = 0
+        # layout the regions belong to (e.g. window size); see `stale()`
+        self.key = None
+
+    def clear(self, key=None):
+        self._cells.clear()
+        self._count = 0
+        self.key = key
+
+    def stale(self, key):
+        """True si las zonas no corresponden a `key` (hay que volver a maquetar)."""
+        return self.key != key or not self._count
+
+    def add(self, rect, target):
+        """Registra `rect` → `target`; las zonas agregadas después quedan encima."""
+        r = pygame.Rect(rect)
+        if r.w <= 0 or r.h <= 0:
+            return
+        c = self.cell
+        entry = (r, target)
+        for cx in range(r.left // c, (r.right - 1) // c + 1):
+            for cy in range(r.top // c, (r.bottom - 1) // c + 1):
+                self._cells.setdefault((cx, cy), []).append(entry)
+        self._count += 1
+
+    def hit(self, pos, default=None):
+        x, y = int(pos[0]), int(pos[1])
+        bucket = self._cells.get((x // self.cell, y // self.cell))
+        if bucket:
+            for r, target in reversed(bucket):
+                if r.collidepoint(x, y):
+                    return target
+        return default
+
+    def __len__(self):
+        return self._count
@@ -0,0 +1,102 @@
+"""Registro de fuentes: resuelve cada (familia, tamaño, negrita) una sola vez.
+
+`pygame.font.SysFont` hace una búsqueda de fuentes del sistema en cada llamada;
+las pantallas piden sus fuentes aquí y reciben siempre el mismo objeto `Font`.
+"""
+import pygame
+
+from core.constants import DEFAULT_FONT_FAMILY, FONT_SIZES
+
+# Family used for the gear glyph ('⚙') on the start/registro screens
+SYMBOL_FONT_FAMILY = 'Segoe UI Symbol'
+
+# (size, bold, family) combinations used by the screens; preloaded by warm()
+WARM_FONTS = [
+    (16, False, DEFAULT_FONT_FAMILY),
+    (18, False, DEFAULT_FONT_FAMILY),
+    (18, True, DEFAULT_FONT_FAMILY),
+    (20, False, DEFAULT_FONT_FAMILY),
+    (20, True, DEFAULT_FONT_FAMILY),
+    (22, False, DEFAULT_FONT_FAMILY),
+    (22, True, DEFAULT_FONT_FAMILY),
+    (26, True, DEFAULT_FONT_FAMILY),
+    (28, False, DEFAULT_FONT_FAMILY),
+    (28, True, DEFAULT_FONT_FAMILY),
+    (30, True, DEFAULT_FONT_FAMILY),
+    (32, True, DEFAULT_FONT_FAMILY),
+    (34, True, DEFAULT_FONT_FAMILY),
+    (36, True, DEFAULT_FONT_FAMILY),
+    (40, True, DEFAULT_FONT_FAMILY),
+    (56, True, DEFAULT_FONT_FAMILY),
+    (20, False, SYMBOL_FONT_FAMILY),
+    (22, False, None),
+]
+
+
+class FontRegistry:
+    """Caché de objetos `pygame.font.Font` compartidos.
+
+    `family=None` equivale a `pygame.font.Font(None, size)` (fuente por defecto
+    de pygame); cualquier otro valor se resuelve con `SysFont`.
+    """
+
+    def __init__(self):
+        self._fonts = {}
+        # real font resolutions vs. requests served from the registry
+        self.lookups = 0
+        self.requests = 0
+        self.avoided = 0
+
+    def get(self, size, bold=False, family=DEFAULT_FONT_FAMILY):
+        key = (family, int(size), bool(bold))
+        self.requests += 1
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._resolve(*key)
+            self._fonts[key] = font
+        else:
+            self.avoided += 1
+        return font
+
+    def role(self, name, bold=False):
+        """Fuente para un rol de `FONT_SIZES` ('title', 'text', 'small', ...)."""
+        return self.get(FONT_SIZES[name], bold=bold)
+
+    def _resolve(self, family, size, bold):
+        self.lookups += 1
+        if family is None:
+            font = pygame.font.Font(None, size)
+            if bold:
+                font.set_bold(True)
+            return font
+        return pygame.font.SysFont(family, size, bold=bold)
+
+    def warm(self, specs=None):
+        """Precarga las fuentes conocidas (por defecto WARM_FONTS y los roles de FONT_SIZES)."""
+        if specs is None:
+            specs = list(WARM_FONTS) + [(s, b, DEFAULT_FONT_FAMILY) for s in FONT_SIZES.values() for b in (False, True)]
+        for size, bold, family in specs:
+            key = (family, int(size), bool(bold))
+            if key not in self._fonts:
+                try:
+                    self._fonts[key] = self._resolve(*key)
+                except Exception:
+                    pass
+
+    def stats(self):
+        return {
+            'fonts': len(self._fonts),
+            'requests': self.requests,
+            'lookups': self.lookups,
+            'avoided': self.avoided,
+        }
+
+
+_fonts = None
+
+
+def get_fonts():
+    global _fonts
+    if _fonts is None:
+        _fonts = FontRegistry()
+    return _fonts
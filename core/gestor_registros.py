@@ -1,50 +1,237 @@
-"""Gestor sencillo de records: guarda y carga JSON en data/records.json"""
-import json
+"""Gestor de records: historial completo en SQLite (data/records.db).
+
+Los records se guardan en `core.records_db` (modo WAL, sin límite de
+historial, columnas indexadas). `RecordsRepository` mantiene en memoria el
+leaderboard que se muestra (top `MAX_RECORDS`) y solo vuelve a consultarlo
+cuando se escribe a través del propio repositorio o cuando otro proceso
+modifica la base (`PRAGMA data_version`, comprobado como mucho cada
+`RECORDS_POLL_MS`). Las pantallas abiertas se suscriben y reciben la lista
+nueva en `on_records_changed(records)`.
+
+"Quedaste #N de M" (`placement()`) sale de dos consultas indexadas, sin
+cargar el historial; las páginas del ranking (`top()`) y el mejor tiempo
+por jugador (`query()`) también se resuelven en SQLite. Benchmark con 1M de
+records: `python -m core.records_db`.
+
+Si la base no existe todavía, se crea importando el `data/records.json` del
+formato anterior.
+
+Para juntar los records de varios kioscos (CSV / JSONL, ver `core.records_io`):
+
+    python -m core.gestor_registros export records.csv
+    python -m core.gestor_registros import kiosco1.jsonl kiosco2.csv
+    python -m core.gestor_registros merge -o todos.jsonl a.json b.csv c.jsonl
+"""
+import argparse
+import sys
+import time
+import weakref
 from datetime import datetime
 from pathlib import Path
 
+from core.avatars import avatar_id
+from core.constants import RECORDS_POLL_MS
+from core.records_db import RecordsDB
+from core.records_io import export_file, import_file, merge_files
+from core.records_query import RecordsQuery
+
 
 RUTA = Path(__file__).resolve().parents[1] / 'data' / 'records.json'
+RUTA_DB = RUTA.with_name('records.db')
+MAX_RECORDS = 5
+
+
+class RecordsRepository:
+    """Leaderboard en memoria sobre la base SQLite, con detección de cambios y suscriptores."""
+
+    def __init__(self, path=RUTA_DB, legacy_json=RUTA, poll_ms=RECORDS_POLL_MS):
+        self.path = Path(path)
+        self.legacy_json = Path(legacy_json) if legacy_json else None
+        self.poll_ms = poll_ms
+        self._db = None
+        self._query = None
+        self._records = None
+        self._signature = None
+        self._last_poll = 0.0
+        self._listeners = weakref.WeakSet()
+        self.loads = 0
+
+    @property
+    def db(self):
+        if self._db is None:
+            fresh = not self.path.exists()
+            self._db = RecordsDB(self.path)
+            if fresh and self.legacy_json is not None and self.legacy_json.exists():
+                # first run on this machine: bring over the old JSON leaderboard
+                self._db.import_json(self.legacy_json)
+        return self._db
+
+    def _load(self):
+        self.loads += 1
+        try:
+            records = self.db.top(MAX_RECORDS)
+            self._signature = self.db.data_version()
+        except Exception:
+            records = []
+        self._records = records
+
+    def all(self):
+        """Leaderboard visible (top `MAX_RECORDS`; compartido: no modificarlo)."""
+        if self._records is None:
+            self._load()
+        return self._records
+
+    def top(self, limit=MAX_RECORDS, offset=0):
+        """Página del historial completo ordenado por tiempo."""
+        return self.db.top(limit, offset)
+
+    def count(self):
+        return self.db.count()
+
+    def query(self):
+        """Consultas con filtros y agregados (`core.records_query`)."""
+        if self._query is None:
+            self._query = RecordsQuery(self.db)
+        return self._query
+
+    def placement(self, tiempo):
+        """(puesto, total) que corresponde a `tiempo` en el historial completo."""
+        # indexed COUNT(*) queries: a few ms even with the whole history, on the game thread
+        return self.db.rank(round(float(tiempo), 2)), self.db.count()
+
+    def import_json(self, path):
+        """Importa un `records.json`; devuelve cuántos records nuevos entraron."""
+        added = self.db.import_json(path)
+        self.db.compact_async()
+        if added:
+            self._refresh()
+        return added
+
+    def poll(self, force=False):
+        """Recarga si otro proceso escribió en la base; devuelve True si hubo cambios."""
+        now = time.monotonic()
+        if self._records is not None and not force and (now - self._last_poll) * 1000.0 < self.poll_ms:
+            return False
+        self._last_poll = now
+        try:
+            if self._records is not None and self.db.data_version() == self._signature:
+                return False
+        except Exception:
+            return False
+        previous = self._records
+        self._load()
+        if previous is not None and previous != self._records:
+            self._notify()
+            return True
+        return False
+
+    def add(self, nombre, tiempo, avatar=None, splits=None):
+        entry = {
+            'name': nombre,
+            'time': round(float(tiempo), 2),
+            'date': datetime.now().strftime('%Y-%m-%d')
+        }
+        if avatar:
+            try:
+                # store the id (file name), not this machine's absolute path
+                entry['avatar'] = avatar_id(avatar)
+            except Exception:
+                entry['avatar'] = None
+        # exact duplicates (same name, time, date, avatar) are ignored by the unique index
+        self.db.insert(entry['name'], entry['time'], entry['date'], entry.get('avatar'), splits)
+        self.db.compact_async()
+        self._refresh()
+        return entry
+
+    def _refresh(self):
+        self._load()
+        self._notify()
+
+    def subscribe(self, listener):
+        """Registra un objeto con `on_records_changed(records)` (referencia débil)."""
+        self._listeners.add(listener)
+
+    def unsubscribe(self, listener):
+        self._listeners.discard(listener)
+
+    def _notify(self):
+        for listener in list(self._listeners):
+            try:
+                listener.on_records_changed(self._records)
+            except Exception:
+                pass
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+            self._query = None
+
+
+_repo = None
+
+
+def get_records():
+    global _repo
+    if _repo is None:
+        _repo = RecordsRepository()
+    return _repo
 
 
 def cargar_registros():
-    RUTA.parent.mkdir(parents=True, exist_ok=True)
-    if not RUTA.exists():
-        RUTA.write_text('[]', encoding='utf-8')
-        return []
+    repo = get_records()
+    repo.poll()
+    return repo.all()
+
+
+def guardar_registro(nombre, tiempo, avatar=None, splits=None):
+    """Guarda el record (con sus tiempos por minijuego); devuelve (puesto, total) en el historial completo, o None."""
+    repo = get_records()
+    entry = repo.add(nombre, tiempo, avatar, splits)
     try:
-        with open(RUTA, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return repo.placement(entry['time'])
     except Exception:
-        return []
+        return None
 
 
-def guardar_registro(nombre, tiempo, avatar=None):
-    registros = cargar_registros()
-    entry = {
-        'name': nombre,
-        'time': round(float(tiempo), 2),
-        'date': datetime.now().strftime('%Y-%m-%d')
-    }
-    if avatar:
-        try:
-            entry['avatar'] = str(avatar)
-        except Exception:
-            entry['avatar'] = None
-    # append and keep unique entries (avoid exact duplicates)
-    registros.append(entry)
-    # sort by time (ascending)
-    registros.sort(key=lambda r: r.get('time', 999999))
-    # remove exact duplicates (same name, time, date, avatar)
-    unique = []
-    seen = set()
-    for r in registros:
-        key = (r.get('name'), float(r.get('time', 0.0)), r.get('date'), r.get('avatar'))
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(r)
-    # keep only top 5 fastest records
-    limited = unique[:5]
-    with open(RUTA, 'w', encoding='utf-8') as f:
-        json.dump(limited, f, ensure_ascii=False, indent=4)
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m core.gestor_registros',
+                                     description='Importa, exporta y une records (CSV / JSONL).')
+    parser.add_argument('--db', default=str(RUTA_DB), help='base de records (por defecto data/records.db)')
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    p = sub.add_parser('export', help='escribe todos los records de la base en un archivo')
+    p.add_argument('output')
+    p = sub.add_parser('import', help='agrega a la base los records de uno o más archivos')
+    p.add_argument('inputs', nargs='+')
+    p = sub.add_parser('merge', help='une archivos sin duplicados, sin tocar la base')
+    p.add_argument('inputs', nargs='+')
+    p.add_argument('-o', '--output', required=True)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.cmd == 'merge':
+            results, written = merge_files(args.inputs, args.output)
+        else:
+            # only the kiosk's own base picks up the old records.json on first use
+            legacy = RUTA if Path(args.db).resolve() == RUTA_DB else None
+            repo = RecordsRepository(args.db, legacy_json=legacy)
+            try:
+                if args.cmd == 'export':
+                    results, written = {}, export_file(repo.db, args.output)
+                else:
+                    results, written = {path: import_file(repo.db, path) for path in args.inputs}, None
+            finally:
+                repo.close()
+    except (OSError, ValueError) as e:
+        print(f'error: {e}', file=sys.stderr)
+        return 1
+    for path, r in results.items():
+        print(f"{path}: {r['read']} leídos, {r['added']} nuevos, "
+              f"{r['duplicates']} duplicados, {r['skipped']} inválidos")
+    if written is not None:
+        print(f'{written} records escritos en {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,334 @@
+"""Simulación sin pantalla de partidas completas.
+
+    python -m core.headless [--runs N] [--db RUTA] [--frame-ms MS] [--max-frames N]
+
+Arranca `AppController` con los drivers `dummy` de SDL (sin ventana ni
+audio) y lo maneja con un piloto automático que genera, frame a frame, los
+eventos de un jugador que acierta todo: Registro → Reglas/César → Juego 2 →
+Parejas → Simon → Records. El tiempo es virtual: `Clock.tick` y
+`pygame.event.wait` avanzan `pygame.time.get_ticks()` en lugar de dormir, y
+el cronómetro de la partida (`core.splits`) lee ese mismo reloj. Cada frame
+simulado dura `HEADLESS_FRAME_MS` (no 1/60 s): los temporizadores de
+`core.scheduler` vencen igual, solo las animaciones se muestrean más
+grueso, así que una partida de un minuto de juego se simula en bastante
+menos de un segundo.
+
+Records, snapshot, settings y miniaturas de avatares van a un directorio
+temporal (los records, a `--db` si se indica), nunca a `data/` del kiosco. Al final informa frames, tiempo por pantalla y si se
+guardó el record de cada partida.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import types
+
+import pygame
+
+from core.constants import HEADLESS_ACT_EVERY, HEADLESS_FRAME_MS, HEADLESS_MAX_FRAMES
+
+
+class VirtualTime:
+    """Reloj virtual en ms que sustituye a `get_ticks`, `Clock` y `event.wait` mientras está instalado.
+
+    `Clock.tick()` avanza `frame_ms` sea cual sea el fps pedido.
+    """
+
+    def __init__(self, frame_ms=HEADLESS_FRAME_MS):
+        self.ms = 0
+        self.frame_ms = int(frame_ms)
+        self._saved = None
+
+    def install(self):
+        import core.splits
+        vt = self
+
+        class Clock:
+            def __init__(self):
+                self._fps = 0.0
+
+            def tick(self, fps=0):
+                vt.ms += vt.frame_ms
+                self._fps = 1000.0 / vt.frame_ms if vt.frame_ms else 0.0
+                return vt.frame_ms
+
+            def get_fps(self):
+                return self._fps
+
+        def wait(timeout=0):
+            vt.ms += max(0, int(timeout))
+            return pygame.event.Event(pygame.NOEVENT)
+
+        self._saved = (pygame.time.get_ticks, pygame.time.Clock, pygame.event.wait, core.splits.time)
+        pygame.time.get_ticks = lambda: self.ms
+        pygame.time.Clock = Clock
+        pygame.event.wait = wait
+        # the run timer measures simulated play time, not how fast the simulation ran
+        core.splits.time = types.SimpleNamespace(perf_counter_ns=lambda: self.ms * 1000000)
+
+    def uninstall(self):
+        import core.splits
+        if self._saved is not None:
+            pygame.time.get_ticks, pygame.time.Clock, pygame.event.wait, core.splits.time = self._saved
+            self._saved = None
+
+
+class Autopilot:
+    """Eventos de un jugador sin errores según la pantalla activa de `ctrl`.
+
+    Actúa cada `act_every` frames, para que las pantallas tengan tiempo de
+    dibujarse (y de calcular sus rectángulos) entre una entrada y la siguiente.
+    Cada partida juega con otro nombre (`bot1`, `bot2`...) y se da por
+    guardada solo si la base de `repo` tiene una fila más al llegar a records.
+    """
+
+    def __init__(self, ctrl, repo, runs=1, name='bot', act_every=HEADLESS_ACT_EVERY, max_frames=HEADLESS_MAX_FRAMES):
+        self.ctrl = ctrl
+        self.repo = repo
+        self.runs = runs
+        self.name = name
+        self.act_every = act_every
+        self.max_frames = max_frames
+        self.frame = 0
+        self.results = []       # one dict per run that reached the records screen
+        self.timed_out = False
+        self._reg_phase = 0
+        self._in_records = False
+        self._rows_before = 0
+
+    def events(self):
+        """Eventos de este frame (llamar una vez por frame)."""
+        self.frame += 1
+        out = []
+        if self.frame > self.max_frames:
+            self.timed_out = True
+            return [pygame.event.Event(pygame.QUIT)]
+        if self.frame % self.act_every:
+            return out
+        modo = self.ctrl.modo
+        if modo == 'inicio':
+            self._registro(out)
+        elif modo == 'flow' and self.ctrl.pantalla_actual is not None:
+            self._flow(self.ctrl.pantalla_actual, out)
+        elif modo == 'records':
+            self._records(out)
+        return out
+
+    @staticmethod
+    def _click(out, pos):
+        out.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+        out.append(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=pos))
+
+    @staticmethod
+    def _type(out, text, enter=False):
+        for ch in text:
+            out.append(pygame.event.Event(pygame.KEYDOWN, key=0, unicode=ch, mod=0, scancode=0))
+        if enter:
+            out.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, unicode='\r', mod=0, scancode=0))
+
+    def _registro(self, out):
+        reg = self.ctrl.inicio
+        if reg is None:
+            return
+        if reg.intro_active:
+            if reg.intro_state == 'wait':
+                self._click(out, self.ctrl.pantalla.get_rect().center)
+            return
+        if self._reg_phase == 0:
+            # a distinct name per run: identical replays would be dropped by the unique index
+            self._type(out, f'{self.name}{len(self.results) + 1}')
+            self._rows_before = self.repo.count()
+            self._reg_phase = 1
+        elif self._reg_phase == 1:
+            # the grid is laid out on the first draw
+            if reg.grid.rect.w > 0:
+                self._click(out, reg.grid.cell_rect(0).center)
+                self._reg_phase = 2
+        elif self._reg_phase == 2:
+            self._click(out, reg.accept_rect.center)
+            self._reg_phase = 3
+
+    def _flow(self, scr, out):
+        name = type(scr).__name__
+        if name == 'PantallaReglas':
+            self._type(out, '', enter=True)
+        elif name == 'PantallaJuegoCesar':
+            if not scr.completed:
+                self._type(out, scr.original, enter=True)
+        elif name == 'PantallaJuego2':
+            if not scr.completed and scr.btn_rects:
+                self._click(out, scr.btn_rects[scr.correct_index].center)
+        elif name == 'PantallaJuegoParejas':
+            if scr.completed or self.ctrl.scheduler.pending(scr._hide_unmatched) or not scr.card_rects:
+                return
+            for i in range(8):
+                if scr.locked[i] or scr.revealed[i]:
+                    continue
+                for j in range(i + 1, 8):
+                    if not scr.locked[j] and scr.deck[j] is scr.deck[i]:
+                        self._click(out, scr.card_rects[i].center)
+                        self._click(out, scr.card_rects[j].center)
+                        return
+        elif name == 'PantallaJuegoSimon':
+            if scr.player_allowed and not scr.playing and not scr.finished and scr.pad_rects:
+                step = len(scr.player)
+                if step < len(scr.sequence):
+                    self._click(out, scr.pad_rects[scr.sequence[step]].center)
+
+    def _records(self, out):
+        if not self._in_records:
+            self._in_records = True
+            e = self.ctrl.estado
+            self.results.append({
+                # estado.record_saved is set even when the insert was ignored as a duplicate
+                'record_saved': self.repo.count() > self._rows_before,
+                'puesto': getattr(e, 'ultimo_puesto', None),
+                'tiempo': e.tiempo_transcurrido(),
+                'vidas': getattr(e, 'vidas', None),
+            })
+        if len(self.results) >= self.runs:
+            out.append(pygame.event.Event(pygame.QUIT))
+            return
+        # replay: back to the registro for the next run
+        rec = self.ctrl.pantalla_records
+        if rec is not None and rec.back_rect.w > 0:
+            self._click(out, rec.back_rect.center)
+            self._in_records = False
+            self._reg_phase = 0
+
+
+class ScreenTimes:
+    """Frames, tiempo simulado y tiempo real por pantalla, en orden de aparición."""
+
+    def __init__(self, vt):
+        self.vt = vt
+        self.rows = {}          # label -> [frames, simulated ms, wall s]
+        self._label = None
+        self._mark = None
+
+    @staticmethod
+    def label(ctrl):
+        if ctrl.modo == 'inicio':
+            return 'Registro'
+        if ctrl.modo == 'records':
+            return 'Records'
+        scr = ctrl.pantalla_actual
+        return getattr(scr, 'titulo', None) or type(scr).__name__
+
+    def tick(self, ctrl):
+        """Cierra el frame anterior (cargándolo a su pantalla) y abre uno nuevo."""
+        now = (self.vt.ms, time.perf_counter())
+        if self._label is not None:
+            row = self.rows.setdefault(self._label, [0, 0, 0.0])
+            row[0] += 1
+            row[1] += now[0] - self._mark[0]
+            row[2] += now[1] - self._mark[1]
+        self._label = self.label(ctrl)
+        self._mark = now
+
+
+def simulate(runs=1, db=None, frame_ms=HEADLESS_FRAME_MS, max_frames=HEADLESS_MAX_FRAMES, size=(900, 600)):
+    """Juega `runs` partidas seguidas sin pantalla; devuelve un dict con los resultados."""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    import core.avatars as avatars
+    import core.gestor_registros as gestor
+    from core.app_controller import AppController
+    from core.estado import EstadoGlobal
+    from core.settings_writer import get_settings_writer
+    from core.snapshot import SnapshotStore
+
+    vt = VirtualTime(frame_ms)
+    vt.install()
+    tmp = tempfile.TemporaryDirectory(prefix='escape-headless-')
+    prev_repo = gestor._repo
+    prev_avatars = avatars._avatars
+    repo = None
+    try:
+        # records go to a scratch base unless one is given (never the kiosk's old records.json)
+        repo = gestor.RecordsRepository(db or os.path.join(tmp.name, 'records.db'), legacy_json=None)
+        gestor._repo = repo
+        # AppController warms the avatar thumbnails: write them to the scratch dir too
+        avatars._avatars = avatars.AvatarThumbs(cache_dir=os.path.join(tmp.name, 'thumbs'))
+        pygame.init()
+        pantalla = pygame.display.set_mode(size)
+        estado = EstadoGlobal()
+        estado._settings_path = None
+        # the scheduler reads get_ticks when created: after vt.install()
+        ctrl = AppController(pantalla, estado)
+        ctrl.snapshots = SnapshotStore(os.path.join(tmp.name, 'run.snap'))
+        ctrl.resume_offer = None
+
+        pilot = Autopilot(ctrl, repo, runs=runs, max_frames=max_frames)
+        times = ScreenTimes(vt)
+        real_get = pygame.event.get
+
+        def get(*args, **kwargs):
+            times.tick(ctrl)
+            return pilot.events()
+
+        pygame.event.get = get
+        t0 = time.perf_counter()
+        try:
+            ctrl.run()
+        finally:
+            pygame.event.get = real_get
+        wall = time.perf_counter() - t0
+        times.tick(ctrl)
+        return {
+            'frames': pilot.frame,
+            'wall_s': wall,
+            'simulated_ms': vt.ms,
+            'screens': times.rows,
+            'runs': pilot.results,
+            'timed_out': pilot.timed_out,
+        }
+    finally:
+        gestor._repo = prev_repo
+        avatars._avatars = prev_avatars
+        if repo is not None:
+            repo.close()
+        get_settings_writer().close()
+        pygame.quit()
+        vt.uninstall()
+        tmp.cleanup()
+
+
+def report(result):
+    lines = [f"[Headless] {result['frames']} frames en {result['wall_s'] * 1000:.0f} ms "
+             f"({result['simulated_ms'] / 1000:.1f} s simulados)"]
+    for label, (frames, sim_ms, wall_s) in result['screens'].items():
+        lines.append(f"  {label:<18} {frames:>6} frames  {sim_ms / 1000:>7.1f} s sim  {wall_s * 1000:>8.1f} ms")
+    for n, r in enumerate(result['runs'], 1):
+        if r['record_saved']:
+            puesto = r['puesto']
+            where = f" (puesto {puesto[0]} de {puesto[1]})" if puesto else ''
+            lines.append(f"  partida {n}: record guardado{where}, tiempo {r['tiempo']:.1f} s")
+        else:
+            why = 'ya estaba en la base' if r['vidas'] else 'sin vidas'
+            lines.append(f"  partida {n}: sin record ({why})")
+    if result['timed_out']:
+        lines.append(f"  cortado tras {result['frames'] - 1} frames sin llegar a records")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m core.headless',
+                                     description='Simula partidas completas sin pantalla ni esperas.')
+    parser.add_argument('--runs', type=int, default=1, help='partidas seguidas (por defecto 1)')
+    parser.add_argument('--db', default=None, help='base de records (por defecto una temporal)')
+    parser.add_argument('--frame-ms', type=int, default=HEADLESS_FRAME_MS,
+                        help=f'ms simulados por frame (por defecto {HEADLESS_FRAME_MS}; 16 = 60 fps reales)')
+    parser.add_argument('--max-frames', type=int, default=HEADLESS_MAX_FRAMES,
+                        help=f'corta la simulación tras N frames (por defecto {HEADLESS_MAX_FRAMES})')
+    args = parser.parse_args(argv)
+
+    result = simulate(runs=max(1, args.runs), db=args.db, frame_ms=max(1, args.frame_ms), max_frames=args.max_frames)
+    print(report(result))
+    ok = not result['timed_out'] and len(result['runs']) >= args.runs and all(r['record_saved'] for r in result['runs'])
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
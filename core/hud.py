@@ -0,0 +1,143 @@
+"""HUD persistente (avatar, nombre, cronómetro y vidas) con panel cacheado.
+
+El panel se compone una sola vez y solo se vuelve a componer cuando cambia
+algo visible: nombre, avatar, vidas o el segundo entero que muestra el
+cronómetro. Los iconos (avatar escalado, vida llena y vida consumida) se
+guardan ya escalados en memoria.
+"""
+import pygame
+
+from core.assets import get_assets
+from core.avatars import get_avatars
+from core.constants import LIFE_ICON
+from core.dirty import get_dirty
+from core.fonts import get_fonts
+from core.text_cache import get_text_cache
+
+HUD_SIZE = (260, 88)
+HUD_MARGIN = 16
+AVATAR_SIZE = 56
+LIFE_SIZE = 14
+LIFE_SPACING = 6
+MAX_LIVES = 10
+
+
+class PersistentHud:
+    """Panel abajo a la derecha; `draw()` es barato mientras no cambie el contenido."""
+
+    def __init__(self):
+        self._panel = None
+        self._key = None
+        self._rect = None
+        self._avatar_path = None
+        self._avatar = None
+        self._life_full = None
+        self._life_empty = None
+        self.renders = 0
+
+    def _font(self):
+        try:
+            return get_fonts().get(22, family=None)
+        except Exception:
+            return get_fonts().get(20, family='Arial')
+
+    def _life_icons(self):
+        if self._life_empty is None:
+            try:
+                self._life_full = get_assets().get(LIFE_ICON, (LIFE_SIZE, LIFE_SIZE), mode='alpha', smooth=True)
+            except Exception:
+                self._life_full = None
+            # empty/consumed life (dim circle), built once
+            self._life_empty = pygame.Surface((LIFE_SIZE, LIFE_SIZE), pygame.SRCALPHA)
+            pygame.draw.circle(self._life_empty, (80, 80, 80, 90), (LIFE_SIZE//2, LIFE_SIZE//2), LIFE_SIZE//2)
+        return self._life_full, self._life_empty
+
+    def _avatar_icon(self, path):
+        if path != self._avatar_path:
+            self._avatar_path = path
+            self._avatar = None
+            if path:
+                try:
+                    self._avatar = get_avatars().get(path, (AVATAR_SIZE, AVATAR_SIZE))
+                except Exception:
+                    self._avatar = None
+        return self._avatar
+
+    @staticmethod
+    def _time_display(estado):
+        try:
+            tiempo = estado.tiempo_transcurrido()
+        except Exception:
+            tiempo = getattr(estado, 'cronometro', None)
+        try:
+            return f"{int(tiempo)}s" if tiempo is not None else ''
+        except Exception:
+            return str(tiempo) if tiempo is not None else ''
+
+    def _render(self, name, avatar_path, vidas, tiempo_display):
+        panel_w, panel_h = HUD_SIZE
+        panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        # grey-black palette
+        panel.fill((28, 30, 34, 220))
+        pygame.draw.rect(panel, (0, 0, 0), panel.get_rect(), 2, border_radius=14)
+
+        av = self._avatar_icon(avatar_path)
+        if av is not None:
+            panel.blit(av, (12, (panel_h - AVATAR_SIZE)//2))
+
+        font = self._font()
+        panel.blit(get_text_cache().render(font, name, (230, 230, 230)), (84, 16))
+        panel.blit(get_text_cache().render(font, tiempo_display, (190, 190, 190)), (84, 40))
+
+        # one icon per life, aligned to the right under name/time
+        full, empty = self._life_icons()
+        total_w = MAX_LIVES * LIFE_SIZE + (MAX_LIVES - 1) * LIFE_SPACING
+        start_x = panel_w - 12 - total_w
+        y_icon = 62
+        for i in range(MAX_LIVES):
+            x = start_x + i * (LIFE_SIZE + LIFE_SPACING)
+            if i < vidas:
+                if full is not None:
+                    panel.blit(full, (x, y_icon))
+                else:
+                    pygame.draw.circle(panel, (240, 180, 80), (x + LIFE_SIZE//2, y_icon + LIFE_SIZE//2), LIFE_SIZE//2)
+            else:
+                panel.blit(empty, (x, y_icon))
+        self.renders += 1
+        return panel
+
+    def draw(self, screen, estado):
+        """Dibuja el HUD; recompone el panel solo si cambió lo que muestra."""
+        w, h = screen.get_size()
+        panel_w, panel_h = HUD_SIZE
+        rect = pygame.Rect(w - panel_w - HUD_MARGIN, h - panel_h - HUD_MARGIN, panel_w, panel_h)
+        name = getattr(estado, 'nombre', None) or getattr(estado, 'name', '') or ''
+        try:
+            vidas = int(getattr(estado, 'vidas', None) or 0)
+        except Exception:
+            vidas = 0
+        key = (name, getattr(estado, 'avatar', None), vidas, self._time_display(estado))
+        if key != self._key or self._panel is None:
+            self._panel = self._render(*key)
+            self._key = key
+            get_dirty().add(rect)
+        if rect != self._rect:
+            get_dirty().add(rect)
+            self._rect = rect
+        screen.blit(self._panel, rect.topleft)
+        return rect
+
+    def invalidate(self):
+        self._panel = None
+        self._avatar_path = None
+        self._life_empty = None
+
+
+_hud = None
+
+
+def get_hud():
+    global _hud
+    if _hud is None:
+        _hud = PersistentHud()
+    return _hud
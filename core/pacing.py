@@ -0,0 +1,143 @@
+"""Ritmo de frames adaptativo para el bucle principal.
+
+Con animaciones activas (o justo después de una entrada del usuario) el
+bucle corre a la tasa completa (`fps`). Cuando la pantalla está quieta
+(registro esperando un nombre, records sin scroll) o la ventana no tiene el
+foco, se bloquea en `pygame.event.wait` con timeout: cualquier evento lo
+despierta al instante y, si no llega ninguno, se dibuja a `IDLE_FPS` (o
+antes, si el próximo temporizador de `core.scheduler` vence antes). Con la
+ventana minimizada u oculta no se dibuja nada.
+
+También estima el tiempo de CPU ahorrado frente a correr siempre a tasa
+completa (`stats()` / `report()`).
+"""
+import time
+
+import pygame
+
+from core.constants import IDLE_AFTER_MS, IDLE_FPS, HIDDEN_WAIT_MS
+
+INPUT_EVENTS = (
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL,
+)
+_HIDE_EVENTS = tuple(getattr(pygame, n) for n in ('WINDOWMINIMIZED', 'WINDOWHIDDEN') if hasattr(pygame, n))
+_SHOW_EVENTS = tuple(getattr(pygame, n) for n in ('WINDOWRESTORED', 'WINDOWSHOWN', 'WINDOWMAXIMIZED') if hasattr(pygame, n))
+_FOCUS_LOST = getattr(pygame, 'WINDOWFOCUSLOST', None)
+_FOCUS_GAINED = getattr(pygame, 'WINDOWFOCUSGAINED', None)
+
+
+class FramePacer:
+    """Decide cuánto esperar entre frames y si hay que dibujar.
+
+    Uso por frame: `events()` en lugar de `pygame.event.get()`, `should_render()`
+    antes de update/draw y `wait(animating)` en lugar de `clock.tick(fps)`.
+    """
+
+    def __init__(self, clock, fps, idle_fps=IDLE_FPS, idle_after_ms=IDLE_AFTER_MS, hidden_wait_ms=HIDDEN_WAIT_MS,
+                 scheduler=None):
+        self.clock = clock
+        self.scheduler = scheduler
+        self.fps = fps
+        self.idle_fps = idle_fps
+        self.idle_after_ms = idle_after_ms
+        self.hidden_wait_ms = hidden_wait_ms
+        self.hidden = False
+        self.focused = True
+        self.mode = 'active'
+        self._last_input = pygame.time.get_ticks()
+        self._woken = []
+        # CPU accounting (time.process_time) for the savings estimate
+        self._cpu_mark = time.process_time()
+        self._wall_mark = time.perf_counter()
+        self._active_frame_cpu = None
+        self.wall_s = 0.0
+        self.cpu_saved_s = 0.0
+        self.frames = {'active': 0, 'idle': 0, 'hidden': 0}
+
+    def events(self):
+        """Eventos pendientes (incluido el que despertó la espera) ya registrados."""
+        evs = self._woken + pygame.event.get()
+        self._woken = []
+        for ev in evs:
+            self.note_event(ev)
+        return evs
+
+    def note_event(self, ev):
+        if ev.type in INPUT_EVENTS:
+            self._last_input = pygame.time.get_ticks()
+        elif ev.type in _HIDE_EVENTS:
+            self.hidden = True
+        elif ev.type in _SHOW_EVENTS:
+            self.hidden = False
+            self._last_input = pygame.time.get_ticks()
+        elif ev.type == _FOCUS_LOST:
+            self.focused = False
+        elif ev.type == _FOCUS_GAINED:
+            self.focused = True
+            self._last_input = pygame.time.get_ticks()
+
+    def should_render(self):
+        return not self.hidden
+
+    def _pick_mode(self, animating):
+        if self.hidden:
+            return 'hidden'
+        if not self.focused:
+            return 'idle'
+        if animating or pygame.time.get_ticks() - self._last_input < self.idle_after_ms:
+            return 'active'
+        return 'idle'
+
+    def wait(self, animating):
+        """Espera hasta el próximo frame según el modo (activo, reposo u oculto)."""
+        self.mode = self._pick_mode(animating)
+        if self.mode == 'active':
+            self.clock.tick(self.fps)
+        else:
+            timeout = self.hidden_wait_ms if self.mode == 'hidden' else int(1000 / max(1, self.idle_fps))
+            # wake up in time for the next scheduled timer
+            due = self.scheduler.next_due_ms() if self.scheduler is not None else None
+            if due is not None:
+                timeout = max(1, min(timeout, due))
+            ev = pygame.event.wait(timeout)
+            if ev.type != pygame.NOEVENT:
+                self._woken.append(ev)
+            # keep the clock's frame delta meaningful after the blocking wait
+            self.clock.tick()
+        self.frames[self.mode] += 1
+        self._account()
+
+    def _account(self):
+        cpu_now = time.process_time()
+        wall_now = time.perf_counter()
+        cpu = cpu_now - self._cpu_mark
+        wall = wall_now - self._wall_mark
+        self._cpu_mark = cpu_now
+        self._wall_mark = wall_now
+        self.wall_s += wall
+        if self.mode == 'active':
+            # moving average of what one full-rate frame costs
+            if self._active_frame_cpu is None:
+                self._active_frame_cpu = cpu
+            else:
+                self._active_frame_cpu += (cpu - self._active_frame_cpu) * 0.05
+        elif self._active_frame_cpu is not None:
+            # at full rate this stretch of wall time would have run wall * fps frames
+            expected = wall * self.fps * self._active_frame_cpu
+            self.cpu_saved_s += max(0.0, expected - cpu)
+
+    def stats(self):
+        minutes = self.wall_s / 60.0
+        return {
+            'mode': self.mode,
+            'frames': dict(self.frames),
+            'wall_s': self.wall_s,
+            'cpu_saved_s': self.cpu_saved_s,
+            'cpu_saved_ms_per_min': (self.cpu_saved_s * 1000.0 / minutes) if minutes > 0 else 0.0,
+        }
+
+    def report(self):
+        s = self.stats()
+        return (f"[Pacing] CPU ahorrada: {s['cpu_saved_ms_per_min']:.0f} ms/min "
+                f"({s['cpu_saved_s']:.2f} s en {s['wall_s']:.0f} s; frames {s['frames']})")
@@ -1,11 +1,87 @@
+"""Puntero personalizado (`assets/puntero.png`).
+
+La imagen se escala una sola vez por tamaño de ventana. Si el sistema lo
+permite se instala como cursor de color por hardware
+(`pygame.mouse.set_cursor(pygame.cursors.Cursor(...))`) y ya no hay que
+dibujarlo en cada frame; si no, se dibuja por software encima del frame.
+"""
 import pygame
 
+from core.constants import POINTER_HARDWARE
+from core.dirty import get_dirty
+
+
+class Pointer:
+    """Puntero con escalado cacheado y cursor por hardware opcional."""
+
+    def __init__(self, image, hardware=POINTER_HARDWARE):
+        self.image = image
+        self.hardware = hardware
+        self.hardware_active = False
+        self._scaled = {}  # target width -> scaled surface
+        self._synced_size = None
+
+    @staticmethod
+    def target_width(win_w):
+        return max(20, min(72, int(win_w * 0.04)))
+
+    def scaled(self, win_size):
+        """Imagen escalada para una ventana de `win_size` (calculada una vez por ancho)."""
+        target_w = self.target_width(win_size[0])
+        surf = self._scaled.get(target_w)
+        if surf is None:
+            iw, ih = self.image.get_size()
+            if iw != target_w:
+                target_h = max(12, int(ih * (target_w / iw)))
+                surf = pygame.transform.smoothscale(self.image, (target_w, target_h))
+            else:
+                surf = self.image
+            self._scaled[target_w] = surf
+        return surf
 
-def load_pointer(path='assets/puntero.png'):
+    def sync(self, win_size):
+        """Instala (o reinstala tras un resize) el cursor por hardware si está habilitado."""
+        win_size = tuple(win_size)
+        if win_size == self._synced_size:
+            return self.hardware_active
+        self._synced_size = win_size
+        self.hardware_active = False
+        if self.hardware and hasattr(pygame.cursors, 'Cursor'):
+            try:
+                surf = self.scaled(win_size)
+                # the software pointer is drawn centered on the mouse: same hotspot
+                hotspot = (surf.get_width() // 2, surf.get_height() // 2)
+                pygame.mouse.set_cursor(pygame.cursors.Cursor(hotspot, surf))
+                pygame.mouse.set_visible(True)
+                self.hardware_active = True
+            except Exception:
+                self.hardware_active = False
+        if not self.hardware_active:
+            try:
+                pygame.mouse.set_visible(False)
+            except Exception:
+                pass
+        return self.hardware_active
+
+    def draw(self, screen):
+        """Dibuja el puntero por software (no hace nada si el cursor es por hardware)."""
+        if self.sync(screen.get_size()):
+            return None
+        mx, my = pygame.mouse.get_pos()
+        surf = self.scaled(screen.get_size())
+        px = mx - surf.get_width() // 2
+        py = my - surf.get_height() // 2
+        screen.blit(surf, (px, py))
+        rect = pygame.Rect(px, py, surf.get_width(), surf.get_height())
+        get_dirty().add(rect)
+        return rect
+
+
+def load_pointer(path='assets/puntero.png', hardware=POINTER_HARDWARE):
     try:
         img = pygame.image.load(path).convert_alpha()
         pygame.mouse.set_visible(False)
-        return img
+        return Pointer(img, hardware=hardware)
     except Exception:
         try:
             pygame.mouse.set_visible(True)
@@ -14,21 +90,10 @@ def load_pointer(path='assets/puntero.png'):
         return None
 
 
-def draw_pointer(screen, puntero_img):
-    if puntero_img is None:
+def draw_pointer(screen, puntero):
+    if puntero is None:
         return
     try:
-        mx, my = pygame.mouse.get_pos()
-        w_win, h_win = screen.get_size()
-        target_w = max(20, min(72, int(w_win * 0.04)))
-        iw, ih = puntero_img.get_size()
-        if iw != target_w:
-            target_h = max(12, int(ih * (target_w / iw)))
-            scaled = pygame.transform.smoothscale(puntero_img, (target_w, target_h))
-        else:
-            scaled = puntero_img
-        px = mx - scaled.get_width() // 2
-        py = my - scaled.get_height() // 2
-        screen.blit(scaled, (px, py))
+        puntero.draw(screen)
     except Exception:
         pass
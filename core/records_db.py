@@ -0,0 +1,377 @@
+"""Almacenamiento de records en SQLite (modo WAL).
+
+Una fila por partida terminada, sin límite de historial. Las columnas `time`,
+`name` y `date` están indexadas: el top-N paginado (`ORDER BY time LIMIT ?
+OFFSET ?`) lo resuelve el índice sin ordenar nada en Python, y guardar un
+record es un único INSERT en vez de reescribir el archivo entero. Los
+duplicados exactos (name, time, date, avatar) se descartan con un índice
+único, igual que hacía antes `guardar_registro` sobre el JSON.
+
+El WAL de SQLite es el diario de solo-añadir: cada record es un append al
+final de `records.db-wal` y, al volver a abrir tras un corte, SQLite repite
+lo confirmado y descarta lo incompleto. Con `synchronous=NORMAL` los commits
+no hacen fsync uno a uno; el fsync se agrupa en el checkpoint, que vuelca el
+diario sobre la base principal. El checkpoint automático (que correría en el
+hilo del juego justo al guardar) está desactivado: `compact_async()` lo hace
+en un hilo aparte cuando el diario supera `RECORDS_WAL_COMPACT_BYTES`, y
+`close()` lo completa al salir. Si la base no se puede abrir (archivo
+corrupto) se aparta como `records.db.corrupt-<fecha>` y se empieza una nueva.
+
+`import_json()` trae los `records.json` del formato anterior.
+
+Los agregados que usa `core.records_query` (partidas y mejor tiempo por día,
+jugador y avatar, e histograma de tiempos por día para mediana/p90) se
+mantienen con triggers en cada INSERT, así que consultarlos no recorre el
+historial. Una base anterior a estas tablas se completa una vez al abrirla.
+Los tiempos por minijuego de cada record van en `record_splits`, cuya clave
+(minijuego, tiempo) es directamente el ranking de cada minijuego.
+
+Benchmark del camino que usa el juego (insert, puesto, total, top-100 y
+mejor por jugador) sobre 1M de records sintéticos: `python -m core.records_db`.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from itertools import islice
+from pathlib import Path
+
+from core.avatars import avatar_id
+from core.constants import RECORDS_BULK_WAL_BYTES, RECORDS_WAL_COMPACT_BYTES
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    time REAL NOT NULL,
+    date TEXT NOT NULL,
+    avatar TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_records_time ON records (time);
+CREATE INDEX IF NOT EXISTS idx_records_name ON records (name);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_records_unique
+    ON records (name, time, date, IFNULL(avatar, ''));
+-- (date, time) replaces the plain date index: one day comes out already sorted by time
+DROP INDEX IF EXISTS idx_records_date;
+CREATE INDEX IF NOT EXISTS idx_records_date_time ON records (date, time);
+CREATE INDEX IF NOT EXISTS idx_records_avatar ON records (avatar, time);
+-- split time of each minigame (core/splits.py); the key order is the per-minigame ranking
+CREATE TABLE IF NOT EXISTS record_splits (
+    game INTEGER NOT NULL,
+    time REAL NOT NULL,
+    record_id INTEGER NOT NULL REFERENCES records (id),
+    PRIMARY KEY (game, time, record_id)
+) WITHOUT ROWID;
+"""
+
+# Aggregates kept up to date by a trigger (records are append-only). The
+# histogram uses STATS_BUCKET_S-wide buckets per day: a fixed-size sketch
+# for quantiles that can be summed over any date range.
+STATS_BUCKET_S = 1.0
+
+STATS_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS stats_day (
+    date TEXT PRIMARY KEY,
+    runs INTEGER NOT NULL,
+    best REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stats_hist (
+    date TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (date, bucket)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS stats_player (
+    name TEXT PRIMARY KEY,
+    runs INTEGER NOT NULL,
+    best REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_stats_player_best ON stats_player (best);
+CREATE TABLE IF NOT EXISTS stats_avatar (
+    avatar TEXT PRIMARY KEY,
+    runs INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS trg_records_stats AFTER INSERT ON records
+BEGIN
+    INSERT INTO stats_day (date, runs, best) VALUES (NEW.date, 1, NEW.time)
+        ON CONFLICT (date) DO UPDATE SET runs = runs + 1, best = MIN(best, excluded.best);
+    INSERT INTO stats_hist (date, bucket, n) VALUES (NEW.date, CAST(NEW.time / {STATS_BUCKET_S} AS INTEGER), 1)
+        ON CONFLICT (date, bucket) DO UPDATE SET n = n + 1;
+    INSERT INTO stats_player (name, runs, best) VALUES (NEW.name, 1, NEW.time)
+        ON CONFLICT (name) DO UPDATE SET runs = runs + 1, best = MIN(best, excluded.best);
+    INSERT INTO stats_avatar (avatar, runs) VALUES (IFNULL(NEW.avatar, ''), 1)
+        ON CONFLICT (avatar) DO UPDATE SET runs = runs + 1;
+END;
+"""
+
+STATS_BACKFILL = f"""
+DELETE FROM stats_day;
+DELETE FROM stats_hist;
+DELETE FROM stats_player;
+DELETE FROM stats_avatar;
+INSERT INTO stats_day (date, runs, best) SELECT date, COUNT(*), MIN(time) FROM records GROUP BY date;
+INSERT INTO stats_hist (date, bucket, n)
+    SELECT date, CAST(time / {STATS_BUCKET_S} AS INTEGER) AS b, COUNT(*) FROM records GROUP BY date, b;
+INSERT INTO stats_player (name, runs, best) SELECT name, COUNT(*), MIN(time) FROM records GROUP BY name;
+INSERT INTO stats_avatar (avatar, runs) SELECT IFNULL(avatar, ''), COUNT(*) FROM records GROUP BY IFNULL(avatar, '');
+"""
+
+INSERT_SQL = 'INSERT OR IGNORE INTO records (name, time, date, avatar) VALUES (?, ?, ?, ?)'
+INSERT_SPLIT_SQL = 'INSERT OR IGNORE INTO record_splits (game, time, record_id) VALUES (?, ?, ?)'
+
+
+def row_to_record(row):
+    """Fila (name, time, date, avatar) -> dict con el formato de siempre."""
+    name, tiempo, date, avatar = row
+    record = {'name': name, 'time': tiempo, 'date': date}
+    if avatar:
+        record['avatar'] = avatar
+    return record
+
+
+def record_to_row(record):
+    """dict de records.json -> fila, o None si la entrada no es válida.
+
+    Acepta también las claves antiguas `jugador`/`tiempo`/`fecha`.
+    """
+    if not isinstance(record, dict):
+        return None
+    name = record.get('name') or record.get('jugador')
+    tiempo = record.get('time') if record.get('time') is not None else record.get('tiempo')
+    date = record.get('date') or record.get('fecha') or ''
+    try:
+        tiempo = round(float(tiempo), 2)
+    except (TypeError, ValueError):
+        return None
+    # absolute paths from other machines become relocatable avatar ids
+    return (str(name or '---'), tiempo, str(date), avatar_id(record.get('avatar')))
+
+
+class RecordsDB:
+    """Conexión SQLite con el esquema de records y las consultas que usa el juego."""
+
+    def __init__(self, path, compact_bytes=RECORDS_WAL_COMPACT_BYTES):
+        self.path = Path(path)
+        self.compact_bytes = int(compact_bytes)
+        self.recovered_from = None
+        self.compactions = 0
+        self._compact_lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.conn = self._open()
+        except sqlite3.DatabaseError:
+            # unreadable file: keep it aside for inspection and start a new store
+            self.recovered_from = self.path.with_name(
+                f"{self.path.name}.corrupt-{time.strftime('%Y%m%d-%H%M%S')}")
+            for suffix in ('-wal', '-shm'):
+                try:
+                    os.replace(str(self.path) + suffix, str(self.recovered_from) + suffix)
+                except OSError:
+                    pass
+            os.replace(self.path, self.recovered_from)
+            self.conn = self._open()
+
+    def _open(self):
+        conn = sqlite3.connect(str(self.path))
+        try:
+            # WAL: appends only, readers never block the writer, and a crash
+            # mid-write cannot leave a half-written table behind
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            # checkpoints run off the game thread (compact_async / close)
+            conn.execute('PRAGMA wal_autocheckpoint=0')
+            with conn:
+                conn.executescript(SCHEMA)
+                conn.executescript(STATS_SCHEMA)
+            # store created before the aggregate tables: fill them once
+            if conn.execute('SELECT 1 FROM stats_day LIMIT 1').fetchone() is None \
+                    and conn.execute('SELECT 1 FROM records LIMIT 1').fetchone() is not None:
+                with conn:
+                    conn.executescript(STATS_BACKFILL)
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    def insert(self, name, tiempo, date, avatar=None, splits=None):
+        """Inserta un record (y sus tiempos por minijuego); devuelve False si era un duplicado exacto."""
+        with self.conn:
+            cur = self.conn.execute(INSERT_SQL, (name, tiempo, date, avatar))
+            if cur.rowcount > 0 and splits:
+                record_id = cur.lastrowid
+                self.conn.executemany(INSERT_SPLIT_SQL, [
+                    (int(game), round(float(t), 2), record_id) for game, t in splits.items()])
+        return cur.rowcount > 0
+
+    def insert_many(self, rows):
+        """Inserta filas (name, time, date, avatar) en una transacción; devuelve cuántas entraron."""
+        with self.conn:
+            cur = self.conn.executemany(INSERT_SQL, rows)
+        # rowcount counts only the records inserted (not the trigger's aggregate rows)
+        return max(0, cur.rowcount)
+
+    def bulk_insert(self, rows, batch=50000):
+        """Carga masiva (importar archivos grandes); devuelve cuántas filas entraron.
+
+        Sin el trigger de agregados, que se recalculan una vez al final, con
+        más caché de páginas para los índices y checkpoints entre lotes para
+        que el diario no crezca sin límite.
+        """
+        rows = iter(rows)
+        added = 0
+        cache = self.conn.execute('PRAGMA cache_size').fetchone()[0]
+        self.conn.execute('PRAGMA cache_size=-65536')
+        self.conn.execute('DROP TRIGGER IF EXISTS trg_records_stats')
+        try:
+            while True:
+                chunk = list(islice(rows, batch))
+                if not chunk:
+                    break
+                added += self.insert_many(chunk)
+                if self.wal_size() >= RECORDS_BULK_WAL_BYTES:
+                    self.checkpoint()
+        finally:
+            # full recount: also covers rows another process wrote meanwhile
+            self.conn.executescript('BEGIN;' + STATS_BACKFILL + STATS_SCHEMA + 'COMMIT;')
+            self.conn.execute(f'PRAGMA cache_size={int(cache)}')
+        return added
+
+    def top(self, limit, offset=0):
+        """Página del ranking por tiempo ascendente (el más rápido primero)."""
+        cur = self.conn.execute(
+            'SELECT name, time, date, avatar FROM records ORDER BY time, id LIMIT ? OFFSET ?',
+            (int(limit), int(offset)))
+        return [row_to_record(row) for row in cur]
+
+    def rows(self, batch=10000):
+        """Todas las filas (name, time, date, avatar) por tiempo, leídas por lotes."""
+        cur = self.conn.execute('SELECT name, time, date, avatar FROM records ORDER BY time, id')
+        while True:
+            chunk = cur.fetchmany(batch)
+            if not chunk:
+                return
+            yield from chunk
+
+    def count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM records').fetchone()[0]
+
+    def rank(self, tiempo):
+        """Puesto que ocupa (u ocuparía) `tiempo`: 1 + cuántos son estrictamente más rápidos (usa idx_records_time)."""
+        return self.conn.execute('SELECT COUNT(*) FROM records WHERE time < ?', (float(tiempo),)).fetchone()[0] + 1
+
+    def import_json(self, path):
+        """Importa un `records.json` (lista de dicts); devuelve cuántos records nuevos entraron."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if not isinstance(data, list):
+            return 0
+        rows = [row for row in map(record_to_row, data) if row is not None]
+        return self.insert_many(rows)
+
+    def data_version(self):
+        """Cambia cada vez que otra conexión (otro proceso) confirma una escritura."""
+        return self.conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def wal_size(self):
+        try:
+            return os.path.getsize(str(self.path) + '-wal')
+        except OSError:
+            return 0
+
+    def compact_async(self, force=False):
+        """Vuelca el diario sobre la base en un hilo aparte si superó el umbral.
+
+        Devuelve True si lanzó una compactación.
+        """
+        if not force and self.wal_size() < self.compact_bytes:
+            return False
+        if not self._compact_lock.acquire(blocking=False):
+            return False  # one already running
+        worker = threading.Thread(target=self._compact_worker, name='records-compact', daemon=True)
+        worker.start()
+        return True
+
+    def _compact_worker(self):
+        try:
+            # own connection: sqlite3 connections are not shared across threads
+            conn = sqlite3.connect(str(self.path), timeout=1.0)
+            try:
+                # TRUNCATE also shrinks the -wal file back to zero; it only holds
+                # the write lock for the few ms the copy takes
+                conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                self.compactions += 1
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+        finally:
+            self._compact_lock.release()
+
+    def checkpoint(self):
+        """Checkpoint completo y síncrono: deja el diario vacío (al salir)."""
+        try:
+            self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        # wait for a running background compaction before the final checkpoint
+        with self._compact_lock:
+            pass
+        self.checkpoint()
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+
+def benchmark(n=1_000_000, inserts=1000, queries=1000, seed=1):
+    """Tiempos de carga, inserción y consultas sobre `n` records sintéticos (en un directorio temporal)."""
+    import random
+    import tempfile
+
+    from core.records_query import RecordsQuery
+
+    rng = random.Random(seed)
+    names = [f'jugador{i}' for i in range(5000)]
+    dates = [f'2026-{m:02d}-{d:02d}' for m in range(1, 13) for d in range(1, 29)]
+    with tempfile.TemporaryDirectory() as tmp:
+        db = RecordsDB(Path(tmp) / 'records.db')
+        try:
+            t0 = time.perf_counter()
+            db.bulk_insert((rng.choice(names), round(rng.uniform(30.0, 900.0), 2), rng.choice(dates), None)
+                           for _ in range(n))
+            load_s = time.perf_counter() - t0
+
+            def timed(fn, args):
+                t0 = time.perf_counter()
+                for a in args:
+                    fn(a)
+                return (time.perf_counter() - t0) * 1e6 / len(args)
+
+            extra = [(f'nuevo{i}', round(rng.uniform(30.0, 900.0), 2)) for i in range(inserts)]
+            query = RecordsQuery(db)
+            result = {
+                'records': n,
+                'load_s': load_s,
+                'insert_us': timed(lambda r: db.insert(r[0], r[1], '2026-10-18'), extra),
+                'rank_us': timed(db.rank, [rng.uniform(30.0, 900.0) for _ in range(queries)]),
+                'count_us': timed(lambda _: db.count(), range(queries)),
+                'top100_us': timed(lambda _: db.top(100), range(queries)),
+                'best_us': timed(query.player_best, [rng.choice(names) for _ in range(queries)]),
+            }
+        finally:
+            db.close()
+    return result
+
+
+if __name__ == '__main__':
+    r = benchmark()
+    print(f"{r['records']} records: carga {r['load_s']:.2f} s")
+    print(f"insert {r['insert_us']:.0f} us, puesto {r['rank_us']:.0f} us, total {r['count_us']:.0f} us")
+    print(f"top-100 {r['top100_us']:.0f} us, mejor por jugador {r['best_us']:.1f} us")
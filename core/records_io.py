@@ -0,0 +1,170 @@
+"""Importación y exportación de records en CSV / JSONL, en streaming.
+
+Pensado para juntar los records de varios kioscos: los archivos se leen y
+escriben fila a fila (lotes de `BATCH` filas hacia SQLite), así que la
+memoria no depende del tamaño del archivo. Los duplicados se descartan con
+el índice único (name, time, date, avatar) de `core.records_db`, que hace de
+índice en disco: no hace falta un set en Python con millones de claves.
+
+Formatos, según la extensión:
+
+    .csv            cabecera name,time,date,avatar
+    .jsonl/.ndjson  un record JSON por línea
+    .json           records.json del formato anterior (lista; se lee entero,
+                    son archivos chicos)
+
+Las filas inválidas (sin tiempo numérico, JSON roto) se cuentan y se saltan.
+"""
+import csv
+import json
+import os
+import sqlite3
+import tempfile
+from itertools import islice
+
+from core.records_db import record_to_row, row_to_record
+
+FIELDS = ('name', 'time', 'date', 'avatar')
+BATCH = 50000
+
+
+def file_format(path):
+    """'csv', 'jsonl' o 'json' según la extensión de `path`."""
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext == '.csv':
+        return 'csv'
+    if ext in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if ext == '.json':
+        return 'json'
+    raise ValueError(f'formato no reconocido: {path} (usar .csv, .jsonl o .json)')
+
+
+class _Reader:
+    """Iterador de filas (name, time, date, avatar) de un archivo, con conteo de descartes."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.format = file_format(path)
+        self.read = 0
+        self.skipped = 0
+
+    def _records(self, f):
+        if self.format == 'csv':
+            yield from csv.DictReader(f)
+        elif self.format == 'jsonl':
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    yield None
+        else:
+            try:
+                data = json.load(f)
+            except ValueError:
+                data = None
+            yield from (data if isinstance(data, list) else [])
+
+    def __iter__(self):
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            for record in self._records(f):
+                self.read += 1
+                row = record_to_row(record)
+                if row is None:
+                    self.skipped += 1
+                    continue
+                yield row
+
+
+def import_file(db, path, batch=BATCH):
+    """Importa `path` en `db`; devuelve {'read', 'added', 'duplicates', 'skipped'}."""
+    reader = _Reader(path)
+    added = db.bulk_insert(reader, batch)
+    valid = reader.read - reader.skipped
+    return {'read': reader.read, 'added': added, 'duplicates': valid - added, 'skipped': reader.skipped}
+
+
+def export_file(db, path):
+    """Escribe todos los records de `db` (por tiempo) en `path`; devuelve cuántos."""
+    fmt = file_format(path)
+    tmp = str(path) + '.tmp'
+    n = 0
+    with open(tmp, 'w', encoding='utf-8', newline='') as f:
+        if fmt == 'csv':
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            for name, tiempo, date, avatar in db.rows():
+                writer.writerow((name, tiempo, date, avatar or ''))
+                n += 1
+        elif fmt == 'jsonl':
+            for row in db.rows():
+                f.write(json.dumps(row_to_record(row), ensure_ascii=False))
+                f.write('\n')
+                n += 1
+        else:
+            # same layout as the old records.json, written one element at a time
+            f.write('[')
+            for row in db.rows():
+                f.write(',\n' if n else '\n')
+                f.write(json.dumps(row_to_record(row), ensure_ascii=False))
+                n += 1
+            f.write('\n]\n')
+    os.replace(tmp, path)
+    return n
+
+
+class _MergeIndex:
+    """Base temporal para `merge`: solo la clave única, sin diario ni agregados.
+
+    Tiene la misma interfaz que usan `import_file` / `export_file` de una
+    `RecordsDB` (`bulk_insert`, `rows`).
+    """
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(str(path))
+        # scratch file, thrown away at the end: no journal, no fsync
+        self.conn.execute('PRAGMA journal_mode=OFF')
+        self.conn.execute('PRAGMA synchronous=OFF')
+        self.conn.execute('PRAGMA cache_size=-65536')
+        # WITHOUT ROWID: the table is the (name, time, date, avatar) index itself
+        self.conn.execute("""CREATE TABLE seen (
+            name TEXT, time REAL, date TEXT, avatar TEXT,
+            PRIMARY KEY (name, time, date, avatar)) WITHOUT ROWID""")
+
+    def bulk_insert(self, rows, batch=BATCH):
+        rows = iter(rows)
+        added = 0
+        while True:
+            # primary key columns of a WITHOUT ROWID table can't be NULL
+            chunk = [(n, t, d, a or '') for n, t, d, a in islice(rows, batch)]
+            if not chunk:
+                return added
+            with self.conn:
+                added += max(0, self.conn.executemany('INSERT OR IGNORE INTO seen VALUES (?, ?, ?, ?)', chunk).rowcount)
+
+    def rows(self, batch=10000):
+        # the sort spills to a temp file, not to memory
+        cur = self.conn.execute("SELECT name, time, date, NULLIF(avatar, '') FROM seen ORDER BY time")
+        while True:
+            chunk = cur.fetchmany(batch)
+            if not chunk:
+                return
+            yield from chunk
+
+    def close(self):
+        self.conn.close()
+
+
+def merge_files(inputs, output, batch=BATCH):
+    """Une `inputs` sin duplicados en `output` usando una base temporal como índice."""
+    with tempfile.TemporaryDirectory() as d:
+        db = _MergeIndex(os.path.join(d, 'merge.db'))
+        try:
+            results = {str(path): import_file(db, path, batch) for path in inputs}
+            written = export_file(db, output)
+        finally:
+            db.close()
+    return results, written
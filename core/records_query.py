@@ -0,0 +1,159 @@
+"""Consultas sobre el historial de records: filtros indexados y agregados.
+
+Los filtros (rango de fechas, prefijo de nombre, avatar) se traducen a
+condiciones que resuelven los índices de `records` (`date, time`, `name`,
+`avatar, time`); el prefijo se expresa como rango (`name >= p AND name < p'`)
+para que SQLite use el índice en vez de recorrer la tabla con LIKE.
+
+`minigame_records()` ordena por el tiempo parcial de un minijuego
+(`record_splits`, clave (minijuego, tiempo)).
+
+Los agregados (partidas, mejor tiempo, mediana y p90 de un rango de fechas,
+mejor por jugador, partidas por avatar) se leen de las tablas `stats_*` que
+`core.records_db` mantiene con un trigger en cada INSERT: el coste depende
+de los días y cubetas del rango, no del número de records. Mediana y p90 se
+estiman sobre el histograma por día (cubetas de `STATS_BUCKET_S` segundos)
+interpolando dentro de la cubeta.
+"""
+from datetime import date, timedelta
+
+from core.records_db import STATS_BUCKET_S, row_to_record
+
+
+def today():
+    return date.today().isoformat()
+
+
+def week_range(end=None):
+    """(desde, hasta) de los últimos 7 días, incluido `end` (hoy por defecto)."""
+    end = date.fromisoformat(end) if end else date.today()
+    return (end - timedelta(days=6)).isoformat(), end.isoformat()
+
+
+def _prefix_end(prefix):
+    # smallest string greater than every string starting with `prefix`
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def quantile_from_hist(buckets, q, width=STATS_BUCKET_S):
+    """Cuantil `q` (0..1) estimado de [(cubeta, n), ...] ordenadas por cubeta."""
+    total = sum(n for _, n in buckets)
+    if total == 0:
+        return None
+    target = q * total
+    seen = 0
+    for bucket, n in buckets:
+        if seen + n >= target:
+            # linear interpolation inside the bucket
+            frac = (target - seen) / n if n else 0.0
+            return (bucket + frac) * width
+        seen += n
+    return (buckets[-1][0] + 1) * width
+
+
+class RecordsQuery:
+    """API de consultas sobre una `RecordsDB`."""
+
+    def __init__(self, db):
+        self.db = db
+
+    @staticmethod
+    def _where(date_from=None, date_to=None, name_prefix=None, avatar=None):
+        clauses, params = [], []
+        if date_from and date_from == date_to:
+            # single day: equality lets the (date, time) index return rows in order
+            clauses.append('date = ?')
+            params.append(date_from)
+            date_from = date_to = None
+        if date_from:
+            clauses.append('date >= ?')
+            params.append(date_from)
+        if date_to:
+            clauses.append('date <= ?')
+            params.append(date_to)
+        if name_prefix:
+            clauses.append('name >= ? AND name < ?')
+            params.extend((name_prefix, _prefix_end(name_prefix)))
+        if avatar:
+            clauses.append('avatar = ?')
+            params.append(avatar)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def records(self, limit=50, offset=0, **filters):
+        """Records que cumplen los filtros, del más rápido al más lento."""
+        where, params = self._where(**filters)
+        cur = self.db.conn.execute(
+            f'SELECT name, time, date, avatar FROM records{where} ORDER BY time, id LIMIT ? OFFSET ?',
+            params + [int(limit), int(offset)])
+        return [row_to_record(row) for row in cur]
+
+    def count(self, **filters):
+        """Cantidad de records que cumplen los filtros.
+
+        Solo por fechas se responde desde `stats_day`; con filtros de
+        nombre o avatar cuenta sobre el índice correspondiente.
+        """
+        if not filters.get('name_prefix') and not filters.get('avatar'):
+            return self.summary(filters.get('date_from'), filters.get('date_to'))['runs']
+        where, params = self._where(**filters)
+        return self.db.conn.execute(f'SELECT COUNT(*) FROM records{where}', params).fetchone()[0]
+
+    def best_of_day(self, day=None, limit=10, offset=0):
+        """Mejores records de un día (hoy por defecto)."""
+        day = day or today()
+        return self.records(limit=limit, offset=offset, date_from=day, date_to=day)
+
+    def summary(self, date_from=None, date_to=None):
+        """{'runs', 'best', 'median', 'p90'} del rango de fechas (todo el historial si no se indica)."""
+        where, params = self._where(date_from=date_from, date_to=date_to)
+        runs, best = self.db.conn.execute(f'SELECT IFNULL(SUM(runs), 0), MIN(best) FROM stats_day{where}', params).fetchone()
+        buckets = self.db.conn.execute(
+            f'SELECT bucket, SUM(n) FROM stats_hist{where} GROUP BY bucket ORDER BY bucket', params).fetchall()
+        median = quantile_from_hist(buckets, 0.5)
+        p90 = quantile_from_hist(buckets, 0.9)
+        # an estimate can never be better than the real best time
+        if best is not None:
+            median = max(best, median) if median is not None else None
+            p90 = max(best, p90) if p90 is not None else None
+        return {'runs': runs, 'best': best, 'median': median, 'p90': p90}
+
+    def player_bests(self, limit=50, offset=0):
+        """Mejor tiempo de cada jugador: [{'name', 'time', 'runs'}], del más rápido al más lento."""
+        cur = self.db.conn.execute(
+            'SELECT name, best, runs FROM stats_player ORDER BY best, name LIMIT ? OFFSET ?',
+            (int(limit), int(offset)))
+        return [{'name': name, 'time': best, 'runs': runs} for name, best, runs in cur]
+
+    def player_best(self, name):
+        """Mejor tiempo de `name`, o None si no tiene records."""
+        row = self.db.conn.execute('SELECT best FROM stats_player WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def player_count(self):
+        return self.db.conn.execute('SELECT COUNT(*) FROM stats_player').fetchone()[0]
+
+    def runs_per_avatar(self, limit=50, offset=0):
+        """Partidas por avatar: [{'avatar', 'runs'}], de más a menos usado."""
+        cur = self.db.conn.execute(
+            'SELECT avatar, runs FROM stats_avatar ORDER BY runs DESC, avatar LIMIT ? OFFSET ?',
+            (int(limit), int(offset)))
+        return [{'avatar': avatar or None, 'runs': runs} for avatar, runs in cur]
+
+    def avatar_count(self):
+        return self.db.conn.execute('SELECT COUNT(*) FROM stats_avatar').fetchone()[0]
+
+    def minigame_records(self, game, limit=50, offset=0):
+        """Ranking de un minijuego por su tiempo parcial: records con 'split' (tiempo en ese minijuego)."""
+        cur = self.db.conn.execute(
+            'SELECT r.name, r.time, r.date, r.avatar, s.time FROM record_splits s '
+            'JOIN records r ON r.id = s.record_id WHERE s.game = ? ORDER BY s.time, s.record_id LIMIT ? OFFSET ?',
+            (int(game), int(limit), int(offset)))
+        out = []
+        for *row, split in cur:
+            record = row_to_record(row)
+            record['split'] = split
+            out.append(record)
+        return out
+
+    def minigame_count(self, game):
+        return self.db.conn.execute('SELECT COUNT(*) FROM record_splits WHERE game = ?', (int(game),)).fetchone()[0]
@@ -0,0 +1,151 @@
+"""Precarga en segundo plano de la pantalla siguiente de la secuencia.
+
+Construir una pantalla en el momento del cambio (decodificar sus PNG,
+componer su capa estática) congelaba el frame justo cuando el jugador
+pulsaba 'Continuar'. `AppController` pide aquí la entrada siguiente de
+`seq` en cuanto muestra la actual:
+
+1. un hilo decodifica las imágenes que la pantalla declara en
+   `preload_assets(index)` (`pygame.image.load` no toca el display);
+2. `pump()`, una vez por frame en el hilo principal, hace un paso por
+   frame: convertir lo decodificado al formato del display (`convert` /
+   `convert_alpha` solo son seguros aquí) y guardarlo en `core.assets`,
+   construir la pantalla y componer su capa estática;
+3. en la transición `take(key)` entrega la pantalla lista; si todavía no
+   lo está (clic muy rápido), el controlador la construye como antes.
+
+El tiempo desde la transición (`take`) hasta presentar el primer frame de
+la pantalla nueva (`end_swap()`) se mide y se separa según la pantalla
+estuviera precargada o no (`stats()` / `report()`).
+"""
+import queue
+import threading
+import time
+
+import pygame
+
+from core.assets import get_assets
+
+
+class ScenePreloader:
+    """Una pantalla precargada a la vez (la siguiente de la secuencia)."""
+
+    def __init__(self, assets=None):
+        self.assets = assets or get_assets()
+        self._jobs = queue.Queue()
+        self._decoded = queue.Queue()
+        self._thread = None
+        self._key = None
+        self._build = None
+        self._waiting = set()      # (path, mode) still decoding
+        self._built = None         # (screen, extra) returned by `build()`
+        self._layer_ready = False
+        # transition stall measurements (ms), split by whether the screen was preloaded
+        self._swap_t0 = None
+        self._swap_hit = False
+        self.stalls = {True: [], False: []}
+
+    def _worker(self):
+        while True:
+            path, mode = self._jobs.get()
+            try:
+                img = pygame.image.load(path)
+            except Exception:
+                img = None
+            self._decoded.put((path, mode, img))
+
+    def _decode(self, path, mode):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name='scene-preload', daemon=True)
+            self._thread.start()
+        self._jobs.put((path, mode))
+
+    def request(self, key, assets, build):
+        """Empieza a preparar la pantalla `key`, construida por `build()` cuando sus `assets` estén.
+
+        `assets` es una lista de (ruta, modo) como los de `AssetCache.get`;
+        `build()` devuelve `(pantalla, extra)` y `take(key)` entrega esa tupla.
+        """
+        self.cancel()
+        self._key = key
+        self._build = build
+        for path, mode in assets or ():
+            if (path, mode) in self._waiting or self.assets.has(path, mode):
+                continue
+            self._waiting.add((path, mode))
+            self._decode(path, mode)
+
+    def cancel(self):
+        """Descarta la pantalla pedida (las imágenes ya decodificadas igual se guardan)."""
+        self._key = None
+        self._build = None
+        self._built = None
+        self._layer_ready = False
+
+    def pump(self):
+        """Avanza la precarga un paso; llamar una vez por frame desde el hilo principal."""
+        # 1) adopt everything decoded so far: converting is cheap next to decoding
+        adopted = False
+        while True:
+            try:
+                path, mode, img = self._decoded.get_nowait()
+            except queue.Empty:
+                break
+            self._waiting.discard((path, mode))
+            if img is not None:
+                try:
+                    self.assets.adopt(path, img, mode)
+                    adopted = True
+                except Exception:
+                    pass
+        if adopted or self._key is None or self._waiting:
+            return
+        # 2) build the screen (its images now come from the cache)
+        if self._built is None:
+            try:
+                self._built = self._build()
+            except Exception:
+                self.cancel()
+            return
+        # 3) compose its static layer at the current window size
+        if not self._layer_ready:
+            self._layer_ready = True
+            layer = getattr(self._built[0], 'static_layer', None)
+            surface = pygame.display.get_surface()
+            if layer is not None and surface is not None:
+                try:
+                    layer.prepare(surface.get_size())
+                except Exception:
+                    pass
+
+    def take(self, key):
+        """`(pantalla, extra)` de `key` ya construida, o None si no está lista (o se pidió otra).
+
+        Marca el inicio de la transición para la medición de `end_swap()`.
+        """
+        self._swap_t0 = time.perf_counter()
+        built = self._built if self._key == key else None
+        self.cancel()
+        self._swap_hit = built is not None
+        return built
+
+    def end_swap(self):
+        """Llamar tras presentar un frame; cierra la medición si había una transición abierta."""
+        if self._swap_t0 is None:
+            return
+        self.stalls[self._swap_hit].append((time.perf_counter() - self._swap_t0) * 1000.0)
+        self._swap_t0 = None
+
+    def stats(self):
+        def summary(values):
+            if not values:
+                return {'count': 0, 'mean_ms': 0.0, 'max_ms': 0.0}
+            return {'count': len(values), 'mean_ms': sum(values) / len(values), 'max_ms': max(values)}
+        return {'preloaded': summary(self.stalls[True]), 'cold': summary(self.stalls[False])}
+
+    def report(self):
+        s = self.stats()
+        hot, cold = s['preloaded'], s['cold']
+        return (f"[Scenes] transiciones precargadas {hot['count']} "
+                f"(media {hot['mean_ms']:.1f} ms, máx {hot['max_ms']:.1f} ms); "
+                f"sin precarga {cold['count']} (media {cold['mean_ms']:.1f} ms, máx {cold['max_ms']:.1f} ms)")
@@ -0,0 +1,170 @@
+"""Temporizadores del juego: callbacks diferidos y periódicos sobre un min-heap.
+
+Las pantallas ya no guardan plazos sueltos (`alert_until`, `lock_until`...)
+para compararlos en cada `update()`: registran un callback con `after(ms,
+fn)` o `every(ms, fn)` y `AppController` llama a `run_due()` una vez por
+frame. El heap está ordenado por vencimiento, así que un frame sin nada
+vencido cuesta una comparación y cada disparo O(log n). `next_due_ms()` le
+dice a `FramePacer` cuánto puede dormir en reposo sin pasarse del próximo
+plazo.
+
+Cada callback tiene como mucho un temporizador pendiente: volver a
+programarlo lo mueve (p. ej. una alerta nueva reemplaza el plazo de la
+anterior) y `cancel(fn)` lo quita. Los métodos se guardan con referencia
+débil: cuando una pantalla se descarta, sus temporizadores mueren con ella
+sin tener que cancelarlos; una pantalla que se reutiliza (pool de
+`AppController`) los cancela con `cancel_owner(pantalla)`. El reloj es
+`pygame.time.get_ticks()` (ms), el mismo que usaban las pantallas.
+"""
+import heapq
+import itertools
+import weakref
+
+import pygame
+
+
+def _key(callback):
+    # bound methods are recreated on every attribute access: key by (instance, function)
+    owner = getattr(callback, '__self__', None)
+    if owner is not None and hasattr(callback, '__func__'):
+        return (id(owner), callback.__func__)
+    return callback
+
+
+class _Timer:
+    __slots__ = ('due', 'interval', 'ref', 'key', 'cancelled')
+
+    def __init__(self, due, interval, callback, key):
+        self.due = due
+        self.interval = interval
+        self.key = key
+        self.cancelled = False
+        if getattr(callback, '__self__', None) is not None and hasattr(callback, '__func__'):
+            self.ref = weakref.WeakMethod(callback)
+        else:
+            self.ref = lambda cb=callback: cb
+
+    def callback(self):
+        return self.ref()
+
+
+class Scheduler:
+    """Temporizadores de una sola vez y periódicos, vencidos en orden."""
+
+    def __init__(self, clock=None):
+        self.clock = clock or pygame.time.get_ticks
+        self._heap = []             # (due, seq, timer)
+        self._timers = {}           # key -> pending timer
+        self._seq = itertools.count()
+        self.fired = 0
+
+    def _push(self, due, interval, callback):
+        key = _key(callback)
+        old = self._timers.pop(key, None)
+        if old is not None:
+            # lazy deletion: the stale heap entry is skipped when it surfaces
+            old.cancelled = True
+        timer = _Timer(int(due), interval, callback, key)
+        self._timers[key] = timer
+        heapq.heappush(self._heap, (timer.due, next(self._seq), timer))
+        return timer
+
+    def after(self, ms, callback):
+        """Llama a `callback()` dentro de `ms` milisegundos (reprograma si ya estaba pendiente)."""
+        return self._push(self.clock() + max(0, int(ms)), None, callback)
+
+    def at(self, ticks, callback):
+        """Llama a `callback()` cuando `pygame.time.get_ticks()` llegue a `ticks`."""
+        return self._push(ticks, None, callback)
+
+    def every(self, ms, callback):
+        """Llama a `callback()` cada `ms` milisegundos hasta `cancel(callback)`."""
+        ms = max(1, int(ms))
+        return self._push(self.clock() + ms, ms, callback)
+
+    def cancel(self, callback):
+        timer = self._timers.pop(_key(callback), None)
+        if timer is not None:
+            timer.cancelled = True
+
+    def cancel_owner(self, owner):
+        """Cancela todos los temporizadores de los métodos de `owner` (p. ej. una pantalla reutilizada)."""
+        oid = id(owner)
+        for key in [k for k in self._timers if isinstance(k, tuple) and k[0] == oid]:
+            self._timers.pop(key).cancelled = True
+
+    def _pending_timer(self, callback):
+        timer = self._timers.get(_key(callback))
+        if timer is None or timer.callback() is None:
+            return None
+        return timer
+
+    def pending(self, callback):
+        return self._pending_timer(callback) is not None
+
+    def remaining(self, callback):
+        """ms que faltan para que venza `callback`, o None si no está programado."""
+        timer = self._pending_timer(callback)
+        if timer is None:
+            return None
+        return max(0, timer.due - self.clock())
+
+    def run_due(self, now=None):
+        """Dispara los temporizadores vencidos; devuelve cuántos corrió."""
+        now = self.clock() if now is None else now
+        heap = self._heap
+        fired = 0
+        while heap and heap[0][0] <= now:
+            _, _, timer = heapq.heappop(heap)
+            if timer.cancelled:
+                continue
+            callback = timer.callback()
+            if callback is None:
+                # owner was discarded
+                self._timers.pop(timer.key, None)
+                continue
+            if timer.interval is None:
+                self._timers.pop(timer.key, None)
+            else:
+                # never more than one catch-up call after a long frame
+                timer.due = max(timer.due + timer.interval, now + 1)
+                heapq.heappush(heap, (timer.due, next(self._seq), timer))
+            try:
+                callback()
+            except Exception:
+                pass
+            fired += 1
+        self.fired += fired
+        return fired
+
+    def next_due_ms(self, now=None):
+        """ms hasta el próximo vencimiento (0 si ya venció), o None si no hay ninguno."""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        now = self.clock() if now is None else now
+        return max(0, heap[0][0] - now)
+
+    def clear(self):
+        for timer in self._timers.values():
+            timer.cancelled = True
+        self._timers.clear()
+        self._heap.clear()
+
+    def __len__(self):
+        return len(self._timers)
+
+    def stats(self):
+        return {'pending': len(self._timers), 'heap': len(self._heap), 'fired': self.fired}
+
+
+_scheduler = None
+
+
+def get_scheduler():
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = Scheduler()
+    return _scheduler
@@ -0,0 +1,109 @@
+"""Escritura diferida de settings.json en un hilo aparte.
+
+`EstadoGlobal` ya no escribe en disco desde el bucle de render: entrega una
+copia de los settings con `submit()` y sigue. El hilo de persistencia agrupa
+las ráfagas (perder varias vidas seguidas, cambiar de avatar...) durante
+`SETTINGS_COALESCE_MS` y escribe solo el último estado, con archivo temporal
++ `os.replace` para que un corte nunca deje un JSON a medias. A diferencia
+del throttle anterior, ningún cambio se descarta: el último siempre llega al
+disco, y `main()` llama a `close()` en su `finally` para vaciar la cola antes
+de salir.
+"""
+import json
+import os
+import queue
+import threading
+
+from core.constants import SETTINGS_COALESCE_MS
+
+
+class SettingsWriter:
+    """Hilo de persistencia con cola, agrupación de ráfagas y flush garantizado."""
+
+    def __init__(self, coalesce_ms=SETTINGS_COALESCE_MS):
+        self.coalesce_s = max(0.0, coalesce_ms / 1000.0)
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.writes = 0
+        self.errors = 0
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='settings-writer', daemon=True)
+                self._thread.start()
+
+    def submit(self, path, data):
+        """Encola `data` para escribirlo en `path` (no bloquea)."""
+        self.submitted += 1
+        self._ensure_thread()
+        self._queue.put(('write', str(path), dict(data)))
+
+    def flush(self, timeout=2.0):
+        """Espera a que todo lo encolado esté en disco; devuelve False si venció el timeout."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(('flush', done, None))
+        return done.wait(timeout)
+
+    def close(self, timeout=2.0):
+        """Flush final y fin del hilo (llamar al salir del juego)."""
+        if self._thread is None:
+            return True
+        ok = self.flush(timeout)
+        self._queue.put(('stop', None, None))
+        self._thread.join(timeout)
+        self._thread = None
+        return ok
+
+    def _run(self):
+        pending = {}  # path -> latest data
+        while True:
+            try:
+                kind, arg, data = self._queue.get(timeout=self.coalesce_s if pending else None)
+            except queue.Empty:
+                # burst is over: write the latest state of each file once
+                self._write_all(pending)
+                continue
+            if kind == 'write':
+                pending[arg] = data
+            elif kind == 'flush':
+                self._write_all(pending)
+                arg.set()
+            elif kind == 'stop':
+                self._write_all(pending)
+                return
+
+    def _write_all(self, pending):
+        for path, data in list(pending.items()):
+            self._write(path, data)
+        pending.clear()
+
+    def _write(self, path, data):
+        tmp = path + '.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+            self.writes += 1
+        except Exception:
+            # don't raise on save failure (same policy as before)
+            self.errors += 1
+
+    def stats(self):
+        return {'submitted': self.submitted, 'writes': self.writes, 'errors': self.errors}
+
+
+_writer = None
+
+
+def get_settings_writer():
+    global _writer
+    if _writer is None:
+        _writer = SettingsWriter()
+    return _writer
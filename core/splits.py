@@ -0,0 +1,87 @@
+"""Cronómetro de la partida con tiempos parciales por minijuego.
+
+Usa `time.perf_counter_ns` (monótono, en enteros): un ajuste del reloj del
+sistema durante la partida ya no cambia el tiempo, y sumar segmentos en
+nanosegundos no acumula error de coma flotante.
+
+El tiempo se lleva como segmentos: cada `resume()` abre uno y cada `pause()`
+lo cierra y lo suma al total y al paso actual (`step`, el número de
+minijuego que fija `AppController` con `set_step`). Solo las transiciones
+tocan el reloj; leer el tiempo en cada frame (HUD) es una llamada a
+`perf_counter_ns` y una resta.
+"""
+import time
+
+_NS = 1_000_000_000
+
+
+class SplitTimer:
+    """Cronómetro pausable con acumulado por paso."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.step = None
+        self.started = False
+        self._closed_ns = 0      # sum of closed segments
+        self._open_at = None     # perf_counter_ns() of the open segment, None while paused
+        self._steps = {}         # step -> ns (closed segments only)
+
+    @property
+    def running(self):
+        return self._open_at is not None
+
+    def resume(self):
+        """Arranca o reanuda (no hace nada si ya corre)."""
+        if self._open_at is None:
+            self._open_at = time.perf_counter_ns()
+            self.started = True
+
+    def pause(self):
+        """Cierra el segmento abierto y lo suma al paso actual."""
+        if self._open_at is None:
+            return
+        seg = time.perf_counter_ns() - self._open_at
+        self._open_at = None
+        self._closed_ns += seg
+        self._steps[self.step] = self._steps.get(self.step, 0) + seg
+
+    def set_step(self, step):
+        """A partir de ahora el tiempo cuenta para `step` (cierra el segmento del anterior)."""
+        if step == self.step:
+            return
+        was_running = self.running
+        self.pause()
+        self.step = step
+        if was_running:
+            self.resume()
+
+    def elapsed_ns(self):
+        if self._open_at is None:
+            return self._closed_ns
+        return self._closed_ns + (time.perf_counter_ns() - self._open_at)
+
+    def elapsed(self):
+        """Segundos transcurridos (sin contar las pausas)."""
+        return self.elapsed_ns() / _NS
+
+    def splits(self):
+        """{paso: segundos} de los pasos con tiempo, incluido el segmento en curso."""
+        out = dict(self._steps)
+        if self._open_at is not None:
+            out[self.step] = out.get(self.step, 0) + (time.perf_counter_ns() - self._open_at)
+        out = {step: round(ns / _NS, 2) for step, ns in out.items() if step is not None}
+        return {step: t for step, t in out.items() if t > 0}
+
+    def restore(self, elapsed, running=False, splits=None, step=None):
+        """Vuelve a un estado guardado (snapshot): total, pasos y si estaba corriendo."""
+        self.reset()
+        self._steps = {k: int(round(float(v) * _NS)) for k, v in (splits or {}).items()}
+        # whatever the splits don't explain (e.g. older snapshots) stays unattributed
+        self._closed_ns = max(int(round(float(elapsed) * _NS)), sum(self._steps.values()))
+        self._steps[None] = self._closed_ns - sum(self._steps.values())
+        self.step = step
+        self.started = self._closed_ns > 0 or bool(running)
+        if running:
+            self.resume()
@@ -0,0 +1,121 @@
+"""Caché de textos renderizados (LRU acotada).
+
+Las etiquetas fijas ('Continuar', 'Validar', títulos...) y las que cambian
+poco (cuentas regresivas, palabra cifrada) se renderizaban con `font.render`
+en cada frame. Aquí cada (fuente, texto, colores, variante, antialias) se
+renderiza una sola vez; las variantes con contorno y con sombra también se
+guardan ya compuestas.
+"""
+from collections import OrderedDict
+
+import pygame
+
+from core.constants import TEXT_CACHE_MAX_ENTRIES
+
+# 1px outline offsets: 8 directions (registro) or 4 directions (inicio)
+OUTLINE_8 = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1), (-1, 1), (1, -1))
+OUTLINE_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class TextCache:
+    """LRU de superficies de texto con estadísticas por pantalla.
+
+    `set_scope(nombre)` indica qué pantalla está dibujando; los hits/misses
+    se acumulan por scope para poder comparar tasas de acierto.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_MAX_ENTRIES):
+        self.max_entries = int(max_entries)
+        self._entries = OrderedDict()
+        self.scope = None
+        self._stats = {}  # scope -> [hits, misses]
+        self.evictions = 0
+
+    def set_scope(self, scope):
+        self.scope = scope
+
+    def _lookup(self, key):
+        counters = self._stats.get(self.scope)
+        if counters is None:
+            counters = self._stats[self.scope] = [0, 0]
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            counters[0] += 1
+        else:
+            counters[1] += 1
+        return surf
+
+    def _store(self, key, surf):
+        self._entries[key] = surf
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def render(self, font, text, color, antialias=True):
+        """Equivalente a `font.render(text, antialias, color)`."""
+        text = str(text)
+        key = ('plain', font, text, tuple(color), None, bool(antialias))
+        surf = self._lookup(key)
+        if surf is None:
+            surf = self._store(key, font.render(text, antialias, color))
+        return surf
+
+    def render_outlined(self, font, text, fg, outline, antialias=True, offsets=OUTLINE_8):
+        """Texto con contorno de 1px; la superficie mide +2px y el texto queda en (1, 1)."""
+        text = str(text)
+        key = ('outline', font, text, tuple(fg), (tuple(outline), tuple(offsets)), bool(antialias))
+        surf = self._lookup(key)
+        if surf is None:
+            base = font.render(text, antialias, fg)
+            outline_surf = font.render(text, antialias, outline)
+            w = max(base.get_width(), outline_surf.get_width()) + 2
+            h = max(base.get_height(), outline_surf.get_height()) + 2
+            surf = pygame.Surface((w, h), pygame.SRCALPHA)
+            for ox, oy in offsets:
+                surf.blit(outline_surf, (ox + 1, oy + 1))
+            surf.blit(base, (1, 1))
+            surf = self._store(key, surf)
+        return surf
+
+    def render_shadow(self, font, text, fg, shadow, offset=(2, 2), antialias=True):
+        """Texto con sombra desplazada; el texto queda en (0, 0) de la superficie."""
+        text = str(text)
+        dx, dy = offset
+        key = ('shadow', font, text, tuple(fg), (tuple(shadow), (dx, dy)), bool(antialias))
+        surf = self._lookup(key)
+        if surf is None:
+            base = font.render(text, antialias, fg)
+            shadow_surf = font.render(text, antialias, shadow)
+            surf = pygame.Surface((base.get_width() + abs(dx), base.get_height() + abs(dy)), pygame.SRCALPHA)
+            surf.blit(shadow_surf, (max(0, dx), max(0, dy)))
+            surf.blit(base, (max(0, -dx), max(0, -dy)))
+            surf = self._store(key, surf)
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self, scope=None):
+        """Hits/misses por scope (o solo del scope indicado)."""
+        def row(counters):
+            hits, misses = counters
+            total = hits + misses
+            return {'hits': hits, 'misses': misses, 'hit_rate': (hits / total) if total else 0.0}
+        if scope is not None:
+            return row(self._stats.get(scope, [0, 0]))
+        out = {str(k): row(v) for k, v in self._stats.items()}
+        out['_entries'] = len(self._entries)
+        out['_evictions'] = self.evictions
+        return out
+
+
+_text_cache = None
+
+
+def get_text_cache():
+    global _text_cache
+    if _text_cache is None:
+        _text_cache = TextCache()
+    return _text_cache
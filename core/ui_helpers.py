@@ -1,11 +1,13 @@
 import pygame
-from pantallas.pantalla_reglas import draw_persistent_hud as reglas_draw_hud
+from core.fonts import get_fonts
+from core.hud import get_hud
+from core.text_cache import get_text_cache
 
 
 def draw_persistent_hud(screen, estado, fallback_draw=None):
-    """Try to draw HUD using the reglas helper; fallback to provided function."""
+    """Try to draw the cached HUD (core.hud); fallback to provided function."""
     try:
-        reglas_draw_hud(screen, estado)
+        get_hud().draw(screen, estado)
         return
     except Exception:
         pass
@@ -30,11 +32,46 @@ def draw_game_over_modal(screen, remaining_seconds):
         box = pygame.Rect(box_x, box_y, box_w, box_h)
         pygame.draw.rect(screen, (28, 30, 34), box, border_radius=18)
         pygame.draw.rect(screen, (200, 80, 80), box, 4, border_radius=18)
-        title_f = pygame.font.SysFont('Verdana', 36, bold=True)
-        title_s = title_f.render('Has perdido todas las vidas', True, (240, 240, 240))
+        title_f = get_fonts().get(36, bold=True)
+        title_s = get_text_cache().render(title_f, 'Has perdido todas las vidas', (240, 240, 240))
         screen.blit(title_s, (box_x + (box_w - title_s.get_width())//2, box_y + 28))
-        sub_f = pygame.font.SysFont('Verdana', 20)
-        sub_s = sub_f.render(f'Redirigiendo al inicio en {remaining_seconds} s...', True, (220, 220, 220))
+        sub_f = get_fonts().get(20)
+        sub_s = get_text_cache().render(sub_f, f'Redirigiendo al inicio en {remaining_seconds} s...', (220, 220, 220))
         screen.blit(sub_s, (box_x + (box_w - sub_s.get_width())//2, box_y + 28 + title_s.get_height() + 18))
     except Exception:
         pass
+
+
+def draw_resume_modal(screen, snap, total_steps):
+    """Modal "¿Continuar la partida?"; devuelve (rect_continuar, rect_nueva)."""
+    w, h = screen.get_size()
+    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+    overlay.fill((6, 6, 8, 220))
+    screen.blit(overlay, (0, 0))
+    box_w = min(800, int(w * 0.84))
+    box_h = min(280, int(h * 0.5))
+    box = pygame.Rect((w - box_w) // 2, (h - box_h) // 2, box_w, box_h)
+    pygame.draw.rect(screen, (28, 30, 34), box, border_radius=18)
+    pygame.draw.rect(screen, (200, 200, 200), box, 4, border_radius=18)
+    title_f = get_fonts().get(36, bold=True)
+    title_s = get_text_cache().render(title_f, '¿Continuar la partida?', (240, 240, 240))
+    screen.blit(title_s, (box.x + (box_w - title_s.get_width())//2, box.y + 28))
+    sub_f = get_fonts().get(20)
+    elapsed = int(snap.get('elapsed', 0.0))
+    detail = f"{snap.get('nombre') or '---'} — paso {snap.get('seq_idx', 0) + 1} de {total_steps} — {snap.get('vidas', 0)} vidas — {elapsed // 60:02d}:{elapsed % 60:02d}"
+    sub_s = get_text_cache().render(sub_f, detail, (220, 220, 220))
+    screen.blit(sub_s, (box.x + (box_w - sub_s.get_width())//2, box.y + 28 + title_s.get_height() + 18))
+    # two buttons: continue (Enter) / new game (Esc)
+    rects = []
+    btn_w, btn_h, gap = min(260, (box_w - 90) // 2), 52, 30
+    x = box.x + (box_w - (btn_w * 2 + gap)) // 2
+    y = box.bottom - btn_h - 36
+    for label in ('Continuar', 'Nueva partida'):
+        r = pygame.Rect(x, y, btn_w, btn_h)
+        pygame.draw.rect(screen, (245, 245, 245), r, border_radius=10)
+        pygame.draw.rect(screen, (0, 0, 0), r, 2, border_radius=10)
+        txt = get_text_cache().render(sub_f, label, (0, 0, 0))
+        screen.blit(txt, (r.x + (r.w - txt.get_width())//2, r.y + (r.h - txt.get_height())//2))
+        rects.append(r)
+        x += btn_w + gap
+    return rects[0], rects[1]
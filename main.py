@@ -1,6 +1,7 @@
 import pygame
 from core.estado import EstadoGlobal
 from core.app_controller import AppController
+from core.settings_writer import get_settings_writer
 
 
 def main():
@@ -13,6 +14,8 @@ def main():
     try:
         controller.run()
     finally:
+        # make sure the last settings change reaches the disk
+        get_settings_writer().close()
         pygame.quit()
 
 
@@ -1,5 +1,10 @@
 import pygame
 from core.audio import get_audio
+from core.assets import get_assets
+from core.constants import BG_START
+from core.events import HitIndex
+from core.fonts import get_fonts, SYMBOL_FONT_FAMILY
+from core.text_cache import get_text_cache, OUTLINE_4
 
 # Toggle this to True to print debug info about menu hit-testing and events
 # During normal gameplay keep this False to avoid terminal output.
@@ -25,8 +30,8 @@ class PantallaInicio:
         self.rojo = (200, 30, 30)
         self.gris_claro = (230, 230, 230)
 
-        self.titulo_font = pygame.font.SysFont("Verdana", 40, bold=True)
-        self.text_font = pygame.font.SysFont("Verdana", 28)
+        self.titulo_font = get_fonts().get(40, bold=True)
+        self.text_font = get_fonts().get(28)
         # botones
         self.btn_size = 36
         # botón play/pause (izquierda)
@@ -58,6 +63,8 @@ class PantallaInicio:
         self.menu_pressed = -1
         # small animation timers per menu item (frames)
         self._button_anims = [0 for _ in self.menu_items]
+        # menu button rects -> item index (core/events.py)
+        self._menu_hits = HitIndex()
 
     def handle_events(self, event):
         # route ongoing mouse events to the menu handler when the menu is open
@@ -116,6 +123,14 @@ class PantallaInicio:
     def _handle_menu_click(self, pos):
         return None
 
+    def _menu_item_at(self, pos, layout, menu_rects):
+        """Índice del botón del menú bajo `pos`, o -1; el índice se rehace solo si cambia `layout`."""
+        if self._menu_hits.stale(layout):
+            self._menu_hits.clear(layout)
+            for i, r in enumerate(menu_rects):
+                self._menu_hits.add(r, i)
+        return self._menu_hits.hit(pos, -1)
+
     def _menu_handle_event(self, event):
         """Maneja eventos más ricos del menú: scroll, hover, click, drag sliders.
         Devuelve 'records' si la acción solicita navegar fuera, o None.
@@ -184,12 +199,7 @@ class PantallaInicio:
         if event.type == pygame.MOUSEMOTION:
             mx, my = event.pos
             # update hover index (only for options list)
-            new_hover = -1
-            for i, r in enumerate(menu_rects):
-                if r.collidepoint((mx, my)):
-                    new_hover = i
-                    break
-            self.menu_hover = new_hover
+            self.menu_hover = self._menu_item_at((mx, my), (self.menu_view, w, h), menu_rects)
             # if dragging a slider, update value
             if self.menu_dragging_slider is not None and self.menu_dragging:
                 if self.menu_dragging_slider == 'brightness':
@@ -338,23 +348,24 @@ class PantallaInicio:
 
             # check clicks on items (options list) - only when viewing options
             if self.menu_view == 'options':
-                for i, r in enumerate(menu_rects):
-                    if r.collidepoint((mx, my)):
-                        self.menu_pressed = i
-                        # store the exact rect instance we pressed so we can test the same
-                        # geometry on mouse-up (avoids mismatches between draw and
-                        # recomputed geometry). Use a copy to avoid later mutation.
+                i = self._menu_item_at((mx, my), (self.menu_view, w, h), menu_rects)
+                if i >= 0:
+                    r = menu_rects[i]
+                    self.menu_pressed = i
+                    # store the exact rect instance we pressed so we can test the same
+                    # geometry on mouse-up (avoids mismatches between draw and
+                    # recomputed geometry). Use a copy to avoid later mutation.
+                    try:
+                        self._menu_press_rect = pygame.Rect(r)
+                    except Exception:
+                        self._menu_press_rect = None
+                    if DEBUG_MENU:
                         try:
-                            self._menu_press_rect = pygame.Rect(r)
+                            lab = self.menu_items[i] if i < len(self.menu_items) else str(i)
+                            print(f"[MENU] pressed idx={i} lab={lab} rect={self._menu_press_rect}")
                         except Exception:
-                            self._menu_press_rect = None
-                        if DEBUG_MENU:
-                            try:
-                                lab = self.menu_items[i] if i < len(self.menu_items) else str(i)
-                                print(f"[MENU] pressed idx={i} lab={lab} rect={self._menu_press_rect}")
-                            except Exception:
-                                print(f"[MENU] pressed idx={i}")
-                        return None
+                            print(f"[MENU] pressed idx={i}")
+                    return None
 
             # back button
             if back_rect.collidepoint((mx, my)):
@@ -470,7 +481,7 @@ class PantallaInicio:
         pygame.draw.rect(self.screen, (250,250,250), panel, border_radius=12)
         pygame.draw.rect(self.screen, self.rojo, panel, 3, border_radius=12)
 
-        title = self.titulo_font.render('Opciones', True, (0,0,0))
+        title = get_text_cache().render(self.titulo_font, 'Opciones', (0,0,0))
         self.screen.blit(title, (menu_x + 20, menu_y + 12))
 
         # draw according to current subview
@@ -500,7 +511,7 @@ class PantallaInicio:
                     border_color = (255, 100, 100)
                     border_w = 4
                 pygame.draw.rect(self.screen, border_color, r, border_w, border_radius=8)
-                txt = self.text_font.render(lab, True, (20,20,20))
+                txt = get_text_cache().render(self.text_font, lab, (20,20,20))
                 self.screen.blit(txt, (r.x + 16, r.y + (r.h - txt.get_height())//2))
             # store last-drawn rects for event handling
             self._last_menu_rects = menu_rects
@@ -512,7 +523,7 @@ class PantallaInicio:
             # Draw sliders and a back button to options
             # We'll draw a visible track (bar) with a filled portion and a knob,
             # plus clear +/- buttons to the sides. Spacing improved so they don't overlap.
-            label = self.text_font.render('Brillo:', True, (20,20,20))
+            label = get_text_cache().render(self.text_font, 'Brillo:', (20,20,20))
             # compute dynamic vertical positions to avoid overlap
             label_y = menu_y + 86
             label_h = self.text_font.get_height()
@@ -556,8 +567,8 @@ class PantallaInicio:
             pygame.draw.rect(self.screen, (160,160,160), minus_rect, 2, border_radius=6)
             pygame.draw.rect(self.screen, (160,160,160), plus_rect, 2, border_radius=6)
             # center the +/- signs
-            minus_s = self.text_font.render('-', True, (20,20,20))
-            plus_s = self.text_font.render('+', True, (20,20,20))
+            minus_s = get_text_cache().render(self.text_font, '-', (20,20,20))
+            plus_s = get_text_cache().render(self.text_font, '+', (20,20,20))
             # hover visual
             mx,my = pygame.mouse.get_pos()
             if minus_rect.collidepoint((mx,my)):
@@ -571,10 +582,10 @@ class PantallaInicio:
             # show brightness percent
             # vertical center for percent/value
             pct_y = b_track.y + (b_track.h - self.text_font.get_height()) // 2
-            self.screen.blit(self.text_font.render(f"{int(rel_b*100)}%", True, (20,20,20)), (b_track.x + b_track.w + 56, pct_y))
+            self.screen.blit(get_text_cache().render(self.text_font, f"{int(rel_b*100)}%", (20,20,20)), (b_track.x + b_track.w + 56, pct_y))
 
             # Contraste (separado verticalmente)
-            label2 = self.text_font.render('Contraste:', True, (20,20,20))
+            label2 = get_text_cache().render(self.text_font, 'Contraste:', (20,20,20))
             # place contrast below brightness with spacing
             c_label_y = b_track.y + b_track.h + 18
             self.screen.blit(label2, (menu_x + 40, c_label_y))
@@ -604,8 +615,8 @@ class PantallaInicio:
             pygame.draw.rect(self.screen, (245,245,245), c_plus, border_radius=6)
             pygame.draw.rect(self.screen, (160,160,160), c_minus, 2, border_radius=6)
             pygame.draw.rect(self.screen, (160,160,160), c_plus, 2, border_radius=6)
-            c_minus_s = self.text_font.render('-', True, (20,20,20))
-            c_plus_s = self.text_font.render('+', True, (20,20,20))
+            c_minus_s = get_text_cache().render(self.text_font, '-', (20,20,20))
+            c_plus_s = get_text_cache().render(self.text_font, '+', (20,20,20))
             # hover visual
             if c_minus.collidepoint((mx,my)):
                 pygame.draw.rect(self.screen, (230,230,230), c_minus, border_radius=6)
@@ -616,13 +627,13 @@ class PantallaInicio:
             # store knob rect
             self._last_c_knob = c_knob_rect
             pct_c_y = c_track.y + (c_track.h - self.text_font.get_height()) // 2
-            self.screen.blit(self.text_font.render(f"{cv:.2f}", True, (20,20,20)), (c_track.x + c_track.w + 56, pct_c_y))
+            self.screen.blit(get_text_cache().render(self.text_font, f"{cv:.2f}", (20,20,20)), (c_track.x + c_track.w + 56, pct_c_y))
 
             # back to options
             back_rect = pygame.Rect(menu_x + 20, menu_y + menu_h - 64, btn_w, btn_h)
             pygame.draw.rect(self.screen, (240,240,240), back_rect, border_radius=8)
             pygame.draw.rect(self.screen, (160,160,160), back_rect, 2, border_radius=8)
-            back_txt = self.text_font.render('Volver a opciones', True, (20,20,20))
+            back_txt = get_text_cache().render(self.text_font, 'Volver a opciones', (20,20,20))
             self.screen.blit(back_txt, (back_rect.x + 12, back_rect.y + 8))
             # store last-drawn rects for event handling
             self._last_b_track = b_track
@@ -649,13 +660,13 @@ class PantallaInicio:
             for i, ln in enumerate(wrapped):
                 if i * lh > max_h:
                     break
-                t = self.text_font.render(ln, True, (20,20,20))
+                t = get_text_cache().render(self.text_font, ln, (20,20,20))
                 self.screen.blit(t, (menu_x + 24, y0 + i * lh))
             # volver a opciones
             back_rect = pygame.Rect(menu_x + 20, menu_y + menu_h - 64, btn_w, btn_h)
             pygame.draw.rect(self.screen, (240,240,240), back_rect, border_radius=8)
             pygame.draw.rect(self.screen, (160,160,160), back_rect, 2, border_radius=8)
-            back_txt = self.text_font.render('Volver a opciones', True, (20,20,20))
+            back_txt = get_text_cache().render(self.text_font, 'Volver a opciones', (20,20,20))
             self.screen.blit(back_txt, (back_rect.x + 12, back_rect.y + 8))
             # store last-drawn rects for event handling
             self._last_b_track = None
@@ -678,22 +689,20 @@ class PantallaInicio:
     def draw(self):
         w, h = self.screen.get_size()
         # dibujar fondo desde assets si existe
-        try:
-            bg = pygame.transform.scale(pygame.image.load('assets/bg_start.jpg'), (w, h))
+        bg = get_assets().background(BG_START, (w, h))
+        if bg is not None:
             self.screen.blit(bg, (0, 0))
-        except Exception:
+        else:
             self.screen.fill((20, 24, 30))
 
         # Título
-        sombra = self.titulo_font.render('Registro de jugador', True, (0,0,0))
-        texto = self.titulo_font.render('Registro de jugador', True, self.blanco)
-        self.screen.blit(sombra, ((w - sombra.get_width())//2 + 2, 60 + 2))
-        self.screen.blit(texto, ((w - texto.get_width())//2, 60))
+        titulo = get_text_cache().render_shadow(self.titulo_font, 'Registro de jugador', self.blanco, (0,0,0))
+        self.screen.blit(titulo, ((w - titulo.get_width() + 2)//2, 60))
 
         # Caja de entrada
         padding_x = 24
         padding_y = 14
-        texto_surface = self.text_font.render(self.input_text if self.input_text else 'Escribí tu nombre...', True, self.negro if self.input_text else (120,120,120))
+        texto_surface = get_text_cache().render(self.text_font, self.input_text if self.input_text else 'Escribí tu nombre...', self.negro if self.input_text else (120,120,120))
         box_width = max(400, texto_surface.get_width() + padding_x * 2)
         box_height = texto_surface.get_height() + padding_y * 2
         box_x = (w - box_width) // 2
@@ -707,20 +716,17 @@ class PantallaInicio:
         text_x = box_x + padding_x
         text_y = box_y + padding_y
         if self.input_text:
-            rojo_text = self.text_font.render(self.input_text, True, self.rojo)
-            offsets = [(-1,0),(1,0),(0,-1),(0,1)]
-            for dx, dy in offsets:
-                self.screen.blit(rojo_text, (text_x + dx, text_y + dy))
-            negro_text = self.text_font.render(self.input_text, True, self.negro)
-            self.screen.blit(negro_text, (text_x, text_y))
+            # texto negro con contorno rojo (4 direcciones); la superficie trae 1px de margen
+            input_s = get_text_cache().render_outlined(self.text_font, self.input_text, self.negro, self.rojo, offsets=OUTLINE_4)
+            self.screen.blit(input_s, (text_x - 1, text_y - 1))
         else:
-            placeholder = self.text_font.render('Escribí tu nombre...', True, (120,120,120))
+            placeholder = get_text_cache().render(self.text_font, 'Escribí tu nombre...', (120,120,120))
             self.screen.blit(placeholder, (text_x, text_y))
 
         # cursor
         if self.cursor_visible and self.active:
             if self.input_text:
-                last_w = self.text_font.render(self.input_text, True, self.negro).get_width()
+                last_w = get_text_cache().render(self.text_font, self.input_text, self.negro).get_width()
             else:
                 last_w = 0
             cursor_x = text_x + last_w + 4
@@ -753,17 +759,13 @@ class PantallaInicio:
         if self.input_text.strip():
             pygame.draw.rect(self.screen, (245,245,245), self.accept_rect, border_radius=14)
             pygame.draw.rect(self.screen, self.rojo, self.accept_rect, 3, border_radius=14)
-            txt = self.text_font.render('Aceptar', True, self.negro)
-            rojo_txt = self.text_font.render('Aceptar', True, self.rojo)
-            for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-                self.screen.blit(rojo_txt, (self.accept_rect.x + (self.accept_rect.width - rojo_txt.get_width())//2 + dx,
-                                            self.accept_rect.y + (self.accept_rect.height - rojo_txt.get_height())//2 + dy))
+            txt = get_text_cache().render_outlined(self.text_font, 'Aceptar', self.negro, self.rojo, offsets=OUTLINE_4)
             self.screen.blit(txt, (self.accept_rect.x + (self.accept_rect.width - txt.get_width())//2,
                                    self.accept_rect.y + (self.accept_rect.height - txt.get_height())//2))
         else:
             pygame.draw.rect(self.screen, (200,200,200), self.accept_rect, border_radius=14)
             pygame.draw.rect(self.screen, (160,160,160), self.accept_rect, 2, border_radius=14)
-            txt = self.text_font.render('Aceptar', True, (120,120,120))
+            txt = get_text_cache().render(self.text_font, 'Aceptar', (120,120,120))
             self.screen.blit(txt, (self.accept_rect.x + (self.accept_rect.width - txt.get_width())//2,
                                    self.accept_rect.y + (self.accept_rect.height - txt.get_height())//2))
 
@@ -778,11 +780,11 @@ class PantallaInicio:
         # panel circular
         pygame.draw.rect(self.screen, (245,245,245), self.gear_rect, border_radius=8)
         pygame.draw.rect(self.screen, self.rojo, self.gear_rect, 2, border_radius=8)
-        gear_font = pygame.font.SysFont('Segoe UI Symbol', 20)
+        gear_font = get_fonts().get(20, family=SYMBOL_FONT_FAMILY)
         try:
-            gear_s = gear_font.render('⚙', True, self.rojo)
+            gear_s = get_text_cache().render(gear_font, '⚙', self.rojo)
         except Exception:
-            gear_s = self.text_font.render('CFG', True, self.rojo)
+            gear_s = get_text_cache().render(self.text_font, 'CFG', self.rojo)
         self.screen.blit(gear_s, (self.gear_rect.x + (self.gear_rect.width - gear_s.get_width())//2,
                                   self.gear_rect.y + (self.gear_rect.height - gear_s.get_height())//2))
 
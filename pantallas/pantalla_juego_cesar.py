@@ -3,41 +3,64 @@ Pantalla Juego César (limpia): muestra la palabra cifrada y solicita respuesta.
 """
 import pygame
 import random
+from core.compositor import get_compositor, paint_background, paint_panel
+from core.constants import BG_AREA, BG_START
+from core.dirty import get_dirty
+from core.fonts import get_fonts
+from core.scheduler import get_scheduler
+from core.text_cache import get_text_cache
 
 
 class PantallaJuegoCesar:
+    # solo cambia la franja inferior (respuesta, validar, alertas, continuar)
+    dirty_tracking = True
+
     def __init__(self, screen, index, titulo):
         self.screen = screen
         self.index = index
         self.titulo = titulo
-        self.font_title = pygame.font.SysFont('Verdana', 30, bold=True)
-        self.font_text = pygame.font.SysFont('Verdana', 20)
+        self.font_title = get_fonts().get(30, bold=True)
+        self.font_text = get_fonts().get(20)
+        self.shift = 3
+        self.submit_rect = pygame.Rect(0, 0, 160, 44)
+        # fondo, panel, título e instrucciones: se componen una vez
+        self.static_layer = get_compositor().layer(self._build_static)
+        self._inst_bottom = 0
+        self.reset()
+
+    def reset(self, seed=None):
+        """Nueva palabra y respuesta vacía; con `seed`, la misma palabra que con ese seed.
+
+        Fuentes y capa estática se conservan: `AppController` reutiliza la
+        pantalla entre partidas.
+        """
+        if seed is not None:
+            random.seed(seed)
         self.input_text = ''
         self.active = True
         self.alert = ''
-        self.alert_until = 0
+        self.completed = False
         # Usar lista de palabras y lógica del otro proyecto (VF-Escape-Room)
         words = [
             "cesar", "clave", "python", "escape", "codigo",
             "logica", "pantalla", "juego"
         ]
         self.original = random.choice(words)
+        self.encoded = self._cifrar(self.original, self.shift)
+        self.submit_hover = False
+        self._drawn_state = None
 
+    @staticmethod
+    def _cifrar(texto, desplazamiento):
         # Cifrar solo letras ASCII a-z/A-Z (la 'ñ' no cuenta)
-        def cifrar(texto, desplazamiento):
-            resultado = ""
-            for letra in texto:
-                if letra.isalpha() and letra.lower() in 'abcdefghijklmnopqrstuvwxyz':
-                    base = ord('a') if letra.islower() else ord('A')
-                    resultado += chr((ord(letra) - base + desplazamiento) % 26 + base)
-                else:
-                    resultado += letra
-            return resultado
-
-        self.shift = 3
-        self.encoded = cifrar(self.original, self.shift)
-        self.submit_rect = pygame.Rect(0, 0, 160, 44)
-        self.submit_hover = False
+        resultado = ""
+        for letra in texto:
+            if letra.isalpha() and letra.lower() in 'abcdefghijklmnopqrstuvwxyz':
+                base = ord('a') if letra.islower() else ord('A')
+                resultado += chr((ord(letra) - base + desplazamiento) % 26 + base)
+            else:
+                resultado += letra
+        return resultado
 
     def handle_events(self, event):
         if event.type == pygame.KEYDOWN and self.active:
@@ -78,10 +101,9 @@ class PantallaJuegoCesar:
         if guess == self.original:
             # show success alert and only allow continuing after 2s
             now = pygame.time.get_ticks()
-            self.alert = '¡Correcto! Terminaste este juego.'
-            self.alert_until = now + 2000
+            self._show_alert('¡Correcto! Terminaste este juego.', 2000)
             self.input_text = ''
-            # mark as completed; continue will be accepted after alert_until
+            # mark as completed; continue will be accepted after the countdown
             self.completed = True
             # schedule auto-advance in 5 seconds (show countdown)
             self.auto_advance_until = now + 5000
@@ -92,8 +114,7 @@ class PantallaJuegoCesar:
                 pass
             return None
         else:
-            self.alert = 'Incorrecto — inténtalo otra vez.'
-            self.alert_until = pygame.time.get_ticks() + 1400
+            self._show_alert('Incorrecto — inténtalo otra vez.', 1400)
             self.input_text = ''
             # decrement a life on incorrect answer if estado is available
             try:
@@ -106,58 +127,52 @@ class PantallaJuegoCesar:
                 pass
             return None
 
-    def update(self):
-        if self.alert and pygame.time.get_ticks() > self.alert_until:
-            self.alert = ''
+    def _show_alert(self, text, ms):
+        self.alert = text
+        get_scheduler().after(ms, self._clear_alert)
 
-    def draw(self):
-        w, h = self.screen.get_size()
-        try:
-            bg = pygame.transform.scale(pygame.image.load('assets/area.jpg'), (w, h))
-            self.screen.blit(bg, (0, 0))
-        except Exception:
-            try:
-                bg = pygame.transform.scale(pygame.image.load('assets/bg_start.jpg'), (w, h))
-                self.screen.blit(bg, (0, 0))
-            except Exception:
-                self.screen.fill((18, 20, 24))
+    def _clear_alert(self):
+        self.alert = ''
+
+    def is_animating(self):
+        return False
 
+    def update(self):
+        pass
+
+    def _panel_rect(self, w, h):
         # make panel smaller so HUD doesn't overlap and layout feels lighter
         panel_w = int(w * 0.76)
         panel_h = int(h * 0.72)
-        panel_x = (w - panel_w) // 2
-        panel_y = (h - panel_h) // 2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        return pygame.Rect((w - panel_w) // 2, (h - panel_h) // 2, panel_w, panel_h)
+
+    def _build_static(self, surface):
+        w, h = surface.get_size()
+        paint_background(surface, (BG_AREA, BG_START))
+        panel_x, panel_y, panel_w, panel_h = self._panel_rect(w, h)
         # dibujar panel redondeado (fill + border) para que las esquinas sean transparentes
-        try:
-            pygame.draw.rect(panel_surf, (8, 8, 12, 200), panel_surf.get_rect(), border_radius=18)
-            pygame.draw.rect(panel_surf, (200, 200, 200), panel_surf.get_rect(), 3, border_radius=18)
-            self.screen.blit(panel_surf, (panel_x, panel_y))
-        except Exception:
-            # fallback rectangular
-            panel_surf.fill((8, 8, 12, 200))
-            self.screen.blit(panel_surf, (panel_x, panel_y))
-            pygame.draw.rect(self.screen, (200, 200, 200), panel_rect, 3)
+        paint_panel(surface, (panel_x, panel_y, panel_w, panel_h), (8, 8, 12, 200))
 
         # centered title with subtle shadow
-        title_s = self.font_title.render(self.titulo, True, (240, 240, 240))
-        # shadow
-        try:
-            self.screen.blit(self.font_title.render(self.titulo, True, (12,12,12)), (panel_x + (panel_w - title_s.get_width())//2 + 2, panel_y + 18 + 2))
-        except Exception:
-            pass
-        self.screen.blit(title_s, (panel_x + (panel_w - title_s.get_width())//2, panel_y + 18))
+        title_s = get_text_cache().render_shadow(self.font_title, self.titulo, (240, 240, 240), (12,12,12))
+        surface.blit(title_s, (panel_x + (panel_w - title_s.get_width() + 2)//2, panel_y + 18))
 
         inst = 'Este juego usa cifrado César (3 letras adelante). Verás la palabra CIFRADA y debes escribir la original. La letra "ñ" no se considera.'
         y = panel_y + 80
         lines = self._wrap_text(inst, self.font_text, panel_w - 60)
         for ln in lines:
-            self.screen.blit(self.font_text.render(ln, True, (220, 220, 220)), (panel_x + 30, y))
+            surface.blit(get_text_cache().render(self.font_text, ln, (220, 220, 220)), (panel_x + 30, y))
             y += self.font_text.get_height() + 6
+        self._inst_bottom = y
 
-        big_font = pygame.font.SysFont('Verdana', 56, bold=True)
-        big = big_font.render(self.encoded.upper(), True, (255, 230, 140))
+    def draw(self):
+        w, h = self.screen.get_size()
+        self.static_layer.blit(self.screen)
+        panel_x, panel_y, panel_w, panel_h = self._panel_rect(w, h)
+        y = self._inst_bottom
+
+        big_font = get_fonts().get(56, bold=True)
+        big = get_text_cache().render(big_font, self.encoded.upper(), (255, 230, 140))
         # subtle background pill behind code
         code_x = panel_x + (panel_w - big.get_width()) // 2
         code_y = y + 8
@@ -173,13 +188,13 @@ class PantallaJuegoCesar:
 
         # input area: place above bottom to avoid HUD overlap
         inp_y = panel_y + panel_h - 120
-        prompt = self.font_text.render('Tu respuesta:', True, (220, 220, 220))
+        prompt = get_text_cache().render(self.font_text, 'Tu respuesta:', (220, 220, 220))
         self.screen.blit(prompt, (panel_x + 30, inp_y))
         box = pygame.Rect(panel_x + 160, inp_y - 6, panel_w - 420, 44)
         # dark rounded input with light text
         pygame.draw.rect(self.screen, (28, 30, 34), box, border_radius=10)
         pygame.draw.rect(self.screen, (100, 100, 100), box, 2, border_radius=10)
-        txt = self.font_text.render(self.input_text or '', True, (230, 230, 230))
+        txt = get_text_cache().render(self.font_text, self.input_text or '', (230, 230, 230))
         self.screen.blit(txt, (box.x + 12, box.y + (box.h - txt.get_height()) // 2))
 
         # El botón de envío se mantiene funcional (detección de clicks y Enter),
@@ -194,13 +209,13 @@ class PantallaJuegoCesar:
         border_col = (30,30,30)
         pygame.draw.rect(self.screen, btn_color, self.submit_rect, border_radius=12)
         pygame.draw.rect(self.screen, border_col, self.submit_rect, 2, border_radius=12)
-        bf = pygame.font.SysFont('Verdana', 20, bold=True)
-        bt = bf.render('Validar', True, (0,0,0))
+        bf = get_fonts().get(20, bold=True)
+        bt = get_text_cache().render(bf, 'Validar', (0,0,0))
         self.screen.blit(bt, (self.submit_rect.x + (self.submit_rect.w - bt.get_width())//2, self.submit_rect.y + (self.submit_rect.h - bt.get_height())//2))
 
         # show transient alerts only when not in the completed auto-advance modal
         if self.alert and not getattr(self, 'completed', False):
-            a = self.font_text.render(self.alert, True, (255, 200, 80))
+            a = get_text_cache().render(self.font_text, self.alert, (255, 200, 80))
             self.screen.blit(a, (panel_x + 30, self.submit_rect.y - 34))
 
         # show continue button when completed (but only active after alert period)
@@ -213,16 +228,25 @@ class PantallaJuegoCesar:
                 remaining = max(0, int((self.auto_advance_until - now + 999)//1000))
                 pygame.draw.rect(self.screen, (200,200,200), cont, border_radius=16)
                 pygame.draw.rect(self.screen, (140,140,140), cont, 3, border_radius=16)
-                f = pygame.font.SysFont('Verdana', 20, bold=True)
-                t = f.render(f'Avanzar en {remaining}', True, (100,100,100))
+                f = get_fonts().get(20, bold=True)
+                t = get_text_cache().render(f, f'Avanzar en {remaining}', (100,100,100))
                 self.screen.blit(t, (cont.x + (cont.w - t.get_width())//2, cont.y + (cont.h - t.get_height())//2))
             else:
                 pygame.draw.rect(self.screen, (245,245,245), cont, border_radius=16)
                 pygame.draw.rect(self.screen, (30,30,30), cont, 3, border_radius=16)
-                f = pygame.font.SysFont('Verdana', 22, bold=True)
-                t = f.render('Continuar', True, (0,0,0))
+                f = get_fonts().get(22, bold=True)
+                t = get_text_cache().render(f, 'Continuar', (0,0,0))
                 self.screen.blit(t, (cont.x + (cont.w - t.get_width())//2, cont.y + (cont.h - t.get_height())//2))
 
+        # the band below the code holds every widget that changes; report it when its state changes
+        # (every frame while the completed countdown runs)
+        band_y = box.y - 40
+        band = pygame.Rect(panel_x, band_y, panel_w, panel_y + panel_h - band_y)
+        state = (self.input_text, self.submit_hover, self.alert, getattr(self, 'completed', False))
+        if state != self._drawn_state or getattr(self, 'completed', False):
+            get_dirty().add(band)
+            self._drawn_state = state
+
     def _wrap_text(self, text, font, max_width):
         words = text.split()
         lines = []
@@ -1,6 +1,13 @@
 import pygame
 import random
 import os
+from core.assets import get_assets
+from core.compositor import get_compositor, paint_background, paint_panel
+from core.constants import BG_AREA
+from core.events import HitIndex
+from core.fonts import get_fonts
+from core.scheduler import get_scheduler
+from core.text_cache import get_text_cache
 
 
 class PantallaJuegoParejas:
@@ -10,20 +17,34 @@ class PantallaJuegoParejas:
         self.screen = screen
         self.index = index
         self.titulo = titulo
-        self.font_title = pygame.font.SysFont('Verdana', 30, bold=True)
-        self.font_text = pygame.font.SysFont('Verdana', 20)
+        self.font_title = get_fonts().get(30, bold=True)
+        self.font_text = get_fonts().get(20)
         self.images = []
-        for i in range(1,6):
-            p = os.path.join('assets', f'img{i}.png')
+        # source path per loaded surface so scaled copies come from the asset cache
+        self.image_paths = {}
+        for p, _ in self.preload_assets(index):
             try:
-                img = pygame.image.load(p).convert_alpha()
+                img = get_assets().get(p, mode='alpha')
                 self.images.append(img)
+                self.image_paths[img] = p
             except Exception:
                 pass
         if len(self.images) < 4:
             # fallback to simple colored squares if not enough images
             self.images = [None]*4
 
+        self.cont_rect = pygame.Rect(0,0,240,56)
+        # card rects -> card index (core/events.py)
+        self._hits = HitIndex()
+        self.card_rects = []
+        # fondo + panel + título: capa estática compuesta una vez
+        self.static_layer = get_compositor().layer(self._build_static)
+        self.reset()
+
+    def reset(self, seed=None):
+        """Nuevo mazo (con `seed`, el mismo que con ese seed); las imágenes ya cargadas se conservan."""
+        if seed is not None:
+            random.seed(seed)
         # pick 4 images to use
         choices = random.sample(self.images, 4)
         deck = choices + choices
@@ -32,14 +53,18 @@ class PantallaJuegoParejas:
         self.revealed = [False]*8
         self.locked = [False]*8
         self.first = None
-        self.wait_timer = 0
         self.message = ''
         self.completed = False
-        self.cont_rect = pygame.Rect(0,0,240,56)
+
+    @classmethod
+    def preload_assets(cls, index):
+        """Imágenes (ruta, modo) que decodifica `core.scenes` antes de mostrar la pantalla."""
+        return [(os.path.join('assets', f'img{i}.png'), 'alpha') for i in range(1, 6)]
 
     def handle_events(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.wait_timer > 0:
+            # a failed pair is still showing
+            if get_scheduler().pending(self._hide_unmatched):
                 return None
             # if completed, only allow manual continue after auto-advance timeout
             if self.completed:
@@ -52,102 +77,51 @@ class PantallaJuegoParejas:
                 if self.cont_rect.collidepoint((mx,my)):
                     return 'next'
                 return None
-            mx,my = event.pos
-            w,h = self.screen.get_size()
-            panel_w = int(w*0.9)
-            panel_h = int(h*0.9)
-            panel_x = (w - panel_w)//2
-            panel_y = (h - panel_h)//2
-            margin = 28
-            inner_w = panel_w - margin*2
-            inner_h = panel_h - margin*2 - 80
-            grid_x = panel_x + margin
-            grid_y = panel_y + margin + 40
-            cols = 4
-            rows = 2
-            card_w = int((inner_w - (cols-1)*12) / cols)
-            card_h = int((inner_h - (rows-1)*12) / rows)
-            for idx in range(8):
-                rcol = idx % cols
-                rrow = idx // cols
-                rx = grid_x + rcol * (card_w + 12)
-                ry = grid_y + rrow * (card_h + 12)
-                rect = pygame.Rect(rx, ry, card_w, card_h)
-                if rect.collidepoint((mx,my)) and not self.locked[idx]:
-                    # reveal
-                    self.revealed[idx] = True
-                    if self.first is None:
-                        self.first = idx
+            idx = self._layout().hit(event.pos)
+            if idx is not None and not self.locked[idx]:
+                # reveal
+                self.revealed[idx] = True
+                if self.first is None:
+                    self.first = idx
+                else:
+                    # check match
+                    if self._same_image(self.deck[self.first], self.deck[idx]):
+                        self.locked[self.first] = True
+                        self.locked[idx] = True
+                        self.first = None
+                        # check win
+                        if all(self.locked):
+                            # mark completed and show message
+                            self.completed = True
+                            self.message = '¡Correcto! Preparando siguiente...'
+                            # ensure any pending timers are cleared
+                            get_scheduler().cancel(self._hide_unmatched)
+                            # start auto-advance countdown (5 seconds)
+                            try:
+                                self.auto_advance_until = pygame.time.get_ticks() + 5000
+                            except Exception:
+                                self.auto_advance_until = None
                     else:
-                        # check match
-                        if self._same_image(self.deck[self.first], self.deck[idx]):
-                            self.locked[self.first] = True
-                            self.locked[idx] = True
-                            self.first = None
-                            # check win
-                            if all(self.locked):
-                                # mark completed and show message
-                                self.completed = True
-                                self.message = '¡Correcto! Preparando siguiente...'
-                                # ensure any pending timers are cleared
-                                self.wait_timer = 0
-                                # start auto-advance countdown (5 seconds)
+                        # start hide timer
+                        get_scheduler().after(800, self._hide_unmatched)
+                        # player made a mistake: decrement a life if estado is available
+                        try:
+                            if hasattr(self, 'estado') and getattr(self, 'estado') is not None:
                                 try:
-                                    self.auto_advance_until = pygame.time.get_ticks() + 5000
+                                    self.estado.perder_vida(1)
                                 except Exception:
-                                    self.auto_advance_until = None
-                        else:
-                            # start hide timer
-                            self.wait_timer = pygame.time.get_ticks() + 800
-                            # player made a mistake: decrement a life if estado is available
-                            try:
-                                if hasattr(self, 'estado') and getattr(self, 'estado') is not None:
-                                    try:
-                                        self.estado.perder_vida(1)
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                pass
-                    break
+                                    pass
+                        except Exception:
+                            pass
         return None
 
-    def _same_image(self, a, b):
-        # since images may be None placeholders, compare by id or None
-        return (a is None and b is None) or (a is not None and b is not None and a.get_rect().size == b.get_rect().size and a.get_bitsize() == b.get_bitsize())
-
-    def update(self):
-        if self.wait_timer and pygame.time.get_ticks() >= self.wait_timer:
-            # hide the last two revealed that are not locked
-            for i in range(8):
-                if not self.locked[i] and self.revealed[i]:
-                    self.revealed[i] = False
-            self.first = None
-            self.wait_timer = 0
-
-    def draw(self):
+    def _layout(self):
+        """Rectángulos de las 8 cartas (4x2) e índice de clics; se recalculan solo al cambiar el tamaño."""
         w,h = self.screen.get_size()
-        try:
-            bg = pygame.transform.scale(pygame.image.load('assets/area.jpg'), (w, h))
-            self.screen.blit(bg, (0,0))
-        except Exception:
-            self.screen.fill((18,20,24))
-
-        # panel
-        panel_w = int(w*0.9)
-        panel_h = int(h*0.9)
-        panel_x = (w - panel_w)//2
-        panel_y = (h - panel_h)//2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        # mismo look apagado que el juego Simon
-        panel_surf.fill((8,8,12,200))
-        self.screen.blit(panel_surf, (panel_x, panel_y))
-        pygame.draw.rect(self.screen, (200,200,200), panel_rect, 3, border_radius=18)
-
-        title = self.font_title.render(self.titulo, True, (255,255,255))
-        self.screen.blit(title, (panel_x + 24, panel_y + 18))
-
-        # draw grid
+        if not self._hits.stale((w, h)):
+            return self._hits
+        self._hits.clear((w, h))
+        panel_x, panel_y, panel_w, panel_h = self._panel_rect(w, h)
         margin = 28
         inner_w = panel_w - margin*2
         inner_h = panel_h - margin*2 - 80
@@ -157,18 +131,61 @@ class PantallaJuegoParejas:
         rows = 2
         card_w = int((inner_w - (cols-1)*12) / cols)
         card_h = int((inner_h - (rows-1)*12) / rows)
+        self.card_rects = []
         for idx in range(8):
             rcol = idx % cols
             rrow = idx // cols
             rx = grid_x + rcol * (card_w + 12)
             ry = grid_y + rrow * (card_h + 12)
             rect = pygame.Rect(rx, ry, card_w, card_h)
+            self.card_rects.append(rect)
+            self._hits.add(rect, idx)
+        return self._hits
+
+    def _same_image(self, a, b):
+        # since images may be None placeholders, compare by id or None
+        return (a is None and b is None) or (a is not None and b is not None and a.get_rect().size == b.get_rect().size and a.get_bitsize() == b.get_bitsize())
+
+    def _hide_unmatched(self):
+        # hide the last two revealed that are not locked
+        for i in range(8):
+            if not self.locked[i] and self.revealed[i]:
+                self.revealed[i] = False
+        self.first = None
+
+    def update(self):
+        pass
+
+    def _panel_rect(self, w, h):
+        panel_w = int(w*0.9)
+        panel_h = int(h*0.9)
+        return pygame.Rect((w - panel_w)//2, (h - panel_h)//2, panel_w, panel_h)
+
+    def _build_static(self, surface):
+        w,h = surface.get_size()
+        paint_background(surface, BG_AREA)
+        # panel: mismo look apagado que el juego Simon
+        panel_x, panel_y, panel_w, panel_h = self._panel_rect(w, h)
+        paint_panel(surface, (panel_x, panel_y, panel_w, panel_h), (8,8,12,200), rounded_fill=False)
+
+        title = get_text_cache().render(self.font_title, self.titulo, (255,255,255))
+        surface.blit(title, (panel_x + 24, panel_y + 18))
+
+    def draw(self):
+        w,h = self.screen.get_size()
+        self.static_layer.blit(self.screen)
+        panel_x, panel_y, panel_w, panel_h = self._panel_rect(w, h)
+
+        # draw grid
+        self._layout()
+        for idx, rect in enumerate(self.card_rects):
+            card_w, card_h = rect.size
             if self.revealed[idx] or self.locked[idx]:
                 # show image if available
                 img = self.deck[idx]
                 if img:
                     try:
-                        scaled = pygame.transform.smoothscale(img, (card_w, card_h))
+                        scaled = get_assets().get(self.image_paths[img], (card_w, card_h), mode='alpha', smooth=True)
                     except Exception:
                         scaled = pygame.transform.scale(img, (card_w, card_h))
                     self.screen.blit(scaled, rect)
@@ -185,18 +202,18 @@ class PantallaJuegoParejas:
                 # show countdown instead of active button
                 pygame.draw.rect(self.screen, (200,200,200), self.cont_rect, border_radius=16)
                 pygame.draw.rect(self.screen, (140,140,140), self.cont_rect, 3, border_radius=16)
-                f = pygame.font.SysFont('Verdana', 20, bold=True)
+                f = get_fonts().get(20, bold=True)
                 remaining = max(0, int((self.auto_advance_until - now + 999)//1000))
-                t = f.render(f'Avanzar en {remaining}', True, (100,100,100))
+                t = get_text_cache().render(f, f'Avanzar en {remaining}', (100,100,100))
                 self.screen.blit(t, (self.cont_rect.x + (self.cont_rect.w - t.get_width())//2, self.cont_rect.y + (self.cont_rect.h - t.get_height())//2))
             else:
                 pygame.draw.rect(self.screen, (245,245,245), self.cont_rect, border_radius=12)
                 pygame.draw.rect(self.screen, (30,120,30), self.cont_rect, 3, border_radius=12)
-                f = pygame.font.SysFont('Verdana', 22, bold=True)
-                t = f.render('Continuar', True, (0,0,0))
+                f = get_fonts().get(22, bold=True)
+                t = get_text_cache().render(f, 'Continuar', (0,0,0))
                 self.screen.blit(t, (self.cont_rect.x + (self.cont_rect.w - t.get_width())//2, self.cont_rect.y + (self.cont_rect.h - t.get_height())//2))
 
         # message (transient); when completed we already show the modal/button so avoid duplicate
         if self.message and not self.completed:
-            m = self.font_text.render(self.message, True, (255,200,80))
+            m = get_text_cache().render(self.font_text, self.message, (255,200,80))
             self.screen.blit(m, (panel_x + 30, (self.cont_rect.y if self.completed else panel_y + panel_h - 40)))
@@ -1,4 +1,8 @@
 import pygame
+from core.compositor import get_compositor, paint_background, paint_panel
+from core.constants import BG_AREA, BG_START
+from core.fonts import get_fonts
+from core.text_cache import get_text_cache
 
 
 class PantallaJuegoPlaceholder:
@@ -9,9 +13,11 @@ class PantallaJuegoPlaceholder:
         self.screen = screen
         self.index = index
         self.titulo = titulo
-        self.font_title = pygame.font.SysFont('Verdana', 34, bold=True)
-        self.font_text = pygame.font.SysFont('Verdana', 20)
+        self.font_title = get_fonts().get(34, bold=True)
+        self.font_text = get_fonts().get(20)
         self.finish_rect = pygame.Rect(0, 0, 220, 56)
+        # la pantalla no tiene elementos dinámicos: todo va a la capa estática
+        self.static_layer = get_compositor().layer(self._build_static)
 
     def handle_events(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -23,28 +29,22 @@ class PantallaJuegoPlaceholder:
             return 'next'
         return None
 
+    def is_animating(self):
+        return False
+
     def update(self):
         return
 
-    def draw(self):
-        w,h = self.screen.get_size()
+    def _build_static(self, surface):
+        w,h = surface.get_size()
         # use the same background as rules (area.jpg) if available, otherwise fallback
-        try:
-            bg_img = pygame.image.load('assets/area.jpg')
-            bg = pygame.transform.scale(bg_img, (w, h))
-            self.screen.blit(bg, (0,0))
-        except Exception:
-            try:
-                bg = pygame.transform.scale(pygame.image.load('assets/bg_start.jpg'), (w, h))
-                self.screen.blit(bg, (0,0))
-            except Exception:
-                self.screen.fill((18,20,24))
+        paint_background(surface, (BG_AREA, BG_START))
 
-        title_surf = self.font_title.render(self.titulo, True, (240,240,240))
-        self.screen.blit(title_surf, ((w - title_surf.get_width())//2, 40))
+        title_surf = get_text_cache().render(self.font_title, self.titulo, (240,240,240))
+        surface.blit(title_surf, ((w - title_surf.get_width())//2, 40))
 
-        info = self.font_text.render('Aquí iría la lógica del minijuego (placeholder).', True, (220,220,220))
-        self.screen.blit(info, ((w - info.get_width())//2, 140))
+        info = get_text_cache().render(self.font_text, 'Aquí iría la lógica del minijuego (placeholder).', (220,220,220))
+        surface.blit(info, ((w - info.get_width())//2, 140))
 
         # central rounded panel occupying ~80% of the window (centered)
         panel_w = int(w * 0.8)
@@ -55,11 +55,8 @@ class PantallaJuegoPlaceholder:
 
         # semi-transparent panel surface for nicer overlay on the background
         # draw rounded translucent panel
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        panel_surf.fill((0,0,0,0))
-        pygame.draw.rect(panel_surf, (18, 20, 24, 220), pygame.Rect(0, 0, panel_w, panel_h), border_radius=18)
-        self.screen.blit(panel_surf, (panel_x, panel_y))
-        pygame.draw.rect(self.screen, (200,200,200), panel_rect, 3, border_radius=18)
+        paint_panel(surface, panel_rect, (18, 20, 24, 220), border=None)
+        pygame.draw.rect(surface, (200,200,200), panel_rect, 3, border_radius=18)
 
         # inside the panel, draw a placeholder left/right layout scaled to panel
         margin = 28
@@ -67,14 +64,20 @@ class PantallaJuegoPlaceholder:
         inner_h = panel_h - margin*2 - 80  # leave space for title at top inside panel
         left = pygame.Rect(panel_x + margin, panel_y + margin + 40, int(inner_w * 0.45), inner_h)
         right = pygame.Rect(left.right + 24, left.y, int(inner_w * 0.55) - 24, inner_h)
-        pygame.draw.rect(self.screen, (70,120,170), left, border_radius=12)
-        pygame.draw.rect(self.screen, (36,36,36), right, border_radius=12)
+        pygame.draw.rect(surface, (70,120,170), left, border_radius=12)
+        pygame.draw.rect(surface, (36,36,36), right, border_radius=12)
 
         # finish button
+        finish_rect = self.finish_rect.copy()
+        finish_rect.center = (w//2, h - 80)
+        pygame.draw.rect(surface, (245,245,245), finish_rect, border_radius=14)
+        pygame.draw.rect(surface, (200,30,30), finish_rect, 3, border_radius=14)
+        f = get_fonts().get(22, bold=True)
+        txt = get_text_cache().render(f, 'Finalizar (simular)', (0,0,0))
+        surface.blit(txt, (finish_rect.x + (finish_rect.width - txt.get_width())//2,
+                               finish_rect.y + (finish_rect.height - txt.get_height())//2))
+
+    def draw(self):
+        w,h = self.screen.get_size()
+        self.static_layer.blit(self.screen)
         self.finish_rect.center = (w//2, h - 80)
-        pygame.draw.rect(self.screen, (245,245,245), self.finish_rect, border_radius=14)
-        pygame.draw.rect(self.screen, (200,30,30), self.finish_rect, 3, border_radius=14)
-        f = pygame.font.SysFont('Verdana', 22, bold=True)
-        txt = f.render('Finalizar (simular)', True, (0,0,0))
-        self.screen.blit(txt, (self.finish_rect.x + (self.finish_rect.width - txt.get_width())//2,
-                               self.finish_rect.y + (self.finish_rect.height - txt.get_height())//2))
@@ -1,5 +1,12 @@
 import pygame
 import random
+from core.assets import get_assets
+from core.compositor import get_compositor, paint_background, paint_panel
+from core.constants import BG_AREA, BG_START
+from core.events import HitIndex
+from core.fonts import get_fonts
+from core.scheduler import get_scheduler
+from core.text_cache import get_text_cache
 
 
 class PantallaJuegoSimon:
@@ -7,41 +14,65 @@ class PantallaJuegoSimon:
     Se basa en la implementación de PatronMemoria del otro proyecto: carga
     imágenes de `assets/` y las muestra/animan durante la reproducción.
     """
+    # playback durations (ms)
+    ON_MS = 450
+    OFF_MS = 200
+    OFF_REPEAT_MS = 300
+    # pad images, from assets/
+    IMAGES = ("img1.png", "img2.png", "img3.png", "img4.png")
 
     def __init__(self, screen, index, titulo):
         self.screen = screen
         self.index = index
         self.titulo = titulo
-        self.font_title = pygame.font.SysFont('Verdana', 28, bold=True)
-        self.font_text = pygame.font.SysFont('Verdana', 18)
+        self.font_title = get_fonts().get(28, bold=True)
+        self.font_text = get_fonts().get(18)
+        # start delay before first pattern (ms)
+        self.start_delay_ms = 3000
+        self.images = []
+        self.load_images()
+        # pad rects -> pad index (core/events.py)
+        self._hits = HitIndex()
+        self.pad_rects = []
+        # fondo + panel + título: capa estática compuesta una vez
+        self.static_layer = get_compositor().layer(self._build_static)
+        self.reset()
+
+    def reset(self, seed=None):
+        """Vuelve al estado inicial (sin secuencia); con `seed`, las rondas salen de ese seed.
+
+        Las imágenes y la capa estática se conservan entre partidas.
+        """
+        if seed is not None:
+            random.seed(seed)
         self.sequence = []
         self.player = []
-        # playback state
+        # playback state (each ON/OFF phase is a scheduler timer)
         self.playing = False
-        self.last_step_time = 0
         self.show_idx = 0
+        self.show_phase = None
         # alert and timing
         self.alert = ''
-        self.alert_until = 0
-        # start delay before first pattern (ms)
-        self.start_delay_ms = 3000
-        self.start_at = pygame.time.get_ticks() + self.start_delay_ms
         self.waiting_to_start = True
-        # after playback, show 'Tu turno' for 2000ms
-        self.show_turn_until = 0
         self.player_allowed = False
         # finished state for final pattern
         self.finished = False
         self.final_alert = ''
-        self.final_alert_until = 0
-        self.images = []
-        self.load_images()
-        # start will be triggered after initial delay
+        # start will be triggered after initial delay (counted from on_show)
         # level display (show 'Nivel N' before playback)
         self.current_level = 0
-        self.level_show_until = 0
-        # click feedback map: pad_index -> expiry_time (ms)
-        self.click_feedback = {}
+        self.level_showing = False
+        # pads with click feedback on (cleared shortly after the last click)
+        self.click_feedback = set()
+
+    @classmethod
+    def preload_assets(cls, index):
+        """Imágenes (ruta, modo) que decodifica `core.scenes` antes de mostrar la pantalla."""
+        return [(f"assets/{n}", 'alpha') for n in cls.IMAGES]
+
+    def on_show(self):
+        # the countdown starts when the screen is shown, not when it was built
+        get_scheduler().after(self.start_delay_ms, self._start)
 
     def _add_color(self):
         # append new color and prepare to show level text before playback
@@ -49,115 +80,144 @@ class PantallaJuegoSimon:
         self.player = []
         # do not start immediate playback: first show level indicator
         self.playing = False
-        self.last_step_time = 0
         self.show_idx = 0
         # set current level and show level text for 1.5s before playback
         self.current_level = len(self.sequence)
-        self.level_show_until = pygame.time.get_ticks() + 1500
+        self.level_showing = True
+        get_scheduler().after(1500, self._start_playback)
+
+    def _start(self):
+        self.waiting_to_start = False
+        self._add_color()
+
+    def _start_playback(self):
+        self.level_showing = False
+        self.playing = True
+        self.show_idx = 0
+        self.show_phase = 'on'
+        get_scheduler().after(self.ON_MS, self._playback_step)
+
+    def _playback_step(self):
+        # playback per-item with explicit ON/OFF phases so repeats are perceptible
+        if not self.playing:
+            return
+        if self.show_idx >= len(self.sequence):
+            # safety: no items
+            self.playing = False
+            self.show_idx = 0
+            self.show_phase = None
+            return
+        if self.show_phase == 'on':
+            self.show_phase = 'off'
+            # if next element repeats same pad, increase off duration to make repeats clear
+            off_needed = self.OFF_MS
+            if self.show_idx + 1 < len(self.sequence) and self.sequence[self.show_idx] == self.sequence[self.show_idx + 1]:
+                off_needed = self.OFF_REPEAT_MS
+            get_scheduler().after(off_needed, self._playback_step)
+            return
+        # off phase over: advance to next item
+        self.show_idx += 1
+        if self.show_idx >= len(self.sequence):
+            # playback finished; allow player input immediately
+            self.playing = False
+            self.show_idx = 0
+            self.show_phase = None
+            self.player_allowed = True
+        else:
+            self.show_phase = 'on'
+            get_scheduler().after(self.ON_MS, self._playback_step)
+
+    def _next_round(self):
+        if not self.finished:
+            self._add_color()
+
+    def _show_alert(self, text, ms):
+        self.alert = text
+        get_scheduler().after(ms, self._clear_alert)
+
+    def _clear_alert(self):
+        self.alert = ''
+
+    def _clear_final_alert(self):
+        self.final_alert = ''
+
+    def _clear_click_feedback(self):
+        self.click_feedback.clear()
 
     def load_images(self):
         # try to load 4 images from assets; fallback to colored surfaces
-        names = ["img1.png", "img2.png", "img3.png", "img4.png"]
-        for n in names:
+        self.image_paths = []
+        for path, _ in self.preload_assets(self.index):
             try:
-                img = pygame.image.load(f"assets/{n}")
-                # keep original images; scaling will be done at draw-time preserving aspect
+                img = get_assets().get(path, mode='alpha')
+                # keep original images; scaled variants come from the asset cache at draw-time
                 self.images.append(img)
+                self.image_paths.append(path)
             except Exception:
                 self.images.append(None)
+                self.image_paths.append(None)
 
     def handle_events(self, event):
         # accept player input only when allowed and not during playback
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and not self.playing and self.player_allowed and not self.finished:
-            w,h = self.screen.get_size()
-            panel_w = int(w * 0.9)
-            panel_h = int(h * 0.9)
-            panel_x = (w - panel_w)//2
-            panel_y = (h - panel_h)//2
-            # pads in a 2x2 grid centered in panel
-            pad_w = int(panel_w * 0.28)
-            pad_h = int(panel_h * 0.28)
-            start_x = panel_x + (panel_w - (pad_w*2 + 20))//2
-            start_y = panel_y + 120
-            mx,my = event.pos
-            for i in range(4):
-                cx = start_x + (i%2)*(pad_w + 20)
-                cy = start_y + (i//2)*(pad_h + 20)
-                rect = pygame.Rect(cx, cy, pad_w, pad_h)
-                if rect.collidepoint((mx,my)):
-                    # register short visual feedback for the click
+            i = self._layout().hit(event.pos)
+            if i is not None:
+                # register short visual feedback for the click
+                try:
+                    self.click_feedback.add(i)
+                    get_scheduler().after(220, self._clear_click_feedback)
+                except Exception:
+                    pass
+                self.player.append(i)
+                # quick feedback: ensure we have a corresponding sequence element
+                idx = len(self.player) - 1
+                if idx < 0 or idx >= len(self.sequence):
+                    # unexpected input (no sequence element) -> treat as error and reset
+                    self._show_alert('Entrada inválida. Reiniciando nivel.', 1200)
+                    self.sequence = []
+                    self._add_color()
+                    return None
+                if self.sequence[idx] != i:
+                    # fail: reset sequence to start over
+                    self._show_alert('Secuencia incorrecta. Reiniciando nivel.', 1200)
+                    self.sequence = []
+                    self._add_color()
+                    # decrement a life on mistake if estado available
                     try:
-                        self.click_feedback[i] = pygame.time.get_ticks() + 220
+                        if hasattr(self, 'estado') and getattr(self, 'estado') is not None:
+                            try:
+                                self.estado.perder_vida(1)
+                            except Exception:
+                                pass
                     except Exception:
                         pass
-                    self.player.append(i)
-                    # quick feedback: ensure we have a corresponding sequence element
-                    idx = len(self.player) - 1
-                    if idx < 0 or idx >= len(self.sequence):
-                        # unexpected input (no sequence element) -> treat as error and reset
-                        self.alert = 'Entrada inválida. Reiniciando nivel.'
-                        self.alert_until = pygame.time.get_ticks() + 1200
-                        self.sequence = []
-                        self._add_color()
-                        return None
-                    if self.sequence[idx] != i:
-                        # fail: reset sequence to start over
-                        self.alert = 'Secuencia incorrecta. Reiniciando nivel.'
-                        self.alert_until = pygame.time.get_ticks() + 1200
-                        self.sequence = []
-                        self._add_color()
-                        # decrement a life on mistake if estado available
-                        try:
-                            if hasattr(self, 'estado') and getattr(self, 'estado') is not None:
-                                try:
-                                    self.estado.perder_vida(1)
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-                        return None
-                    else:
-                        # correct so far
-                        if len(self.player) == len(self.sequence):
-                            # advance: require 8 rounds to finish (match VF behavior)
-                            if len(self.sequence) >= 5:
-                                # finished full game: show final success then Finalizar
-                                self.finished = True
-                                self.player_allowed = False
-                                now = pygame.time.get_ticks()
-                                self.final_alert = '¡Bien! Lo lograste'
-                                self.final_alert_until = now + 3000
-                            else:
-                                # player completed this level (not final)
-                                now = pygame.time.get_ticks()
-                                # show 'Correcto' for ~3s then schedule next round
-                                self.alert = '¡Correcto!'
-                                self.alert_until = now + 3000
-                                self.player_allowed = False
-                                # schedule next round after alert finishes (small buffer)
-                                try:
-                                    pygame.time.set_timer(pygame.USEREVENT, 3100)
-                                except Exception:
-                                    pass
                     return None
-        # handle scheduled USEREVENT to add next round (used as small delay)
-        if event.type == pygame.USEREVENT:
-            try:
-                pygame.time.set_timer(pygame.USEREVENT, 0)
-            except Exception:
-                pass
-            if not self.finished:
-                self._add_color()
-            return None
+                else:
+                    # correct so far
+                    if len(self.player) == len(self.sequence):
+                        # advance: require 8 rounds to finish (match VF behavior)
+                        if len(self.sequence) >= 5:
+                            # finished full game: show final success then Finalizar
+                            self.finished = True
+                            self.player_allowed = False
+                            self.final_alert = '¡Bien! Lo lograste'
+                            get_scheduler().after(3000, self._clear_final_alert)
+                        else:
+                            # player completed this level (not final)
+                            # show 'Correcto' for ~3s then schedule next round
+                            self._show_alert('¡Correcto!', 3000)
+                            self.player_allowed = False
+                            # schedule next round after alert finishes (small buffer)
+                            get_scheduler().after(3100, self._next_round)
+                return None
         # if finished, ignore further mouse clicks (auto-advance will handle transition)
         if self.finished and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             return None
         return None
 
     def update(self):
-        # play sequence with simple timing
-        now = pygame.time.get_ticks()
         # Pause cronómetro during playback and resume when it's player's turn
+        # (phase changes themselves run from scheduler timers)
         try:
             if hasattr(self, 'estado') and getattr(self, 'estado') is not None:
                 if getattr(self, 'playing', False):
@@ -172,127 +232,60 @@ class PantallaJuegoSimon:
                     except Exception:
                         pass
                 # while waiting_to_start or showing level text, ensure paused
-                if getattr(self, 'waiting_to_start', False) or (getattr(self, 'level_show_until', 0) and now < getattr(self, 'level_show_until', 0)):
+                if getattr(self, 'waiting_to_start', False) or getattr(self, 'level_showing', False):
                     try:
                         self.estado.detener_cronometro()
                     except Exception:
                         pass
         except Exception:
             pass
-        # handle initial start delay
-        if self.waiting_to_start:
-            if now >= self.start_at:
-                self.waiting_to_start = False
-                self._add_color()
-            else:
-                return
-        # if level text is showing and time passed, start playback
-        if self.level_show_until and not self.playing:
-            if now >= self.level_show_until:
-                # start playback
-                self.playing = True
-                self.last_step_time = now
-                self.show_idx = 0
-                self.show_phase = 'on'
-                self.level_show_until = 0
-        if self.playing:
-            # playback per-item with explicit ON/OFF phases so repeats are perceptible
-            # durations (ms)
-            on_dur = 450
-            base_off = 200
-            # ensure show_phase exists
-            if not hasattr(self, 'show_phase') or self.show_phase is None:
-                self.show_phase = 'on'
-                self.last_step_time = now
-            if self.show_idx < len(self.sequence):
-                if self.show_phase == 'on':
-                    # stay lit for on_dur
-                    if now - self.last_step_time >= on_dur:
-                        self.show_phase = 'off'
-                        self.last_step_time = now
-                else:  # off phase
-                    # if next element (after current) repeats same pad, increase off duration to make repeats clear
-                    off_needed = base_off
-                    if self.show_idx + 1 < len(self.sequence) and self.sequence[self.show_idx] == self.sequence[self.show_idx + 1]:
-                        off_needed = 300
-                    if now - self.last_step_time >= off_needed:
-                        # advance to next item
-                        self.show_idx += 1
-                        # if advanced past last, finish playback
-                        if self.show_idx >= len(self.sequence):
-                            self.playing = False
-                            self.show_idx = 0
-                            self.show_phase = None
-                            # playback finished; allow player input immediately
-                            self.player_allowed = True
-                            self.show_turn_until = 0
-                        else:
-                            # start next item's on-phase
-                            self.show_phase = 'on'
-                            self.last_step_time = now
-            else:
-                # safety: no items
-                self.playing = False
-                self.show_idx = 0
-                self.show_phase = None
 
-        if self.alert and now > self.alert_until:
-            self.alert = ''
-        # clean up expired click feedback entries
-        for k, expiry in list(self.click_feedback.items()):
-            if now > expiry:
-                try:
-                    del self.click_feedback[k]
-                except Exception:
-                    pass
-        # enable player input after show_turn timeout
-        if self.show_turn_until and now > self.show_turn_until and not self.finished:
-            self.player_allowed = True
-            self.show_turn_until = 0
-        # final alert expiration handled to allow Finalizar button
-        if self.final_alert and now > self.final_alert_until:
-            self.final_alert = ''
-
-    def draw(self):
+    def _layout(self):
+        """Rectángulos de los 4 pads (2x2 centrado en el panel) e índice de clics; se recalculan solo al cambiar el tamaño."""
         w,h = self.screen.get_size()
-        try:
-            bg = pygame.transform.scale(pygame.image.load('assets/area.jpg'), (w, h))
-            self.screen.blit(bg, (0,0))
-        except Exception:
-            try:
-                bg = pygame.transform.scale(pygame.image.load('assets/bg_start.jpg'), (w, h))
-                self.screen.blit(bg, (0,0))
-            except Exception:
-                self.screen.fill((18,20,24))
+        if not self._hits.stale((w, h)):
+            return self._hits
+        self._hits.clear((w, h))
+        panel_x, panel_y, panel_w, panel_h = self._panel_rect(w, h)
+        pad_w = int(panel_w * 0.28)
+        pad_h = int(panel_h * 0.28)
+        start_x = panel_x + (panel_w - (pad_w*2 + 20))//2
+        start_y = panel_y + 120
+        self.pad_rects = []
+        for i in range(4):
+            rect = pygame.Rect(start_x + (i%2)*(pad_w + 20), start_y + (i//2)*(pad_h + 20), pad_w, pad_h)
+            self.pad_rects.append(rect)
+            self._hits.add(rect, i)
+        return self._hits
 
+    def _panel_rect(self, w, h):
         panel_w = int(w * 0.9)
         panel_h = int(h * 0.9)
-        panel_x = (w - panel_w)//2
-        panel_y = (h - panel_h)//2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        return pygame.Rect((w - panel_w)//2, (h - panel_h)//2, panel_w, panel_h)
+
+    def _build_static(self, surface):
+        w,h = surface.get_size()
+        paint_background(surface, (BG_AREA, BG_START))
+        panel_x, panel_y, panel_w, panel_h = self._panel_rect(w, h)
         # draw a rounded panel so corners are transparent and consistent with other screens
-        try:
-            pygame.draw.rect(panel_surf, (8,8,12,200), panel_surf.get_rect(), border_radius=18)
-            pygame.draw.rect(panel_surf, (200,200,200), panel_surf.get_rect(), 3, border_radius=18)
-            self.screen.blit(panel_surf, (panel_x, panel_y))
-        except Exception:
-            panel_surf.fill((8,8,12,200))
-            self.screen.blit(panel_surf, (panel_x, panel_y))
-            pygame.draw.rect(self.screen, (200,200,200), panel_rect, 3, border_radius=18)
+        paint_panel(surface, (panel_x, panel_y, panel_w, panel_h), (8,8,12,200))
 
-        t = self.font_title.render(self.titulo, True, (240,240,240))
-        self.screen.blit(t, (panel_x + 24, panel_y + 18))
+        t = get_text_cache().render(self.font_title, self.titulo, (240,240,240))
+        surface.blit(t, (panel_x + 24, panel_y + 18))
+
+    def draw(self):
+        w,h = self.screen.get_size()
+        self.static_layer.blit(self.screen)
+        panel_x, panel_y, panel_w, panel_h = self._panel_rect(w, h)
 
         # instructional overlays: show level before playback, playback state, or player's turn
-        now = pygame.time.get_ticks()
         instruct_text = None
         # waiting to start (initial countdown)
         if self.waiting_to_start:
-            remaining = max(0, (self.start_at - now) // 1000)
+            remaining = (get_scheduler().remaining(self._start) or 0) // 1000
             instruct_text = f"Comenzando en {remaining+1}s..."
-        # show level label when level_show_until active
-        elif self.current_level and self.level_show_until and now < self.level_show_until:
+        # show level label before playback
+        elif self.current_level and self.level_showing:
             instruct_text = f"Nivel {self.current_level}"
         elif self.playing:
             instruct_text = "Reproduciendo patrón..."
@@ -300,22 +293,16 @@ class PantallaJuegoSimon:
             instruct_text = "Tu turno: reproduce la secuencia"
 
         if instruct_text:
-            info_font = pygame.font.SysFont('Verdana', 26, bold=True)
-            info_s = info_font.render(instruct_text, True, (240,240,220))
+            info_font = get_fonts().get(26, bold=True)
+            info_s = get_text_cache().render(info_font, instruct_text, (240,240,220))
             info_bg = pygame.Surface((info_s.get_width()+28, info_s.get_height()+14), pygame.SRCALPHA)
             pygame.draw.rect(info_bg, (30,30,30,220), info_bg.get_rect(), border_radius=12)
             self.screen.blit(info_bg, (panel_x + (panel_w - info_bg.get_width())//2, panel_y + 60))
             self.screen.blit(info_s, (panel_x + (panel_w - info_s.get_width())//2, panel_y + 66))
 
         # draw pads as images (if available) or fallback colored boxes
-        pad_w = int(panel_w * 0.28)
-        pad_h = int(panel_h * 0.28)
-        start_x = panel_x + (panel_w - (pad_w*2 + 20))//2
-        start_y = panel_y + 120
-        for i in range(4):
-            cx = start_x + (i%2)*(pad_w + 20)
-            cy = start_y + (i//2)*(pad_h + 20)
-            rect = pygame.Rect(cx, cy, pad_w, pad_h)
+        self._layout()
+        for i, rect in enumerate(self.pad_rects):
             img = None
             if i < len(self.images):
                 img = self.images[i]
@@ -341,7 +328,7 @@ class PantallaJuegoSimon:
                         scale = base_scale
                     new_w = max(1, int(iw * scale))
                     new_h = max(1, int(ih * scale))
-                    scaled = pygame.transform.smoothscale(img, (new_w, new_h))
+                    scaled = get_assets().get(self.image_paths[i], (new_w, new_h), mode='alpha', smooth=True)
                 except Exception:
                     try:
                         scaled = pygame.transform.scale(img, (max(1, target_w), max(1, target_h)))
@@ -363,7 +350,7 @@ class PantallaJuegoSimon:
                         self.screen.blit(glow, (rect.x, rect.y))
                     self.screen.blit(scaled, (img_x, img_y))
                     # click feedback overlay (short) - stronger than playback highlight
-                    is_clicked = i in self.click_feedback and now < self.click_feedback.get(i, 0)
+                    is_clicked = i in self.click_feedback
                     if is_highlight or is_clicked:
                         # overlay + brighter border (rounded)
                         overlay = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
@@ -386,7 +373,7 @@ class PantallaJuegoSimon:
             else:
                 # fallback colored boxes
                 color = (200,50,50) if i==0 else (50,200,80) if i==1 else (50,120,220) if i==2 else (240,200,50)
-                is_clicked = i in self.click_feedback and now < self.click_feedback.get(i, 0)
+                is_clicked = i in self.click_feedback
                 if is_clicked:
                     bright = tuple(min(255, int(c*1.25)) for c in color)
                     pygame.draw.rect(self.screen, bright, rect, border_radius=16)
@@ -402,7 +389,7 @@ class PantallaJuegoSimon:
 
         # transient alert while playing/advancing; suppress when finished modal is shown
         if self.alert and not getattr(self, 'finished', False):
-            a = self.font_text.render(self.alert, True, (255,200,80))
+            a = get_text_cache().render(self.font_text, self.alert, (255,200,80))
             self.screen.blit(a, (panel_x + 30, panel_y + panel_h - 100))
 
         # When the required rounds are finished and player has completed them, show a big modal
@@ -422,22 +409,22 @@ class PantallaJuegoSimon:
             pygame.draw.rect(self.screen, (30,30,36), box, border_radius=18)
             pygame.draw.rect(self.screen, (240,200,80), box, 4, border_radius=18)
             # big title
-            bigf = pygame.font.SysFont('Verdana', 36, bold=True)
-            title = bigf.render('¡Juego completado!', True, (240,240,240))
+            bigf = get_fonts().get(36, bold=True)
+            title = get_text_cache().render(bigf, '¡Juego completado!', (240,240,240))
             self.screen.blit(title, (box_x + (box_w - title.get_width())//2, box_y + 28))
             # subtitle / final alert (if any)
-            subf = pygame.font.SysFont('Verdana', 22)
+            subf = get_fonts().get(22)
             sub = self.final_alert or '¡Lo lograste!' 
-            sub_s = subf.render(sub, True, (220,220,200))
+            sub_s = get_text_cache().render(subf, sub, (220,220,200))
             self.screen.blit(sub_s, (box_x + (box_w - sub_s.get_width())//2, box_y + 28 + title.get_height() + 12))
             # countdown (use auto_advance_until if set)
             adv_until = getattr(self, 'auto_advance_until', 0)
             if adv_until and adv_until > now:
                 remaining = max(0, int((adv_until - now + 999)//1000))
-                cntf = pygame.font.SysFont('Verdana', 28, bold=True)
-                cnts = cntf.render(f'Redirigiendo a records en {remaining}', True, (200,200,200))
+                cntf = get_fonts().get(28, bold=True)
+                cnts = get_text_cache().render(cntf, f'Redirigiendo a records en {remaining}', (200,200,200))
                 self.screen.blit(cnts, (box_x + (box_w - cnts.get_width())//2, box_y + box_h - 68))
             else:
-                cntf = pygame.font.SysFont('Verdana', 22)
-                cnts = cntf.render('Preparando registros...', True, (180,180,180))
+                cntf = get_fonts().get(22)
+                cnts = get_text_cache().render(cntf, 'Preparando registros...', (180,180,180))
                 self.screen.blit(cnts, (box_x + (box_w - cnts.get_width())//2, box_y + box_h - 68))
@@ -1,21 +1,127 @@
+from functools import partial
+
 import pygame
-from core.gestor_registros import cargar_registros
+from core.gestor_registros import get_records
+from core.records_query import today, week_range
+from core.avatars import get_avatars
+from core.compositor import get_compositor, paint_background, paint_panel
+from core.constants import BG_RECORDS
+from core.dirty import get_dirty
+from core.fonts import get_fonts
+from core.text_cache import get_text_cache
+from pantallas.ui_controls import VirtualList
+
+AVATAR_SIZE = 48
+# (key, label) of each tab; every tab is its own virtual list over the records store
+TABS = (
+    ('todos', 'Todos'),
+    ('hoy', 'Hoy'),
+    ('semana', 'Semana'),
+    ('jugadores', 'Jugadores'),
+    ('avatares', 'Avatares'),
+)
 
 
 class PantallaRecords:
-    """Muestra los records (scrollable) y permite volver al inicio."""
+    """Muestra el historial de records (scrollable) y permite volver al inicio.
+
+    Las filas salen de una `VirtualList`: solo se consultan en la base y se
+    componen las que caen en pantalla, así que el coste no crece con el
+    historial. Las pestañas (hoy, semana, mejores por jugador, partidas por
+    avatar) usan `core.records_query`; su línea de resumen sale de los
+    agregados, sin recorrer el historial.
+    """
+    # la lista solo se vuelve a presentar cuando cambian los datos o el scroll
+    dirty_tracking = True
+
     def __init__(self, screen, estado):
         self.screen = screen
         self.estado = estado
-        self.font_title = pygame.font.SysFont('Verdana', 34, bold=True)
-        self.font_row = pygame.font.SysFont('Verdana', 20)
-        self.records = cargar_registros()
+        self.font_title = get_fonts().get(34, bold=True)
+        self.font_row = get_fonts().get(20)
         self.scroll = 0
         self.row_height = self.font_row.get_height() + 12
+        # row height accommodates the avatar comfortably
+        self.row_h = max(self.row_height, AVATAR_SIZE + 12)
+        # pages come from the records store on demand; it pushes updates to on_records_changed
+        self.tab = 0
+        self.tab_rects = []
+        self._lists = {}
+        self._summary = None
+        self._version = 0
+        get_records().subscribe(self)
         self.back_rect = pygame.Rect(20, 20, 140, 44)
+        # fondo + panel + título (estático); las filas se dibujan encima
+        self.static_layer = get_compositor().layer(self._build_static)
+        self._drawn_state = None
+
+    @property
+    def rows(self):
+        """Lista virtual de la pestaña activa (se crea la primera vez que se muestra)."""
+        key = TABS[self.tab][0]
+        rows = self._lists.get(key)
+        if rows is None:
+            rows = self._lists[key] = self._make_list(key)
+        return rows
+
+    def _make_list(self, key):
+        repo = get_records()
+        q = repo.query()
+        render = partial(self._render_row, key)
+        # dates are evaluated on every call: a list left open past midnight stays correct
+        if key == 'hoy':
+            return VirtualList(lambda: q.count(date_from=today(), date_to=today()),
+                               lambda limit, offset: q.best_of_day(today(), limit, offset), render, self.row_h)
+        if key == 'semana':
+            return VirtualList(lambda: q.count(date_from=week_range()[0], date_to=week_range()[1]),
+                               lambda limit, offset: q.records(limit, offset, date_from=week_range()[0], date_to=week_range()[1]),
+                               render, self.row_h)
+        if key == 'jugadores':
+            return VirtualList(q.player_count, q.player_bests, render, self.row_h)
+        if key == 'avatares':
+            return VirtualList(q.avatar_count, q.runs_per_avatar, render, self.row_h)
+        return VirtualList(repo.count, repo.top, render, self.row_h)
+
+    def select_tab(self, index):
+        index %= len(TABS)
+        if index != self.tab:
+            self.tab = index
+            self.scroll = 0
+            self._summary = None
+
+    def summary_text(self):
+        """Línea de resumen de la pestaña activa (agregados, cacheada hasta el próximo cambio)."""
+        if self._summary is not None:
+            return self._summary
+        key = TABS[self.tab][0]
+        q = get_records().query()
+        try:
+            if key == 'jugadores':
+                text = f"{q.player_count()} jugadores — mejor tiempo de cada uno"
+            elif key == 'avatares':
+                text = f"{q.avatar_count()} avatares — partidas con cada uno"
+            else:
+                if key == 'hoy':
+                    s = q.summary(today(), today())
+                elif key == 'semana':
+                    s = q.summary(*week_range())
+                else:
+                    s = q.summary()
+                if s['runs']:
+                    text = f"{s['runs']} partidas — mejor {s['best']:.2f}s — mediana {s['median']:.1f}s — p90 {s['p90']:.1f}s"
+                else:
+                    text = 'Sin partidas'
+        except Exception:
+            text = ''
+        self._summary = text
+        return text
 
     def handle_events(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            for i, r in enumerate(self.tab_rects):
+                if r.collidepoint(event.pos):
+                    self.select_tab(i)
+                    return None
             if self.back_rect.collidepoint(event.pos):
                 # volver al inicio para nuevo registro
                 try:
@@ -30,29 +136,52 @@ class PantallaRecords:
             self._clamp_scroll()
         # keyboard scroll
         if event.type == pygame.KEYDOWN:
+            page = self._list_rect(*self.screen.get_size()).h
             if event.key == pygame.K_UP:
                 self.scroll += 40
                 self._clamp_scroll()
             elif event.key == pygame.K_DOWN:
                 self.scroll -= 40
                 self._clamp_scroll()
+            elif event.key == pygame.K_PAGEUP:
+                self.scroll += page
+                self._clamp_scroll()
+            elif event.key == pygame.K_PAGEDOWN:
+                self.scroll -= page
+                self._clamp_scroll()
+            elif event.key == pygame.K_HOME:
+                self.scroll = 0
+            elif event.key == pygame.K_END:
+                self.scroll = -self.rows.content_height()
+                self._clamp_scroll()
+            elif event.key == pygame.K_LEFT:
+                self.select_tab(self.tab - 1)
+            elif event.key == pygame.K_RIGHT:
+                self.select_tab(self.tab + 1)
         return None
 
     def _clamp_scroll(self):
-        h = self.screen.get_height()
-        # visible area inside the central panel (approximate to match draw)
-        panel_h = int(h * 0.78)
-        visible_h = max(100, panel_h - 160)
-        content_h = len(self.records) * self.row_height
+        visible_h = self._list_rect(*self.screen.get_size()).h
+        content_h = self.rows.content_height()
         min_scroll = min(0, visible_h - content_h)
         if self.scroll < min_scroll:
             self.scroll = min_scroll
         if self.scroll > 0:
             self.scroll = 0
 
+    def is_animating(self):
+        return False
+
+    def on_records_changed(self, records):
+        for rows in self._lists.values():
+            rows.invalidate()
+        self._summary = None
+        self._version += 1
+        self._clamp_scroll()
+
     def update(self):
-        # reload records in case updated
-        self.records = cargar_registros()
+        # pick up edits made to the file from outside the game (cheap stat, throttled)
+        get_records().poll()
 
     def _truncate_text(self, text, font, max_w):
         try:
@@ -72,94 +201,141 @@ class PantallaRecords:
         except Exception:
             return text
 
-    def draw(self):
-        w,h = self.screen.get_size()
-        try:
-            bg = pygame.transform.scale(pygame.image.load('assets/bg_records.jpg'), (w, h))
-            self.screen.blit(bg, (0, 0))
-        except Exception:
-            self.screen.fill((18,20,24))
-
+    def _panel_rect(self, w, h):
         # central rounded panel for records
         panel_w = int(w * 0.9)
         panel_h = int(h * 0.78)
-        panel_x = (w - panel_w) // 2
-        panel_y = (h - panel_h) // 2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        try:
-            pygame.draw.rect(panel_surf, (18, 20, 24, 220), panel_surf.get_rect(), border_radius=18)
-            pygame.draw.rect(panel_surf, (200,200,200), panel_surf.get_rect(), 3, border_radius=18)
-            self.screen.blit(panel_surf, (panel_x, panel_y))
-        except Exception:
-            panel_surf.fill((18,20,24,220))
-            self.screen.blit(panel_surf, (panel_x, panel_y))
-            pygame.draw.rect(self.screen, (200,200,200), panel_rect, 3)
+        return pygame.Rect((w - panel_w) // 2, (h - panel_h) // 2, panel_w, panel_h)
+
+    def _list_rect(self, w, h):
+        # rows area: below the tabs and the summary line, above the back button
+        panel = self._panel_rect(w, h)
+        top = panel.y + 132
+        return pygame.Rect(panel.x + 36, top, panel.w - 72, max(100, panel.bottom - 64 - top))
+
+    def _row_text(self, key, index, r):
+        if key == 'jugadores':
+            return f"{index+1}. {r.get('name') or '---'} — {r.get('time')}s — {r.get('runs')} partidas"
+        if key == 'avatares':
+            label = (r.get('avatar') or 'Sin avatar').rsplit('.', 1)[0]
+            return f"{label} — {r.get('runs')} partidas"
+        # text: rank. name — time s — date
+        name = r.get('name') or r.get('jugador') or '---'
+        timev = r.get('time') if r.get('time') is not None else r.get('tiempo')
+        timev = timev if timev is not None else '---'
+        datev = r.get('date') or r.get('fecha') or ''
+        return f"{index+1}. {name} — {timev}s — {datev}"
+
+    def _render_row(self, key, index, r, size):
+        """Superficie de una fila: avatar a la izquierda y texto en una línea."""
+        box_w, box_h = size
+        row = pygame.Surface(size, pygame.SRCALPHA)
+        row_rect = row.get_rect()
+        # alternate color (light rows shown inside dark panel)
+        color = (44, 46, 50) if index % 2 == 0 else (36, 38, 42)
+        pygame.draw.rect(row, color, row_rect, border_radius=8)
+
+        # draw avatar if available
+        av_path = r.get('avatar')
+        tx = 12
+        gap = 12
+        if av_path:
+            try:
+                av_img = get_avatars().get(av_path, (AVATAR_SIZE, AVATAR_SIZE))
+                av_rect = pygame.Rect(8, (box_h - AVATAR_SIZE) // 2, AVATAR_SIZE, AVATAR_SIZE)
+                row.blit(av_img, av_rect.topleft)
+                tx = av_rect.right + gap
+            except Exception:
+                tx = 12
+
+        # single line, truncated if needed
+        full_text = self._row_text(key, index, r)
+        # available width for text
+        text_max_w = box_w - tx - 12
+        display_text = self._truncate_text(full_text, self.font_row, text_max_w)
+        # one-off surface per row: not worth a slot in the shared text cache
+        surf = self.font_row.render(display_text, True, (220, 220, 220))
+        # vertically center text within row
+        row.blit(surf, (tx, (box_h - surf.get_height()) // 2))
+        return row
+
+    def _build_static(self, surface):
+        w, h = surface.get_size()
+        paint_background(surface, BG_RECORDS)
+        panel_x, panel_y, panel_w, panel_h = self._panel_rect(w, h)
+        paint_panel(surface, (panel_x, panel_y, panel_w, panel_h), (18, 20, 24, 220))
 
         # title inside panel
-        title = self.font_title.render('Records', True, (240,240,240))
-        self.screen.blit(title, (panel_x + (panel_w - title.get_width())//2, panel_y + 14))
+        title = get_text_cache().render(self.font_title, 'Records', (240,240,240))
+        surface.blit(title, (panel_x + (panel_w - title.get_width())//2, panel_y + 14))
 
-        # area list
-        start_y = panel_y + 72
+    def _draw_tabs(self, panel_x, panel_y, panel_w):
+        gap = 8
         x = panel_x + 36
-        y = start_y + self.scroll
-        box_w = panel_w - 72
-        avatar_size = 48
-        gap = 12
-        # compute row height to accommodate avatar comfortably
-        row_h = max(self.row_height, avatar_size + 12)
-        # draw each row with avatar on left and single-line text to the right
-        for i, r in enumerate(self.records):
-            row_y = y + i * row_h
-            row_rect = pygame.Rect(x, row_y, box_w, row_h - 6)
-            # alternate color (light rows shown inside dark panel)
-            color = (44, 46, 50) if i % 2 == 0 else (36, 38, 42)
-            pygame.draw.rect(self.screen, color, row_rect, border_radius=8)
-
-            # draw avatar if available
-            av_path = r.get('avatar')
-            tx = row_rect.x + 12
-            if av_path:
-                try:
-                    av_img = pygame.image.load(av_path).convert_alpha()
-                    av_img = pygame.transform.smoothscale(av_img, (avatar_size, avatar_size))
-                    av_rect = pygame.Rect(row_rect.x + 8, row_rect.y + (row_rect.h - avatar_size) // 2, avatar_size, avatar_size)
-                    self.screen.blit(av_img, av_rect.topleft)
-                    tx = av_rect.right + gap
-                except Exception:
-                    tx = row_rect.x + 12
-
-            # text: rank. name — time s — date (single line, truncated if needed)
-            name = r.get('name') or r.get('jugador') or '---'
-            timev = r.get('time') if r.get('time') is not None else r.get('tiempo')
-            timev = timev if timev is not None else '---'
-            datev = r.get('date') or r.get('fecha') or ''
-            full_text = f"{i+1}. {name} — {timev}s — {datev}"
-            # available width for text
-            text_max_w = row_rect.x + row_rect.w - tx - 12
-            display_text = self._truncate_text(full_text, self.font_row, text_max_w)
-            surf = self.font_row.render(display_text, True, (220, 220, 220))
-            # vertically center text within row
-            ty = row_rect.y + (row_rect.h - surf.get_height()) // 2
-            self.screen.blit(surf, (tx, ty))
+        tab_w = min(150, (panel_w - 72 - gap * (len(TABS) - 1)) // len(TABS))
+        self.tab_rects = []
+        for i, (_, label) in enumerate(TABS):
+            r = pygame.Rect(x, panel_y + 62, tab_w, 34)
+            active = i == self.tab
+            pygame.draw.rect(self.screen, (245, 245, 245) if active else (52, 54, 58), r, border_radius=8)
+            txt = get_text_cache().render(self.font_row, label, (0, 0, 0) if active else (220, 220, 220))
+            self.screen.blit(txt, (r.x + (r.w - txt.get_width()) // 2, r.y + (r.h - txt.get_height()) // 2))
+            self.tab_rects.append(r)
+            x += tab_w + gap
+
+    @staticmethod
+    def _scrollbar_rect(panel_x, panel_w, list_rect):
+        return pygame.Rect(panel_x + panel_w - 28, list_rect.y, 12, list_rect.h)
+
+    def draw(self):
+        w,h = self.screen.get_size()
+        self.static_layer.blit(self.screen)
+        panel_x, panel_y, panel_w, panel_h = self._panel_rect(w, h)
+        list_rect = self._list_rect(w, h)
+        # rows are clipped to the list area: scrolling only repaints that band
+        state = (self.scroll, self._version, list_rect.size, self.tab)
+        if state != self._drawn_state:
+            # new data also changes the summary line and the "#N de M" label, outside the list
+            if self._drawn_state is None or self._drawn_state[1:] != state[1:]:
+                get_dirty().mark_full()
+            else:
+                get_dirty().add(list_rect.union(self._scrollbar_rect(panel_x, panel_w, list_rect)))
+            self._drawn_state = state
+
+        # placement of the run that just ended ("#N de M"), next to the title
+        puesto = getattr(self.estado, 'ultimo_puesto', None)
+        if puesto:
+            try:
+                label = get_text_cache().render(self.font_row, f"Quedaste #{puesto[0]} de {puesto[1]}", (240, 200, 80))
+                self.screen.blit(label, (panel_x + panel_w - 36 - label.get_width(), panel_y + 14 + (self.font_title.get_height() - label.get_height()) // 2))
+            except Exception:
+                pass
+
+        # tabs + summary line (aggregates) above the list
+        self._draw_tabs(panel_x, panel_y, panel_w)
+        summary = self.summary_text()
+        if summary:
+            surf = get_text_cache().render(self.font_row, self._truncate_text(summary, self.font_row, list_rect.w), (200, 200, 200))
+            self.screen.blit(surf, (list_rect.x, panel_y + 104))
+
+        # only the rows inside the list area are fetched and drawn
+        self.rows.draw(self.screen, list_rect, self.scroll, (list_rect.w, self.row_h - 6))
 
         # scrollbar indicator when needed (inside panel)
-        content_h = len(self.records) * self.row_height
-        visible_h = panel_h - (start_y - panel_y) - 36
+        content_h = self.rows.content_height()
+        visible_h = list_rect.h
         if content_h > visible_h:
-            track_h = visible_h
-            thumb_h = max(40, int(track_h * visible_h / content_h))
+            track = self._scrollbar_rect(panel_x, panel_w, list_rect)
+            thumb_h = max(40, int(track.h * visible_h / content_h))
             max_scroll = content_h - visible_h
             scroll_pos = -self.scroll
-            thumb_y = start_y + int((scroll_pos / max_scroll) * (track_h - thumb_h))
-            track_x = panel_x + panel_w - 28
-            pygame.draw.rect(self.screen, (70,70,70), (track_x, start_y, 12, track_h), border_radius=6)
-            pygame.draw.rect(self.screen, (140,140,140), (track_x, thumb_y, 12, thumb_h), border_radius=6)
+            thumb_y = track.y + int((scroll_pos / max_scroll) * (track.h - thumb_h))
+            pygame.draw.rect(self.screen, (70,70,70), track, border_radius=6)
+            pygame.draw.rect(self.screen, (140,140,140), (track.x, thumb_y, track.w, thumb_h), border_radius=6)
 
         # draw back button centered at bottom of panel (no red borders)
         label = 'Volver al inicio'
-        txt = self.font_row.render(label, True, (0,0,0))
+        txt = get_text_cache().render(self.font_row, label, (0,0,0))
         pw = txt.get_width() + 24
         max_pw = int(panel_w * 0.6)
         pw = min(pw, max_pw)
@@ -1,7 +1,14 @@
 import pygame
 from core.audio import get_audio
+from core.assets import get_assets
+from core.avatars import get_avatars
+from core.constants import BG_START
+from core.dirty import get_dirty
+from core.scheduler import get_scheduler
 import os
 from pantallas.ui_controls import Slider
+from core.fonts import get_fonts, SYMBOL_FONT_FAMILY
+from core.text_cache import get_text_cache
 
 
 class AvatarGrid:
@@ -11,29 +18,33 @@ class AvatarGrid:
         self.selected = None
         self.selected_time = 0
         self.hover_index = None
+        # area of the pulsing selection glow drawn in the last frame (None if no selection)
+        self.glow_rect = None
 
-    def draw(self, screen):
+    def cell_rect(self, i):
+        """Celda del avatar `i` (4 columnas, celdas cuadradas)."""
         cols = 4
         pad = 8
         w = (self.rect.w - pad * (cols + 1)) // cols
-        h = w
         x0, y0 = self.rect.x + pad, self.rect.y + pad
+        return pygame.Rect(x0 + (i % cols) * (w + pad), y0 + (i // cols) * (w + pad), w, w)
+
+    def draw(self, screen):
         # detect mouse for hover
         try:
             mx, my = pygame.mouse.get_pos()
         except Exception:
             mx, my = (-1, -1)
         self.hover_index = None
+        self.glow_rect = None
         for i in range(min(len(self.avatars), 4)):
-            x = x0 + (i % cols) * (w + pad)
-            y = y0 + (i // cols) * (h + pad)
-            cell_rect = pygame.Rect(x, y, w, h)
+            cell_rect = self.cell_rect(i)
             bg_rect = cell_rect.inflate(-6, -6)
             # background + border
             pygame.draw.rect(screen, (255, 255, 255), bg_rect, border_radius=12)
             border_col = (70, 70, 74)
             # hover effect
-            if mx >= x and mx <= x + w and my >= y and my <= y + h:
+            if cell_rect.x <= mx <= cell_rect.right and cell_rect.y <= my <= cell_rect.bottom:
                 self.hover_index = i
                 border_col = (100, 100, 106)
             pygame.draw.rect(screen, border_col, bg_rect, 2, border_radius=12)
@@ -41,8 +52,7 @@ class AvatarGrid:
             path = self.avatars[i]
             if path:
                 try:
-                    img = pygame.image.load(path).convert_alpha()
-                    img = pygame.transform.smoothscale(img, (img_rect.w, img_rect.h))
+                    img = get_avatars().get(path, (img_rect.w, img_rect.h))
                     screen.blit(img, (img_rect.x, img_rect.y))
                 except Exception:
                     pygame.draw.rect(screen, (220, 220, 220), img_rect, border_radius=8)
@@ -56,6 +66,7 @@ class AvatarGrid:
                 pulse = 1.0 + 0.15 * math.sin(t / 120.0)
                 border_w = max(2, int(3 * pulse))
                 glow_rect = bg_rect.inflate(border_w * 2, border_w * 2)
+                self.glow_rect = glow_rect.inflate(2, 2)
                 try:
                     s = pygame.Surface((glow_rect.w, glow_rect.h), pygame.SRCALPHA)
                     alpha = max(30, min(120, int(80 * pulse)))
@@ -67,16 +78,8 @@ class AvatarGrid:
                 pygame.draw.rect(screen, (255, 200, 200), bg_rect, border_w, border_radius=12)
 
     def handle_click(self, pos):
-        cols = 4
-        pad = 8
-        w = (self.rect.w - pad * (cols + 1)) // cols
-        h = w
-        x0, y0 = self.rect.x + pad, self.rect.y + pad
         for i in range(min(len(self.avatars), 4)):
-            x = x0 + (i % cols) * (w + pad)
-            y = y0 + (i // cols) * (h + pad)
-            r = pygame.Rect(x, y, w, h)
-            if r.collidepoint(pos):
+            if self.cell_rect(i).collidepoint(pos):
                 self.selected = i
                 try:
                     self.selected_time = pygame.time.get_ticks()
@@ -90,6 +93,9 @@ class PantallaRegistro:
     """Pantalla de registro que muestra un input de nombre y selección de avatar.
     API compatible con `PantallaInicio`: tiene `input_text`, `handle_events`, `update`, `draw`.
     """
+    # fuera de la intro y del menú solo cambia el formulario (input, avatares, aceptar)
+    dirty_tracking = True
+
     def __init__(self, screen, estado):
         self.screen = screen
         self.estado = estado
@@ -97,14 +103,18 @@ class PantallaRegistro:
         self.active = True
         self.max_len = 20
 
-        self.titulo_font = pygame.font.SysFont('Verdana', 40, bold=True)
-        self.text_font = pygame.font.SysFont('Verdana', 28)
+        self.titulo_font = get_fonts().get(40, bold=True)
+        self.text_font = get_fonts().get(28)
 
         self.accept_width = 180
         self.accept_height = 48
         self.accept_rect = pygame.Rect(0, 0, self.accept_width, self.accept_height)
 
         self.gear_rect = pygame.Rect(0, 0, 34, 34)
+        # dirty-rect state of the last drawn frame
+        self._drawn_mode = None
+        self._drawn_state = None
+        self._form_rect = None
 
         # load avatars from assets/avatares
         base = os.path.join(os.path.dirname(__file__), '..', 'assets', 'avatares')
@@ -144,6 +154,9 @@ class PantallaRegistro:
         self.left_door_img = None
         self.right_door_img = None
         self.escape_img = None
+        self.escape_path = None
+        self.left_door_path = None
+        self.right_door_path = None
         self.left_pos = None
         self.right_pos = None
         # try load images from assets
@@ -154,21 +167,24 @@ class PantallaRegistro:
             for p in cand_left:
                 if os.path.exists(p):
                     try:
-                        self.left_door_img = pygame.image.load(p).convert_alpha()
+                        self.left_door_img = get_assets().get(p, mode='alpha')
+                        self.left_door_path = p
                     except Exception:
                         self.left_door_img = None
                     break
             for p in cand_right:
                 if os.path.exists(p):
                     try:
-                        self.right_door_img = pygame.image.load(p).convert_alpha()
+                        self.right_door_img = get_assets().get(p, mode='alpha')
+                        self.right_door_path = p
                     except Exception:
                         self.right_door_img = None
                     break
             for p in cand_escape:
                 if os.path.exists(p):
                     try:
-                        self.escape_img = pygame.image.load(p).convert_alpha()
+                        self.escape_img = get_assets().get(p, mode='alpha')
+                        self.escape_path = p
                     except Exception:
                         self.escape_img = None
                     break
@@ -185,9 +201,8 @@ class PantallaRegistro:
         self.panel_mid = (230, 230, 230)
         self.menu_border = (0, 0, 0)
         self.menu_bg = (230, 230, 230)
-        # alerts
+        # alerts (cleared by a scheduler timer)
         self.alert = ''
-        self.alert_until = 0
         # sliders (only brightness — contrast and volume removed)
         self.brightness_slider = Slider('Brillo', -1.0, 1.0, lambda: getattr(self.estado, 'brightness', 0.0), lambda v: self.estado.set_brightness(v), fmt=lambda v: f"{int((v+1.0)/2.0*100)}%")
 
@@ -354,15 +369,13 @@ class PantallaRegistro:
                 # require both name and avatar
                 if not nombre:
                     try:
-                        self.alert = 'Ingresá tu nombre'
-                        self.alert_until = pygame.time.get_ticks() + 1500
+                        self._show_alert('Ingresá tu nombre')
                     except Exception:
                         pass
                     return None
                 if self.grid.selected is None:
                     try:
-                        self.alert = 'Seleccioná un avatar'
-                        self.alert_until = pygame.time.get_ticks() + 1500
+                        self._show_alert('Seleccioná un avatar')
                     except Exception:
                         pass
                     return None
@@ -397,18 +410,9 @@ class PantallaRegistro:
         return None
 
     def _render_outlined(self, text, font, fg=(255,255,255), outline=(0,0,0)):
-        # Render text with a simple 1px outline by blitting offsets
+        # Render text with a simple 1px outline (8 directions); cached per text/colors
         try:
-            base = font.render(text, True, fg)
-            outline_surf = font.render(text, True, outline)
-            w = max(base.get_width(), outline_surf.get_width()) + 2
-            h = max(base.get_height(), outline_surf.get_height()) + 2
-            surf = pygame.Surface((w, h), pygame.SRCALPHA)
-            # draw outline in 8 directions
-            for ox, oy in [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(1,1),(-1,1),(1,-1)]:
-                surf.blit(outline_surf, (ox+1, oy+1))
-            surf.blit(base, (1,1))
-            return surf
+            return get_text_cache().render_outlined(font, text, fg, outline)
         except Exception:
             try:
                 return font.render(text, True, fg)
@@ -440,6 +444,17 @@ class PantallaRegistro:
             lines.append(cur)
         return lines
 
+    def _show_alert(self, text, ms=1500):
+        self.alert = text
+        get_scheduler().after(ms, self._clear_alert)
+
+    def _clear_alert(self):
+        self.alert = ''
+
+    def is_animating(self):
+        # intro doors/logo and the pulsing glow of the selected avatar
+        return bool(getattr(self, 'intro_active', False)) or self.grid.selected is not None
+
     def update(self):
         # manage intro animation
         if getattr(self, 'intro_active', False):
@@ -449,11 +464,11 @@ class PantallaRegistro:
             if self.left_pos is None and self.left_door_img is not None and self.right_door_img is not None:
                 half_w = w // 2
                 try:
-                    self.left_door_img = pygame.transform.smoothscale(self.left_door_img, (half_w, h))
+                    self.left_door_img = get_assets().get(self.left_door_path, (half_w, h), mode='alpha', smooth=True)
                 except Exception:
                     pass
                 try:
-                    self.right_door_img = pygame.transform.smoothscale(self.right_door_img, (half_w, h))
+                    self.right_door_img = get_assets().get(self.right_door_path, (half_w, h), mode='alpha', smooth=True)
                 except Exception:
                     pass
                 self.left_pos = [0, 0]
@@ -516,12 +531,19 @@ class PantallaRegistro:
 
     def draw(self):
         w, h = self.screen.get_size()
-        try:
-            bg = pygame.transform.scale(pygame.image.load(os.path.join('assets', 'bg_start.jpg')), (w, h))
+        bg = get_assets().background(BG_START, (w, h))
+        if bg is not None:
             self.screen.blit(bg, (0, 0))
-        except Exception:
+        else:
             self.screen.fill(self.bg_color)
 
+        # intro and menu overlays repaint the whole window; so does entering/leaving them
+        mode = (bool(getattr(self, 'intro_active', False)), bool(self.menu_open))
+        if mode != self._drawn_mode or any(mode):
+            get_dirty().mark_full()
+            self._drawn_mode = mode
+            self._drawn_state = None
+
         # if intro is active, draw doors/escape overlay and don't show registration UI yet
         if getattr(self, 'intro_active', False):
             try:
@@ -558,7 +580,7 @@ class PantallaRegistro:
                         scale = desired_w / float(max(1, iw))
                         new_w = max(1, int(iw * scale))
                         new_h = max(1, int(ih * scale))
-                        esc = pygame.transform.smoothscale(self.escape_img, (new_w, new_h)).copy()
+                        esc = get_assets().get(self.escape_path, (new_w, new_h), mode='alpha', smooth=True).copy()
                         try:
                             esc.set_alpha(self.escape_alpha)
                         except Exception:
@@ -586,11 +608,15 @@ class PantallaRegistro:
         self.screen.blit(title_surf, ((w - title_surf.get_width()) // 2, 48))
 
         # draw alert if present
+        alert_shown = ''
+        alert_rect = None
         try:
-            if getattr(self, 'alert', '') and pygame.time.get_ticks() < getattr(self, 'alert_until', 0):
-                af = pygame.font.SysFont('Verdana', 18, bold=True)
-                a_s = af.render(self.alert, True, (240,200,80))
+            if getattr(self, 'alert', ''):
+                af = get_fonts().get(18, bold=True)
+                a_s = get_text_cache().render(af, self.alert, (240,200,80))
                 self.screen.blit(a_s, ((w - a_s.get_width())//2, title_surf.get_height() + 60))
+                alert_shown = self.alert
+                alert_rect = a_s.get_rect(topleft=((w - a_s.get_width())//2, title_surf.get_height() + 60))
         except Exception:
             pass
 
@@ -605,7 +631,7 @@ class PantallaRegistro:
         is_placeholder = (not self.input_text)
         txt_color = (180,180,180) if is_placeholder else (255,255,255)
         # measure
-        txt_surf_measure = self.text_font.render(txt_display, True, txt_color)
+        txt_surf_measure = get_text_cache().render(self.text_font, txt_display, txt_color)
         box_width = max(420, txt_surf_measure.get_width() + padding_x * 2)
         box_height = txt_surf_measure.get_height() + padding_y * 2
         box_x = center_x - box_width // 2
@@ -620,7 +646,7 @@ class PantallaRegistro:
         # render text with outline
         if is_placeholder:
             # placeholder smaller contrast, render plain gray
-            txt_surf = self.text_font.render(txt_display, True, (120,120,120))
+            txt_surf = get_text_cache().render(self.text_font, txt_display, (120,120,120))
             self.screen.blit(txt_surf, (box_x + padding_x, box_y + padding_y))
         else:
             # filled text: black on light panel, with subtle outline
@@ -641,7 +667,7 @@ class PantallaRegistro:
         # label below grid: outlined white text
         try:
             grid_rect = self.grid.rect
-            choose_font = pygame.font.SysFont('Verdana', 22, bold=True)
+            choose_font = get_fonts().get(22, bold=True)
             label_surf = self._render_outlined('Elija su avatar', choose_font, fg=(255,255,255), outline=(0,0,0))
             lx = grid_rect.x + (grid_rect.w - label_surf.get_width()) // 2
             ly = grid_rect.y + grid_rect.h + 8
@@ -666,15 +692,30 @@ class PantallaRegistro:
         self.screen.blit(txt_s, (self.accept_rect.x + (self.accept_rect.w - txt_s.get_width()) // 2,
                                    self.accept_rect.y + (self.accept_rect.h - txt_s.get_height()) // 2))
 
+        # report the form area when something in it changed (plus the previous area, so a
+        # shrinking input box or a dismissed alert is also cleared), and the selection glow
+        form_rect = caja_rect.union(self.grid.rect.inflate(0, 60)).union(self.accept_rect)
+        if alert_rect is not None:
+            form_rect = form_rect.union(alert_rect)
+        state = (self.input_text, alert_shown, self.grid.hover_index, self.grid.selected)
+        if state != self._drawn_state:
+            get_dirty().add(form_rect)
+            if self._form_rect is not None:
+                get_dirty().add(self._form_rect)
+            self._drawn_state = state
+            self._form_rect = form_rect
+        if self.grid.glow_rect is not None:
+            get_dirty().add(self.grid.glow_rect)
+
         # gear icon (light background + red border like escape_room)
         self.gear_rect.topright = (w - 18, 18)
         pygame.draw.rect(self.screen, (245,245,245), self.gear_rect, border_radius=8)
         pygame.draw.rect(self.screen, (0,0,0), self.gear_rect, 2, border_radius=8)
         try:
-            gear_font = pygame.font.SysFont('Segoe UI Symbol', 20)
-            gear_s = gear_font.render('⚙', True, (0,0,0))
+            gear_font = get_fonts().get(20, family=SYMBOL_FONT_FAMILY)
+            gear_s = get_text_cache().render(gear_font, '⚙', (0,0,0))
         except Exception:
-            gear_s = self.text_font.render('CFG', True, (0,0,0))
+            gear_s = get_text_cache().render(self.text_font, 'CFG', (0,0,0))
         self.screen.blit(gear_s, (self.gear_rect.x + (self.gear_rect.width - gear_s.get_width()) // 2,
                                   self.gear_rect.y + (self.gear_rect.height - gear_s.get_height()) // 2))
 
@@ -705,7 +746,7 @@ class PantallaRegistro:
                     r = pygame.Rect(menu_x + 20, menu_y + 120 + i * (btn_h + 12), btn_w, btn_h)
                     pygame.draw.rect(self.screen, (245, 245, 245), r, border_radius=8)
                     pygame.draw.rect(self.screen, (120, 120, 120), r, 2, border_radius=8)
-                    txt = self.text_font.render(lab, True, (20, 20, 20))
+                    txt = get_text_cache().render(self.text_font, lab, (20, 20, 20))
                     self.screen.blit(txt, (r.x + 12, r.y + (r.h - txt.get_height()) // 2))
             elif self.menu_view == 'pantalla':
                 # Use centralized Slider draw helper for brightness only
@@ -720,7 +761,7 @@ class PantallaRegistro:
                 back_rect = pygame.Rect(menu_x + 20, menu_y + menu_h - 64, btn_w, btn_h)
                 pygame.draw.rect(self.screen, (240,240,240), back_rect, border_radius=8)
                 pygame.draw.rect(self.screen, (160,160,160), back_rect, 2, border_radius=8)
-                back_txt = self.text_font.render('Volver a opciones', True, (20,20,20))
+                back_txt = get_text_cache().render(self.text_font, 'Volver a opciones', (20,20,20))
                 self.screen.blit(back_txt, (back_rect.x + 12, back_rect.y + 8))
             else:  # nosotros
                 # use a smaller font for the 'Nosotros' body so it fits and is readable
@@ -731,7 +772,7 @@ class PantallaRegistro:
                     'Gracias por jugar y por apoyar proyectos independientes.'
                 ]
                 full = ' '.join(lines)
-                small_font = pygame.font.SysFont('Verdana', 16)
+                small_font = get_fonts().get(16)
                 wrapped = self._wrap_text(full, small_font, btn_w - 24)
                 y0 = menu_y + 86
                 lh = small_font.get_height() + 6
@@ -739,10 +780,10 @@ class PantallaRegistro:
                 for i, ln in enumerate(wrapped):
                     if i * lh > max_h:
                         break
-                    t = small_font.render(ln, True, (20,20,20))
+                    t = get_text_cache().render(small_font, ln, (20,20,20))
                     self.screen.blit(t, (menu_x + 24, y0 + i * lh))
                 back_rect = pygame.Rect(menu_x + 20, menu_y + menu_h - 64, btn_w, btn_h)
                 pygame.draw.rect(self.screen, (240,240,240), back_rect, border_radius=8)
                 pygame.draw.rect(self.screen, (160,160,160), back_rect, 2, border_radius=8)
-                back_txt = self.text_font.render('Volver a opciones', True, (20,20,20))
+                back_txt = get_text_cache().render(self.text_font, 'Volver a opciones', (20,20,20))
                 self.screen.blit(back_txt, (back_rect.x + 12, back_rect.y + 8))
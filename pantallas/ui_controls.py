@@ -1,4 +1,9 @@
+import math
+from collections import OrderedDict
+
 import pygame
+from core.constants import RECORDS_PAGE_SIZE
+from core.text_cache import get_text_cache
 
 
 class Slider:
@@ -22,7 +27,7 @@ class Slider:
 
     def draw(self, screen, menu_x, menu_y, track_x, track_w, label_y, idx, font):
         # draw label
-        label_s = font.render(self.label + ':', True, (20, 20, 20))
+        label_s = get_text_cache().render(font, self.label + ':', (20, 20, 20))
         screen.blit(label_s, (menu_x + 40, label_y + idx * (font.get_height() + 40)))
         label_h = font.get_height()
         track, minus, plus = self._compute_geometry(menu_x, menu_y, track_x, track_w, label_y, idx, label_h)
@@ -57,8 +62,8 @@ class Slider:
         pygame.draw.rect(screen, (245, 245, 245), plus, border_radius=6)
         pygame.draw.rect(screen, (160, 160, 160), minus, 2, border_radius=6)
         pygame.draw.rect(screen, (160, 160, 160), plus, 2, border_radius=6)
-        minus_s = font.render('-', True, (20, 20, 20))
-        plus_s = font.render('+', True, (20, 20, 20))
+        minus_s = get_text_cache().render(font, '-', (20, 20, 20))
+        plus_s = get_text_cache().render(font, '+', (20, 20, 20))
         screen.blit(minus_s, (minus.x + (minus.w - minus_s.get_width())//2, minus.y + (minus.h - minus_s.get_height())//2))
         screen.blit(plus_s, (plus.x + (plus.w - plus_s.get_width())//2, plus.y + (plus.h - plus_s.get_height())//2))
         # value text
@@ -66,7 +71,7 @@ class Slider:
             val_txt = self.fmt(self.get())
         except Exception:
             val_txt = str(self.get())
-        val_s = font.render(val_txt, True, (20,20,20))
+        val_s = get_text_cache().render(font, val_txt, (20,20,20))
         screen.blit(val_s, (track.x + track.w + 56, track.y + (track.h - val_s.get_height())//2))
 
     def handle_event(self, event, menu_x, menu_y, track_x, track_w, label_y, idx, font):
@@ -106,3 +111,101 @@ class Slider:
                 self.dragging = False
                 return True
         return False
+
+
+class VirtualList:
+    """Lista con scroll que solo pide y dibuja las filas visibles.
+
+    `count()` da el total de filas, `fetch(limit, offset)` devuelve una página
+    de elementos (misma firma que `RecordsRepository.top`) y `render_row(index, item, size)` compone la superficie de una
+    fila. Las páginas y las superficies de fila se guardan en LRUs pequeñas,
+    así que el coste por frame depende de las filas que caben en pantalla y no
+    del total.
+    """
+
+    def __init__(self, count, fetch, render_row, row_h, page_size=RECORDS_PAGE_SIZE, max_pages=8):
+        self.count = count
+        self.fetch = fetch
+        self.render_row = render_row
+        self.row_h = int(row_h)
+        self.page_size = int(page_size)
+        self.max_pages = int(max_pages)
+        self._pages = OrderedDict()  # page index -> items
+        self._rows = OrderedDict()   # (index, size) -> row surface
+        self._total = None
+        self.fetches = 0
+        self.row_renders = 0
+
+    @property
+    def total(self):
+        if self._total is None:
+            try:
+                self._total = int(self.count())
+            except Exception:
+                self._total = 0
+        return self._total
+
+    def content_height(self):
+        return self.total * self.row_h
+
+    def invalidate(self):
+        """Los datos cambiaron: descarta páginas, filas compuestas y el total."""
+        self._pages.clear()
+        self._rows.clear()
+        self._total = None
+
+    def visible_range(self, scroll, view_h):
+        """Índices [first, last) de las filas que caen en la vista con ese scroll."""
+        first = max(0, int(-scroll) // self.row_h)
+        last = min(self.total, int(math.ceil((-scroll + view_h) / float(self.row_h))))
+        return first, max(first, last)
+
+    def item(self, index):
+        page_idx = index // self.page_size
+        page = self._pages.get(page_idx)
+        if page is None:
+            try:
+                page = list(self.fetch(self.page_size, page_idx * self.page_size))
+            except Exception:
+                page = []
+            self.fetches += 1
+            self._pages[page_idx] = page
+            if len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_idx)
+        offset = index - page_idx * self.page_size
+        return page[offset] if offset < len(page) else None
+
+    def _row_surface(self, index, size):
+        key = (index, size)
+        surf = self._rows.get(key)
+        if surf is None:
+            item = self.item(index)
+            if item is None:
+                return None
+            surf = self.render_row(index, item, size)
+            self.row_renders += 1
+            self._rows[key] = surf
+        else:
+            self._rows.move_to_end(key)
+        return surf
+
+    def draw(self, screen, rect, scroll, row_size):
+        """Dibuja las filas visibles dentro de `rect` (recortadas a `rect`)."""
+        rect = pygame.Rect(rect)
+        first, last = self.visible_range(scroll, rect.h)
+        # keep roughly two screens of composed rows
+        limit = max(8, (last - first) * 2)
+        prev_clip = screen.get_clip()
+        screen.set_clip(rect.clip(prev_clip))
+        try:
+            for i in range(first, last):
+                surf = self._row_surface(i, tuple(row_size))
+                if surf is not None:
+                    screen.blit(surf, (rect.x, rect.y + scroll + i * self.row_h))
+        finally:
+            screen.set_clip(prev_clip)
+        while len(self._rows) > limit:
+            self._rows.popitem(last=False)
+        return first, last